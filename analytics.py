@@ -0,0 +1,304 @@
+"""Journal d'événements en colonnes et agrégation en flux.
+
+EventSink est un observateur : branché sur le bus d'une partie, il range
+chaque événement utile dans cinq colonnes de taille fixe
+
+    run (uint32)    numéro de la session d'exploration
+    stage (uint16)  stage en cours
+    kind (uint8)    type d'événement (KINDS)
+    label (uint16)  arme d'une attaque, difficulté du chemin d'un combat
+    value (int32)   dégâts d'une attaque, PV du héros en fin de combat
+
+et les écrit par blocs de CHUNK_ROWS lignes dans un répertoire : chaque
+bloc est un fichier jamais modifié ensuite (en-tête puis les colonnes l'une
+après l'autre), les libellés sont dans labels.json.
+
+Aggregator relit les blocs un par un en mémoire mappée (numpy.memmap) et
+cumule des compteurs de taille fixe : la mémoire ne dépend pas du nombre
+d'événements.
+
+    python -m analytics record --dir events --runs 10000
+    python -m analytics report --dir events
+"""
+import argparse
+import glob
+import json
+import os
+import struct
+import sys
+from array import array
+
+import numpy as np
+
+from base import Hero
+from observer import Observer
+
+MAGIC = b"RPGE"
+VERSION = 1
+CHUNK_ROWS = 1 << 20
+# (colonne, code de array.array, type numpy) dans l'ordre du fichier
+COLUMNS = (("run", "I", "<u4"), ("stage", "H", "<u2"), ("kind", "B", "u1"), ("label", "H", "<u2"), ("value", "i", "<i4"))
+_HEADER = struct.Struct("<4sBI")
+
+HERO_ATTACK, ENEMY_ATTACK, HERO_DEATH, BATTLE_END, VICTORY = range(5)
+KINDS = ("hero_attack", "enemy_attack", "hero_death", "battle_end", "victory")
+MAX_DAMAGE = 1024  # Dégâts au-delà comptés dans la dernière case de la distribution
+MAX_STAGE = 1024
+
+
+def write_chunk(directory, index, columns):
+    """Écrit un bloc : `columns` donne, dans l'ordre de COLUMNS, des array.array ou tableaux numpy"""
+    rows = len(columns[0])
+    path = os.path.join(directory, f"chunk-{index:06d}.bin")
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, rows))
+        for (name, code, dtype), column in zip(COLUMNS, columns):
+            data = np.asarray(column, dtype=dtype)  # Ordre des octets fixé (little-endian)
+            f.write(data.tobytes())
+    os.replace(temporary, path)  # Un bloc n'apparaît qu'une fois complet
+    return path
+
+
+def read_chunk(path):
+    """Colonnes d'un bloc en mémoire mappée : {nom: numpy.memmap}"""
+    with open(path, "rb") as f:
+        magic, version, rows = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an event chunk (or unsupported version)")
+    columns = {}
+    offset = _HEADER.size
+    for name, code, dtype in COLUMNS:
+        columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,)) if rows else \
+            np.empty(0, dtype=dtype)
+        offset += rows * np.dtype(dtype).itemsize
+    return columns
+
+
+class EventSink(Observer):
+    """Observateur qui écrit les événements de jeu en blocs de colonnes dans `directory`"""
+    events = ("exploration_start", "stage_start", "path_taken", "boss_appears", "attack", "death", "battle_end",
+              "exploration_victory")
+
+    def __init__(self, directory, chunk_rows=CHUNK_ROWS):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.labels = self._load_labels()
+        self._label_ids = {label: index for index, label in enumerate(self.labels)}
+        self.chunks = len(glob.glob(os.path.join(directory, "chunk-*.bin")))
+        self.run = self._last_run() if self.chunks else 0  # Incrémenté à chaque exploration_start
+        self.stage = 0
+        self.difficulty = self.label("none")
+        self._columns = tuple(array(code) for name, code, dtype in COLUMNS)
+        self._handlers = {
+            "exploration_start": self._exploration_start,
+            "stage_start": self._stage_start,
+            "path_taken": self._path_taken,
+            "boss_appears": self._boss_appears,
+            "attack": self._attack,
+            "death": self._death,
+            "battle_end": self._battle_end,
+            "exploration_victory": self._victory,
+        }
+
+    def _load_labels(self):
+        path = os.path.join(self.directory, "labels.json")
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _last_run(self):
+        last = sorted(glob.glob(os.path.join(self.directory, "chunk-*.bin")))[-1]
+        runs = read_chunk(last)["run"]
+        return int(runs[-1]) if len(runs) else -1
+
+    def label(self, text):
+        """Identifiant (stable dans le répertoire) d'un libellé"""
+        index = self._label_ids.get(text)
+        if index is None:
+            index = self._label_ids[text] = len(self.labels)
+            self.labels.append(text)
+        return index
+
+    def handler(self, event_type):
+        return self._handlers[event_type]
+
+    def notify(self, subject, event_type, data):
+        handler = self._handlers.get(event_type)
+        if handler:
+            handler(subject, event_type, data)
+
+    def _row(self, kind, label, value):
+        run, stage, kinds, labels, values = self._columns
+        run.append(self.run)
+        stage.append(self.stage)
+        kinds.append(kind)
+        labels.append(label)
+        values.append(value)
+        if len(kinds) >= self.chunk_rows:
+            self.flush()
+
+    def _exploration_start(self, subject, event_type, data):
+        self.run += 1
+        self.stage = 0
+        self.difficulty = self.label("none")
+
+    def _stage_start(self, subject, event_type, data):
+        self.stage = data.current_stage
+
+    def _path_taken(self, subject, event_type, data):
+        self.difficulty = self.label(data.difficulty)
+
+    def _boss_appears(self, subject, event_type, data):
+        self.stage += 1
+        self.difficulty = self.label("boss")
+
+    def _attack(self, subject, event_type, data):
+        weapon = data["weapon"]
+        self._row(HERO_ATTACK if isinstance(subject, Hero) else ENEMY_ATTACK,
+                  self.label(weapon.name if weapon else "none"), data["damage"])
+
+    def _death(self, subject, event_type, data):
+        # run_exploration signale aussi la défaite avec data=hero : déjà enregistrée par take_damage
+        if data is None and isinstance(subject, Hero):
+            self._row(HERO_DEATH, self.difficulty, 0)
+
+    def _battle_end(self, subject, event_type, data):
+        self._row(BATTLE_END, self.difficulty, subject._pv)
+
+    def _victory(self, subject, event_type, data):
+        self._row(VICTORY, self.difficulty, subject._pv)
+
+    def flush(self):
+        """Écrit les événements en attente dans un nouveau bloc"""
+        if not len(self._columns[0]):
+            return
+        write_chunk(self.directory, self.chunks, self._columns)
+        self.chunks += 1
+        self._columns = tuple(array(code) for name, code, dtype in COLUMNS)
+        path = os.path.join(self.directory, "labels.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.labels, f)
+        os.replace(path + ".tmp", path)
+
+    close = flush
+
+
+class Aggregator:
+    """Résumés groupés d'un répertoire de blocs, lus un bloc à la fois"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "labels.json"), "r", encoding="utf-8") as f:
+            self.labels = json.load(f)
+        size = len(self.labels)
+        self.events = 0
+        self.battles = np.zeros(size, dtype=np.int64)  # Combats par difficulté
+        self.wins = np.zeros(size, dtype=np.int64)
+        self.damage = np.zeros((size, MAX_DAMAGE), dtype=np.int64)  # Distribution des dégâts du héros par arme
+        self.deaths = np.zeros(MAX_STAGE, dtype=np.int64)  # Morts du héros par stage
+        self.victories = 0
+
+    def run(self):
+        for path in sorted(glob.glob(os.path.join(self.directory, "chunk-*.bin"))):
+            self.add(read_chunk(path))
+        return self
+
+    def add(self, columns):
+        kind, label, value = columns["kind"], columns["label"], columns["value"]
+        size = len(self.labels)
+        self.events += len(kind)
+
+        ended = kind == BATTLE_END
+        self.battles += np.bincount(label[ended], minlength=size)
+        self.wins += np.bincount(label[ended & (value > 0)], minlength=size)
+
+        attacks = kind == HERO_ATTACK
+        damage = np.clip(value[attacks], 0, MAX_DAMAGE - 1).astype(np.int64)
+        cells = label[attacks].astype(np.int64) * MAX_DAMAGE + damage
+        self.damage += np.bincount(cells, minlength=size * MAX_DAMAGE).reshape(size, MAX_DAMAGE)
+
+        stages = np.clip(columns["stage"][kind == HERO_DEATH], 0, MAX_STAGE - 1)
+        self.deaths += np.bincount(stages, minlength=MAX_STAGE)
+        self.victories += int(np.count_nonzero(kind == VICTORY))
+
+    def win_rate_by_difficulty(self):
+        return {self.labels[i]: {"battles": int(self.battles[i]), "win_rate": round(self.wins[i] / self.battles[i], 4)}
+                for i in np.nonzero(self.battles)[0]}
+
+    def damage_by_weapon(self):
+        summary = {}
+        values = np.arange(MAX_DAMAGE)
+        for i in np.nonzero(self.damage.sum(axis=1))[0]:
+            counts = self.damage[i]
+            total = counts.sum()
+            cumulative = np.cumsum(counts)
+            summary[self.labels[i]] = {
+                "attacks": int(total),
+                "mean": round(float((counts * values).sum() / total), 2),
+                "min": int(values[counts > 0][0]),
+                "p50": int(np.searchsorted(cumulative, total * 0.5)),
+                "p95": int(np.searchsorted(cumulative, total * 0.95)),
+                "max": int(values[counts > 0][-1]),
+            }
+        return summary
+
+    def stage_of_death(self):
+        return {int(stage): int(self.deaths[stage]) for stage in np.nonzero(self.deaths)[0]}
+
+    def summary(self):
+        return {
+            "events": self.events,
+            "victories": self.victories,
+            "win_rate_by_difficulty": self.win_rate_by_difficulty(),
+            "damage_by_weapon": self.damage_by_weapon(),
+            "stage_of_death": self.stage_of_death(),
+        }
+
+
+def record(directory, runs, num_stages=10, seed=0, policy=None):
+    """Joue `runs` explorations sans affichage en enregistrant leurs événements dans `directory`"""
+    from events import EventBus
+    from factories import HeroFactory
+    from game import run_exploration
+    from policies import GreedyPolicy
+    from rng import streams
+
+    sink = EventSink(directory)
+    bus = EventBus()
+    bus.attach(sink)
+    policy = policy or GreedyPolicy()
+    streams.seed(seed)
+    try:
+        for _ in range(runs):
+            hero = HeroFactory(bus).create_character("Hero", policy)
+            run_exploration(hero, num_stages)
+    finally:
+        sink.close()
+    return sink
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Journal d'événements en colonnes et résumés")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="jouer des explorations en enregistrant leurs événements")
+    record_parser.add_argument("--dir", default="events")
+    record_parser.add_argument("--runs", type=int, default=1000)
+    record_parser.add_argument("--stages", type=int, default=10)
+    record_parser.add_argument("--seed", type=int, default=0)
+    report_parser = commands.add_parser("report", help="résumés groupés des événements enregistrés")
+    report_parser.add_argument("--dir", default="events")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        sink = record(args.dir, args.runs, args.stages, args.seed)
+        print(f"{sink.chunks} chunks in {args.dir}")
+    else:
+        print(json.dumps(Aggregator(args.dir).run().summary(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Grandes batailles : des équipes de centaines de personnages face à face.
+
+Chaque ArmyTeam tient un TargetIndex de ses membres vivants :
+
+- deux tas (heapq), l'un sur les PV (cible la plus faible), l'autre sur la
+  menace (dégâts + meilleure arme, cible la plus dangereuse). take_damage et
+  heal prennent en compte le changement de PV (Team.index) : une entrée
+  périmée est marquée et écartée quand elle arrive en tête, les tas sont
+  reconstruits quand les entrées périmées sont plus nombreuses que les
+  bonnes. Choisir une cible coûte O(log n) amorti ;
+- la liste des vivants de Team, retirés en O(1) par échange avec le dernier, pour
+  les tirages uniformes.
+
+Les membres sont rangés en formation (ordre d'ajout) : une attaque de zone
+touche la cible et ses voisins vivants à `radius` places près, en O(radius).
+
+    python -m army --heroes 200 --enemies 300 --strategy lowest_hp highest_threat
+"""
+import argparse
+import sys
+import time
+from heapq import heappush, heappop, heapify
+
+from base import Team
+from factories import HeroFactory, EnemyFactory
+from policies import GreedyPolicy
+from rng import streams
+from scheduler import InitiativeScheduler
+
+STRATEGIES = ("random", "lowest_hp", "highest_threat")
+HEAL_THRESHOLD = 0.3  # En dessous de cette part de ses PV, un membre se soigne une fois sur deux
+AREA_DAMAGE = 0.5  # Part des dégâts normaux infligée à chaque cible d'une attaque de zone
+
+
+def threat(character):
+    weapon = character.inventory.best_weapon
+    return character.damage + (weapon.damage if weapon else 0)
+
+
+class TargetIndex:
+    """Membres vivants d'une équipe, par PV croissants et par menace décroissante"""
+    __slots__ = ("_by_pv", "_by_threat", "_entries", "_count")
+
+    def __init__(self, members=()):
+        self._by_pv = []  # Tas de [PV, ordre, personnage]
+        self._by_threat = []  # Tas de [-menace, ordre, personnage]
+        self._entries = {}  # Personnage -> (entrée PV, entrée menace) ; personnage None : entrée périmée
+        self._count = 0
+        for member in members:
+            self.update(member)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def discard(self, character):
+        entries = self._entries.pop(character, None)
+        if entries is not None:
+            entries[0][2] = entries[1][2] = None
+
+    def update(self, character):
+        """Prend en compte les PV (et la menace) actuels de `character`, le retire s'il est mort"""
+        if character._pv <= 0:
+            self.discard(character)
+            return
+        entries = self._entries.get(character)
+        if entries is not None:
+            pv_entry, threat_entry = entries
+            if pv_entry[0] == character._pv and -threat_entry[0] == threat(character):
+                return
+            pv_entry[2] = None
+        else:
+            threat_entry = None
+        self._count += 1
+        pv_entry = [character._pv, self._count, character]
+        heappush(self._by_pv, pv_entry)
+        value = threat(character)
+        if threat_entry is None or -threat_entry[0] != value:
+            if threat_entry is not None:
+                threat_entry[2] = None
+            threat_entry = [-value, self._count, character]
+            heappush(self._by_threat, threat_entry)
+        self._entries[character] = (pv_entry, threat_entry)
+        if len(self._by_pv) > 2 * len(self._entries) + 32:
+            self._compact()
+
+    def _compact(self):
+        self._by_pv = [entry for entry in self._by_pv if entry[2] is not None]
+        self._by_threat = [entry for entry in self._by_threat if entry[2] is not None]
+        heapify(self._by_pv)
+        heapify(self._by_threat)
+
+    def _top(self, heap, key):
+        """Personnage en tête du tas ; une entrée dont la clé a changé sans update est recalculée"""
+        while heap:
+            entry = heap[0]
+            character = entry[2]
+            if character is None:
+                heappop(heap)
+            elif entry[0] != key(character):
+                self.update(character)  # Modifiés sans take_damage ni heal (montée de niveau) : entrée remplacée
+            else:
+                return character
+        return None
+
+    def lowest_hp(self):
+        return self._top(self._by_pv, _pv)
+
+    def highest_threat(self):
+        return self._top(self._by_threat, _negative_threat)
+
+
+def _pv(character):
+    return character._pv
+
+
+def _negative_threat(character):
+    return -threat(character)
+
+
+class ArmyTeam(Team):
+    """Équipe indexée pour les grandes batailles (voir TargetIndex)"""
+
+    def __init__(self, name, members=()):
+        super().__init__(name)
+        self.index = TargetIndex()  # Tenu à jour par take_damage et heal
+        self._formation = {}  # Personnage -> place dans members
+        for member in members:
+            self.add_member(member)
+
+    def add_member(self, character):
+        self._formation[character] = len(self.members)
+        super().add_member(character)
+        self.index.update(character)
+
+    def remove_member(self, character):
+        if character in self._formation:
+            super().remove_member(character)
+            self.index.discard(character)
+            self._formation = {member: place for place, member in enumerate(self.members)}
+
+    def refresh(self):
+        super().refresh()
+        for member in self.members:
+            self.index.update(member)
+
+    def pick(self, strategy, rng=None):
+        """Cible vivante selon `strategy` (voir STRATEGIES), None si l'équipe est vaincue"""
+        if not self._alive:
+            return None
+        if strategy == "lowest_hp":
+            return self.index.lowest_hp()
+        if strategy == "highest_threat":
+            return self.index.highest_threat()
+        return self._alive[(rng or streams.ai).randrange(len(self._alive))]
+
+    def area(self, center, radius):
+        """Membres vivants à au plus `radius` places de `center` dans la formation, `center` compris"""
+        place = self._formation[center]
+        return [member for member in self.members[max(place - radius, 0):place + radius + 1] if member._pv > 0]
+
+
+def army_turn(character, enemies, strategy, area_chance=0.0, area_radius=1):
+    """Tour d'un membre : soin s'il est affaibli, sinon attaque (de zone avec la probabilité `area_chance`)"""
+    if character._pv < character.max_pv * HEAL_THRESHOLD and streams.ai.random() < 0.5:
+        character.heal(character.HEAL)
+        return
+    target = enemies.pick(strategy)
+    weapon = character.inventory.best_weapon
+    level = character.get_xp_level()
+    if area_chance and streams.combat.random() < area_chance:
+        targets = enemies.area(target, area_radius)
+        base = character.damage + (weapon.damage if weapon else 0)
+        if character.wants("area_attack"):
+            character.notify_observers("area_attack", {"targets": targets, "weapon": weapon})
+        for victim in targets:
+            victim.take_damage(int(character.randomize(base) * AREA_DAMAGE))
+            if victim._pv <= 0:
+                character.drop_xp_deafeated(victim.exp)
+    else:
+        character.attack(target, weapon)
+    if character.get_xp_level() != level and character.team is not None:
+        character.team.index.update(character)  # Montée de niveau : menace et PV changés
+
+
+def resolve_army_battle(side_a, side_b, strategies=("lowest_hp", "random"), max_turns=None, area_chance=0.0,
+                        area_radius=1, weighted=False):
+    """Bataille entre deux ArmyTeam, retourne le nombre de tours joués
+
+    strategies : choix de cible de side_a puis de side_b (voir STRATEGIES).
+    """
+    scheduler = InitiativeScheduler(side_a.members + side_b.members, weighted)
+    opponents = {id(side_a): (side_b, strategies[0]), id(side_b): (side_a, strategies[1])}
+    turn = 0
+    side_a.start_turn(turn)
+    side_b.start_turn(turn)
+    try:
+        while not side_a.is_defeated() and not side_b.is_defeated():
+            if max_turns is not None and turn >= max_turns:
+                break
+            turn += 1
+            side_a.start_turn(turn)  # Seuls les effets qui échoient à ce tour coûtent
+            side_b.start_turn(turn)
+            for character in scheduler.round(turn):
+                if character._pv <= 0:
+                    continue
+                enemies, strategy = opponents[id(character.team)]
+                if enemies.is_defeated():
+                    break  # La bataille est terminée au milieu du tour
+                if character.stunned:
+                    continue
+                army_turn(character, enemies, strategy, area_chance, area_radius)
+    finally:
+        side_a.end_battle()
+        side_b.end_battle()
+    return turn
+
+
+def create_armies(heroes, enemies, bus=None, policy=None):
+    """(héros, ennemis) : `heroes` héros GreedyPolicy face à `enemies` ennemis de EnemyFactory"""
+    policy = policy or GreedyPolicy()
+    hero_factory = HeroFactory(bus)
+    hero_side = ArmyTeam("Heroes", (hero_factory.create_character(f"Hero {i + 1}", policy) for i in range(heroes)))
+    enemy_side = ArmyTeam("Enemies", EnemyFactory(bus, pool=None).create_enemies(hero_side.members[0], enemies))
+    return hero_side, enemy_side
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grande bataille entre deux armées")
+    parser.add_argument("--heroes", type=int, default=200)
+    parser.add_argument("--enemies", type=int, default=300)
+    parser.add_argument("--strategy", nargs=2, choices=STRATEGIES, default=("lowest_hp", "random"),
+                        metavar=("HEROS", "ENNEMIS"), help=f"choix de cible de chaque camp : {', '.join(STRATEGIES)}")
+    parser.add_argument("--area-chance", type=float, default=0.1)
+    parser.add_argument("--area-radius", type=int, default=1)
+    parser.add_argument("--weighted", action="store_true", help="initiative pondérée par la vitesse")
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    streams.seed(args.seed)
+    heroes, enemies = create_armies(args.heroes, args.enemies)
+    start = time.perf_counter()
+    turns = resolve_army_battle(heroes, enemies, args.strategy, args.max_turns, args.area_chance, args.area_radius,
+                                args.weighted)
+    elapsed = time.perf_counter() - start
+    winner = "heroes" if enemies.is_defeated() else "enemies" if heroes.is_defeated() else "nobody"
+    print(f"{winner} win after {turns} turns ({elapsed:.2f}s) | "
+          f"{heroes.alive_count}/{args.heroes} heroes, {enemies.alive_count}/{args.enemies} enemies left")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
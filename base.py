@@ -1,16 +1,33 @@
 from abc import ABC, abstractmethod
-import random
-from questionary import select
+from effects import EffectWheel
+from events import EventBus
+from rng import streams
+from progression import DEFAULT_CURVE
 
 class Weapon:
+    __slots__ = ("name", "damage")
+
+    _shared = {}  # (nom, dégâts) -> arme partagée, voir shared()
+
     def __init__(self, name, damage):
         self.name = name
         self.damage = damage
+
+    @classmethod
+    def shared(cls, name, damage):
+        """Arme partagée par tous les inventaires (une arme n'est jamais modifiée après sa création)"""
+        key = (name, damage)
+        weapon = cls._shared.get(key)
+        if weapon is None:
+            weapon = cls._shared[key] = cls(name, damage)
+        return weapon
     
     def __str__(self):
         return f"{self.name} (DMG: {self.damage})"
 
 class Consumable(ABC):
+    __slots__ = ("name", "value")
+
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -23,25 +40,191 @@ class Consumable(ABC):
         pass
 
 class HealPotion(Consumable):
+    __slots__ = ()
+
     def use(self, character):
         character.heal(self.value)
 
+class Inventory:
+    """Objets d'un personnage rangés par catégorie.
+
+    Les armes et les consommables ont chacun leur vue (listes tenues à jour,
+    à ne pas modifier), la meilleure arme est suivie à chaque ajout. Les
+    consommables identiques (même classe, nom et valeur) sont empilés :
+    ramasser cent potions ne crée qu'une pile.
+    """
+    # Conteneurs créés au premier objet : la plupart des ennemis n'ont rien
+    __slots__ = ("_weapons", "_armed", "_stacks", "_consumables", "best_weapon")
+
+    UNARMED = (None,)
+
+    def __init__(self, items=()):
+        self._weapons = None
+        self._armed = self.UNARMED  # weapons + [None], recalculé après un changement d'armes
+        self._stacks = None  # (classe, nom, valeur) -> [objet, quantité]
+        self._consumables = None  # Un objet par pile
+        self.best_weapon = None
+        for item in items:
+            self.append(item)
+
+    @staticmethod
+    def _stack_key(item):
+        return (type(item), item.name, item.value)
+
+    @property
+    def weapons(self):
+        return self._weapons if self._weapons is not None else []
+
+    @property
+    def armed(self):
+        """Armes plus None (mains nues), pour les tirages des ennemis"""
+        if self._armed is None:
+            self._armed = self._weapons + [None]
+        return self._armed
+
+    @property
+    def consumables(self):
+        return self._consumables if self._consumables is not None else []
+
+    def append(self, item):
+        if isinstance(item, Weapon):
+            if self._weapons is None:
+                self._weapons = []
+            self._weapons.append(item)
+            self._armed = None
+            if self.best_weapon is None or item.damage > self.best_weapon.damage:
+                self.best_weapon = item
+            return
+        if self._stacks is None:
+            self._stacks = {}
+            self._consumables = []
+        key = self._stack_key(item)
+        stack = self._stacks.get(key)
+        if stack is None:
+            self._stacks[key] = [item, 1]
+            self._consumables.append(item)
+        else:
+            stack[1] += 1
+
+    def remove(self, item):
+        """Retire un objet (une unité de sa pile pour un consommable)"""
+        if isinstance(item, Weapon):
+            self.weapons.remove(item)
+            self._armed = None
+            if item is self.best_weapon:
+                self.best_weapon = max(self._weapons, key=lambda weapon: weapon.damage, default=None)
+            return
+        key = self._stack_key(item)
+        if self._stacks is None or key not in self._stacks:
+            raise ValueError(f"{item} is not in the inventory")
+        stack = self._stacks[key]
+        stack[1] -= 1
+        if stack[1] == 0:
+            del self._stacks[key]
+            self._consumables.remove(stack[0])
+
+    def count(self, item):
+        """Quantité d'un consommable (nombre d'exemplaires d'une arme)"""
+        if isinstance(item, Weapon):
+            return self.weapons.count(item)
+        stack = self._stacks.get(self._stack_key(item)) if self._stacks else None
+        return stack[1] if stack else 0
+
+    def clear(self):
+        """Vide l'inventaire en gardant ses conteneurs (personnages réutilisés, voir pool.py)"""
+        if self._weapons:
+            self._weapons.clear()
+        if self._stacks:
+            self._stacks.clear()
+            self._consumables.clear()
+        self._armed = self.UNARMED
+        self.best_weapon = None
+
+    def stacks(self):
+        """Paires (objet, quantité) : les armes une par une, puis les piles de consommables"""
+        pairs = [(weapon, 1) for weapon in self.weapons]
+        if self._stacks:
+            pairs += [tuple(stack) for stack in self._stacks.values()]
+        return pairs
+
+    def __iter__(self):
+        for item, count in self.stacks():
+            for _ in range(count):
+                yield item
+
+    def __len__(self):
+        return len(self.weapons) + (sum(stack[1] for stack in self._stacks.values()) if self._stacks else 0)
+
+    def __contains__(self, item):
+        return self.count(item) > 0
+
+
+_HEALTH_BARS = {}  # (tranche de ratio, longueur) -> barre ; tranche : (cases pleines, couleur)
+
+
+def health_bar(ratio, bar_length=20):
+    """Barre de vie d'un ratio de PV, construite une fois par tranche et par longueur"""
+    filled_length = int(bar_length * ratio)
+    # Choose color based on health percentage
+    tier = 2 if ratio > 0.6 else 1 if ratio > 0.3 else 0
+    key = (filled_length, tier, bar_length)
+    bar = _HEALTH_BARS.get(key)
+    if bar is None:
+        bar_char = '░▓█'[tier]  # Full health - green, medium - yellow/orange, low - red
+        bar = _HEALTH_BARS[key] = bar_char * filled_length + '░' * (bar_length - filled_length)
+    return bar
+
+
 class Character(ABC):
+    # Pas de __dict__ par instance : les simulations créent des millions de personnages
+    __slots__ = ("_pv", "_max_pv", "name", "damage", "type", "inventory", "_exp", "_level", "_level_floor", "_level_ceiling",
+                 "_upgrades", "speed", "bus", "team", "stunned")
+
+    xp_curve = DEFAULT_CURVE  # Courbe d'EXP (progression.XpCurve), remplaçable par classe
+
     def __init__(self, name, type, pv=100, damage=10, exp=0):
+        self.inventory = Inventory()
+        self.reset(name, type, pv, damage, exp)
+
+    def reset(self, name, type, pv=100, damage=10, exp=0):
+        """Remet le personnage à neuf, avec les arguments du constructeur (réutilisation par pool.EnemyPool)"""
         self._pv = pv
         self._max_pv = pv
         self.name = name
         self.damage = damage
         self.type =  type
-        self.inventory = []
+        self.inventory.clear()
+        self._level_floor = self._level_ceiling = 0  # Force le calcul du niveau
         self.exp = exp
-        self.upgrades = {"pv":0, "damage":0}
-        self.speed = random.randint(1, 20)  # Vitesse aléatoire pour déterminer l'ordre des tours
-        self.observers = []
-    
+        self._upgrades = None  # Créé au premier accès, la plupart des ennemis n'en ont jamais
+        self.speed = streams.speed.randint(1, 20)  # Vitesse aléatoire pour déterminer l'ordre des tours
+        self.bus = None  # EventBus, partagé par tous les personnages d'une partie
+        self.team = None  # Équipe prévenue des morts et des résurrections (une seule à la fois)
+        self.stunned = 0  # Étourdissements en cours (effects.Stun) : le personnage passe ses tours
+
+    @property
+    def upgrades(self):
+        if self._upgrades is None:
+            self._upgrades = {"pv":0, "damage":0}
+        return self._upgrades
+
+    @property
+    def exp(self):
+        return self._exp
+
+    @exp.setter
+    def exp(self, value):
+        self._exp = value
+        # Le niveau n'est recalculé que si l'EXP sort des bornes du niveau en cache
+        if not self._level_floor <= value < self._level_ceiling:
+            self._level = self.xp_curve.level_for(value)
+            self._level_floor, self._level_ceiling = self.xp_curve.bounds(self._level)
+
     @property
     def max_pv(self):
-        return (self._max_pv + self.upgrades["pv"]) 
+        if self._upgrades is None:
+            return self._max_pv
+        return (self._max_pv + self._upgrades["pv"]) 
     
     @max_pv.setter
     def max_pv(self, value):
@@ -55,174 +238,307 @@ class Character(ABC):
 
     @staticmethod
     def randomize(damage):
-        return random.randint(int(damage * 0.9), int(damage * 1.1))
+        return streams.combat.randint(int(damage * 0.9), int(damage * 1.1))
     
     def get_health_bar(self, bar_length=20):
         """Generate a visual health bar based on current PV/max PV ratio"""
-        ratio = self._pv / self.max_pv if self.max_pv > 0 else 0
-        filled_length = int(bar_length * ratio)
-        empty_length = bar_length - filled_length
-        
-        # Choose color based on health percentage
-        if ratio > 0.6:
-            bar_char = '█'  # Full health - green
-        elif ratio > 0.3:
-            bar_char = '▓'  # Medium health - yellow/orange
-        else:
-            bar_char = '░'  # Low health - red
-        
-        bar = bar_char * filled_length + '░' * empty_length
-        return f"{bar}"
+        max_pv = self.max_pv
+        return health_bar(self._pv / max_pv if max_pv > 0 else 0, bar_length)
     
     def take_damage(self, damage):
+        was_alive = self._pv > 0
         self._pv -= damage
-        if self._pv < 0:
+        if self._pv <= 0:
             self._pv = 0
-            self.notify_observers("death", None)
+            if was_alive:
+                self.notify_observers("death", None)
+                if self.team is not None:
+                    self.team.on_death(self)
+        team = self.team
+        if team is not None and team.index is not None:
+            team.index.update(self)  # Grandes batailles (army.py)
         self.notify_observers("damage_taken", damage)
 
     def get_xp_level(self):
-        # Level calculation based on exponential growth, level 1 at 0 EXP, level 2 at 20 EXP, level 3 at 50 EXP, etc.
-        level = 1
-        exp_thresholds = [20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
-        for threshold in exp_thresholds:
-            if self.exp >= threshold:
-                level += 1
-            else:
-                break
-        return level
+        # Niveau en cache, tenu à jour par le setter de exp (voir progression.py)
+        return self._level
+
+    def gain_exp(self, amount, event_type=None, data=None):
+        """Ajoute de l'EXP, notifie `event_type` puis appelle level_up une fois par niveau franchi"""
+        before_level = self._level
+        self.exp += amount
+        if event_type:
+            self.notify_observers(event_type, amount if data is None else data)
+        for level in range(before_level + 1, self._level + 1):
+            self.level_up(level)
+        return self._level - before_level
 
     def drop_xp_deafeated(self, xp):
-        before_level = self.get_xp_level()
-        gained_exp = 20
-        self.exp += gained_exp
-        self.notify_observers("xp_gained", gained_exp)
-        if self.get_xp_level() > before_level:
-            self.level_up()
+        self.gain_exp(20, "xp_gained")
     
     def attack(self, target, weapon=None):
         if weapon:
             damage = self.randomize(weapon.damage + self.damage)
-            self.notify_observers("attack", {"target": target, "weapon": weapon})
         else:
             damage = self.randomize(self.damage)
-            self.notify_observers("attack", {"target": target, "weapon": None})
+        bus = self.bus
+        if bus is not None:
+            handlers = bus.handlers_for("attack")  # wants + notify_observers en une recherche
+            if handlers:
+                data = {"target": target, "weapon": weapon, "damage": damage}
+                for handler in handlers:
+                    handler(self, "attack", data)
         target.take_damage(damage)
         if target._pv <= 0:
             self.drop_xp_deafeated(target.exp)
             
     def heal(self, amount):
-        self._pv += amount
+        if self._pv <= 0 < amount and self.team is not None:
+            self._pv += amount
+            self.team.on_revive(self)
+        else:
+            self._pv += amount
         if self._pv > self.max_pv:
             self._pv = self.max_pv
+        team = self.team
+        if team is not None and team.index is not None:
+            team.index.update(self)
         self.notify_observers("heal", amount)
     
     def is_alive(self):
         return self._pv > 0
 
+    def apply_effect(self, effect):
+        """Pose un effet d'état (effects.py) pour le combat en cours ; ignoré hors combat"""
+        team = self.team
+        if team is None or team.turn is None:
+            return False
+        if team.effects is None:
+            team.effects = EffectWheel(team.turn)  # Créée au premier effet : la plupart des combats n'en ont pas
+        team.effects.apply(self, effect)
+        return True
+
     @abstractmethod
     def perform_turn(self, targets):
         pass
 
+    def level_up(self, level=None):
+        """Seul le héros choisit une amélioration en montant de niveau"""
+        pass
+
+    @property
+    def observers(self):
+        return self.bus.observers if self.bus is not None else ()
+
     def add_observer(self, observer):
-        if observer not in self.observers:
-            self.observers.append(observer)
+        """Ajoute un observateur à ce personnage seulement
+
+        Le bus partagé de tout le processus (EventBus(shared=True), GAME_BUS) est
+        d'abord copié : les autres personnages, de cette partie ou des suivantes,
+        ne voient pas l'observateur. Pour observer toute une partie, l'attacher à
+        son bus (bus.attach(observer)).
+        """
+        if self.bus is None:
+            self.bus = EventBus()
+        elif self.bus.shared:
+            self.bus = self.bus.copy()
+        self.bus.attach(observer)
     
     def remove_observer(self, observer):
-        if observer in self.observers:
-            self.observers.remove(observer)
+        if self.bus is not None:
+            self.bus.detach(observer)
+
+    def wants(self, event_type):
+        """Vrai si un observateur écoute `event_type` (évite de construire les données pour rien)"""
+        bus = self.bus
+        return bus is not None and bus.handlers_for(event_type) is not None
     
     def notify_observers(self, event_type, data):
-        for observer in self.observers:
-            observer.notify(self, event_type, data)
+        bus = self.bus
+        if bus is not None:
+            handlers = bus.handlers_for(event_type)  # EventBus.emit, déroulé sur le chemin chaud
+            if handlers:
+                for handler in handlers:
+                    handler(self, event_type, data)
 
 class Enemy(Character):
+    __slots__ = ()
+
+    HEAL = 15  # PV rendus par l'action "heal"
+
     def __init__(self, name, type, pv=100, damage=10, exp=0):
         super().__init__(name, type, pv, damage, exp)
 
     def perform_turn(self, targets):
-        action = random.choice(["attack", "heal"])
+        action = streams.ai.choice(["attack", "heal"])
         if action == "attack":
-            weapon = random.choice([item for item in self.inventory if isinstance(item, Weapon)] + [None])
-            target = random.choice(targets)
+            weapon = streams.ai.choice(self.inventory.armed)
+            target = streams.ai.choice(targets)
             self.attack(target, weapon)
         else:
-            self.heal(15)
+            self.heal(self.HEAL)
 
 class Boss(Enemy):
     """Classe pour les boss de fin d'exploration"""
+    __slots__ = ()
+
+    PV_MULTIPLIER = 1.2  # PV du boss par rapport aux PV max du héros
+    PV_BONUS = 0.3  # Part de ces PV ajoutée en amélioration de PV max
+    HEAL = 25
+
     def __init__(self, name, hero):
+        self.inventory = Inventory()  # Comme Character.__init__, avec les arguments du boss
+        self.reset(name, hero)
+
+    def reset(self, name, hero):
         exp = int(hero.exp * 1.1)
-        pv = int(hero.max_pv * 1.2)
+        pv = int(hero.max_pv * self.PV_MULTIPLIER)
         damage = int(hero.damage * 1)
-        super().__init__(name, "boss", pv, damage, exp)
+        super().reset(name, "boss", pv, damage, exp)
         
         # Le boss a toujours une bonne arme
-        boss_weapon = Weapon("Legendary Axe", damage + 15)
-        self.inventory.append(boss_weapon)
+        self.inventory.append(Weapon.shared("Legendary Axe", damage + 15))
         
         # Le boss est plus résistant
-        self.upgrades["pv"] = int(pv * 0.3)
+        self.upgrades["pv"] = int(pv * self.PV_BONUS)
     
     def perform_turn(self, targets):
         """Le boss est plus agressif"""
-        action = random.choices(["attack", "heal"], weights=[0.8, 0.2])[0]
+        action = streams.ai.choices(["attack", "heal"], weights=[0.8, 0.2])[0]
         if action == "attack":
-            weapon = random.choice([item for item in self.inventory if isinstance(item, Weapon)] + [None])
-            target = random.choice(targets)
+            weapon = streams.ai.choice(self.inventory.armed)
+            target = streams.ai.choice(targets)
             self.attack(target, weapon)
             # Le boss a une chance de double attaque
-            if random.random() > 0.7:
+            if streams.combat.random() > 0.7:
                 self.notify_observers("boss_double_attack", target)
                 self.attack(target, weapon)
         else:
-            self.heal(25)
+            self.heal(self.HEAL)
+
+class HeroPolicy(ABC):
+    """Stratégie de décision d'un héros (joueur humain ou script)"""
+    @abstractmethod
+    def choose_action(self, hero, targets):
+        """Retourne une des actions de Hero.ACTIONS"""
+        pass
+
+    @abstractmethod
+    def choose_target(self, hero, targets):
+        pass
+
+    @abstractmethod
+    def choose_weapon(self, hero, weapons):
+        """Retourne l'arme choisie, ou None pour attaquer à mains nues"""
+        pass
+
+    @abstractmethod
+    def choose_item(self, hero, consumables):
+        pass
+
+    @abstractmethod
+    def choose_upgrade(self, hero):
+        """Retourne une des améliorations de Hero.UPGRADES"""
+        pass
+
+    @abstractmethod
+    def choose_path(self, hero, paths):
+        """Retourne le chemin d'exploration choisi"""
+        pass
+
+class InputProvider(ABC):
+    """Source des réponses d'un joueur humain : terminal, socket..."""
+    @abstractmethod
+    def select(self, kind, message, choices):
+        """Retourne l'indice du libellé choisi dans `choices`, None si le joueur n'a pas répondu.
+        `kind` : "action", "target", "weapon", "item", "upgrade" ou "path"."""
+        pass
+
+class TerminalInput(InputProvider):
+    """Questions posées dans le terminal (questionary importé à la première question).
+    `output` (render.FrameRenderer) est vidé avant chaque question."""
+    def __init__(self, output=None):
+        self.output = output
+
+    def select(self, kind, message, choices):
+        from questionary import select
+        if self.output is not None:
+            self.output.flush()
+        answer = select(message, choices=choices).ask()
+        return None if answer is None else choices.index(answer)
+
+class InteractivePolicy(HeroPolicy):
+    """Décisions demandées au joueur à travers un InputProvider (le terminal par défaut)"""
+    def __init__(self, provider=None):
+        self.provider = provider or TerminalInput()
+
+    def choose_action(self, hero, targets):
+        index = self.provider.select("action", f"{hero.name}'s turn! Choose an action:", Hero.ACTIONS)
+        return None if index is None else Hero.ACTIONS[index]
+
+    def choose_target(self, hero, targets):
+        target_choices = [f"{enemy.name} (HP: {enemy._pv}/{enemy.max_pv})" for enemy in targets]
+        return targets[self.provider.select("target", "Choose a target:", target_choices)]
+
+    def choose_weapon(self, hero, weapons):
+        weapon_choices = [f"Hands (no weapon) (DMG: {hero.damage})"] + [str(weapon) for weapon in weapons]
+        index = self.provider.select("weapon", "Choose a weapon:", weapon_choices)
+        return weapons[index - 1] if index else None
+
+    def choose_item(self, hero, consumables):
+        item_choices = [f"{item} x{hero.inventory.count(item)}" for item in consumables]
+        return consumables[self.provider.select("item", "Choose an item to use:", item_choices)]
+
+    def choose_upgrade(self, hero):
+        index = self.provider.select("upgrade", "Choose an upgrade:", Hero.UPGRADES)
+        return None if index is None else Hero.UPGRADES[index]
+
+    def choose_path(self, hero, paths):
+        path_choices = [str(path) for path in paths]
+        return paths[self.provider.select("path", "Choose your path:", path_choices)]
 
 class Hero(Character):
-    def __init__(self, name, type, pv=100, damage=10):
+    __slots__ = ("policy",)
+
+    ACTIONS = ["attack", "pass", "heal", "use item", "exit game"]
+    UPGRADES = ["Increase Max HP", "Increase Damage"]
+    HEAL = 20
+
+    def __init__(self, name, type, pv=100, damage=10, policy=None):
         super().__init__(name, type, pv, damage)
+        self.policy = policy or InteractivePolicy()
 
     def perform_turn(self, targets):
-        possibilities = ["attack", "pass", "heal", "use item", "exit game"]
-        weapons = [item for item in self.inventory if isinstance(item, Weapon)]
-        choice = select(f"{self.name}'s turn! Choose an action:", choices=possibilities).ask()
+        possibilities = self.ACTIONS
+        weapons = self.inventory.weapons
+        choice = self.policy.choose_action(self, targets)
+        while choice == possibilities[3] and not self.inventory.consumables:
+            self.notify_observers("no_items", None)
+            choice = self.policy.choose_action(self, targets)  # Go back to action selection
         if choice == possibilities[0]:  # attack
-            targetted_enemy = select("Choose a target:", choices=[f"{enemy.name} (HP: {enemy._pv}/{enemy.max_pv})" for enemy in targets]).ask()
-            target = next(enemy for enemy in targets if enemy.name in targetted_enemy)
+            target = self.policy.choose_target(self, targets)
             if weapons:
-                weapon_choices = [f"Hands (no weapon) (DMG: {self.damage})"] + [str(weapon) for weapon in weapons]
-                weapon_choice = select("Choose a weapon:", choices=weapon_choices).ask()
-                if weapon_choice == weapon_choices[0]:
-                    self.attack(target)
-                else:
-                    weapon_index = weapon_choices.index(weapon_choice) - 1
-                    self.attack(target, weapons[weapon_index])
+                self.attack(target, self.policy.choose_weapon(self, weapons))
             else:
                 self.attack(target)
         elif choice == possibilities[1]:  # pass
             self.notify_observers("pass", None)
         elif choice == possibilities[2]:  # heal
-            self.heal(20)
+            self.heal(self.HEAL)
         elif choice == possibilities[3]:  # use item
-            consumables = [item for item in self.inventory if isinstance(item, Consumable)]
-            if not consumables:
-                self.notify_observers("no_items", None)
-                return self.perform_turn(targets)  # Go back to action selection
-            else:
-                consumable_choice = select("Choose an item to use:", choices=[str(item) for item in consumables]).ask()
-                consumable = next(item for item in consumables if str(item) == consumable_choice)
-                consumable.use(self)
-                self.inventory.remove(consumable)
+            consumable = self.policy.choose_item(self, self.inventory.consumables)
+            consumable.use(self)
+            self.inventory.remove(consumable)
         elif choice == possibilities[4]:  # exit game
             self.notify_observers("exit_game", None)
             exit()
         else:
             self.notify_observers("invalid_choice", None)
     
-    def level_up(self):
-        self.notify_observers("level_up", self.get_xp_level())
-        choice = select("Choose an upgrade:", choices=["Increase Max HP", "Increase Damage"]).ask()
-        if choice == "Increase Max HP":
+    def level_up(self, level=None):
+        self.notify_observers("level_up", level or self.get_xp_level())
+        choice = self.policy.choose_upgrade(self)
+        if choice == self.UPGRADES[0]:
             self.max_pv += 20
             self._pv = self.max_pv  # Heal to full on level up
         else:
@@ -232,17 +548,71 @@ class Hero(Character):
 class Team:
     def __init__(self, name):
         self.name = name
+        self.index = None  # Index des cibles tenu à jour par take_damage et heal (army.ArmyTeam)
+        self.turn = None  # Tour du combat en cours, None hors combat
+        self.effects = None  # Roue des effets d'état du combat en cours (effects.EffectWheel), créée au premier effet
         self.members = []
+        self._alive = []  # Membres vivants, tenu à jour par take_damage (mort) et heal (résurrection)
+        self._positions = {}  # Membre vivant -> sa place dans _alive
     
     def add_member(self, character):
         self.members.append(character)
+        character.team = self
+        if character._pv > 0:
+            self.on_revive(character)
     
     def remove_member(self, character):
         if character in self.members:
             self.members.remove(character)
+            self.on_death(character)
+            if character.team is self:
+                character.team = None
+
+    def on_death(self, character):
+        """Retire un mort des vivants en O(1) : le dernier vivant prend sa place"""
+        position = self._positions.pop(character, None)
+        if position is None:
+            return
+        last = self._alive.pop()
+        if last is not character:
+            self._alive[position] = last
+            self._positions[last] = position
+
+    def on_revive(self, character):
+        if character not in self._positions:
+            self._positions[character] = len(self._alive)
+            self._alive.append(character)
+
+    def start_turn(self, turn):
+        """Début du tour `turn` d'un combat (0 : avant le premier tour) : les effets prévus à ce tour agissent"""
+        self.turn = turn
+        if self.effects is not None:
+            self.effects.advance(turn)
+
+    def end_battle(self):
+        """Fin du combat : les effets en cours sont terminés (bonus retirés, étourdissements levés)"""
+        if self.effects is not None:
+            self.effects.clear()
+            self.effects = None
+        self.turn = None
+
+    def refresh(self):
+        """Recalcule les vivants après une modification directe de _pv"""
+        self._alive[:] = [member for member in self.members if member._pv > 0]
+        self._positions = {member: position for position, member in enumerate(self._alive)}
+
+    @property
+    def alive_count(self):
+        return len(self._alive)
     
     def is_defeated(self):
-        return all(member._pv <= 0 for member in self.members)
+        return not self._alive
     
     def get_alive_members(self):
+        """Copie des membres vivants, dans l'ordre de members
+
+        La liste interne _alive (retraits en O(1), ordre bouleversé par les morts)
+        reste réservée à Team et à ses sous-classes : la copie ne bouge pas quand
+        un membre meurt, et les menus de cibles gardent le même ordre d'un tour à l'autre.
+        """
         return [member for member in self.members if member._pv > 0]
\ No newline at end of file
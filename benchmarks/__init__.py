@@ -0,0 +1 @@
+"""Benchmarks du jeu, à lancer depuis la racine : python -m benchmarks.<nom>"""
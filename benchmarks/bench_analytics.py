@@ -0,0 +1,63 @@
+"""Agrégation d'un gros journal d'événements (python -m benchmarks.bench_analytics).
+
+Écrit des blocs synthétiques (tirés avec NumPy, sans jouer de parties) au
+format d'EventSink, puis chronomètre Aggregator sur l'ensemble et mesure le
+pic de mémoire résidente du processus : il dépend de la taille d'un bloc,
+pas du nombre d'événements.
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from analytics import Aggregator, write_chunk, HERO_ATTACK, ENEMY_ATTACK, HERO_DEATH, BATTLE_END, CHUNK_ROWS
+
+LABELS = ["none", "easy", "normal", "hard", "boss", "Iron Sword", "Steel Axe", "Magic Staff", "Random Weapon"]
+
+
+def write_events(directory, events, chunk_rows=CHUNK_ROWS, seed=0):
+    """Écrit `events` événements synthétiques par blocs de `chunk_rows`"""
+    rng = np.random.default_rng(seed)
+    with open(os.path.join(directory, "labels.json"), "w", encoding="utf-8") as f:
+        json.dump(LABELS, f)
+    written = index = 0
+    while written < events:
+        rows = min(chunk_rows, events - written)
+        kind = rng.choice([HERO_ATTACK, ENEMY_ATTACK, HERO_DEATH, BATTLE_END], rows, p=[0.45, 0.45, 0.02, 0.08])
+        label = np.where(kind == BATTLE_END, rng.integers(1, 5, rows), rng.integers(5, len(LABELS), rows))
+        value = np.where(kind == BATTLE_END, rng.integers(-20, 200, rows), rng.integers(10, 60, rows))
+        run = written // 200 + np.arange(rows) // 200
+        stage = rng.integers(1, 12, rows)
+        write_chunk(directory, index, (run, stage, kind, label, value))
+        written += rows
+        index += 1
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--events", type=int, default=100_000_000)
+    parser.add_argument("--dir", help="répertoire de blocs à réutiliser (par défaut : temporaire)")
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp(prefix="rpg-events-")
+    try:
+        if not os.path.exists(os.path.join(directory, "chunk-000000.bin")):
+            start = time.perf_counter()
+            chunks = write_events(directory, args.events)
+            print(f"wrote {args.events:,} events in {chunks} chunks ({time.perf_counter() - start:.1f}s)")
+        start = time.perf_counter()
+        aggregator = Aggregator(directory).run()
+        elapsed = time.perf_counter() - start
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"aggregated {aggregator.events:,} events in {elapsed:.1f}s "
+              f"({aggregator.events / elapsed / 1e6:.1f}M events/s) | peak RSS {peak:.0f} MB")
+        print(json.dumps(aggregator.summary()["win_rate_by_difficulty"], indent=2))
+    finally:
+        if not args.dir:
+            shutil.rmtree(directory)
@@ -0,0 +1,52 @@
+"""Coût d'un choix de cible selon la taille de l'équipe (python -m benchmarks.bench_army).
+
+Chaque opération choisit une cible puis lui inflige des dégâts (ou la
+soigne), comme un tour de grande bataille : avec l'index de ArmyTeam, et
+avec une recherche linéaire (min sur les vivants) jusqu'à 10 000 membres.
+"""
+import argparse
+import random
+import time
+
+from army import ArmyTeam
+from base import Enemy, Weapon
+
+
+def make_team(size, seed=0):
+    rng = random.Random(seed)
+    members = []
+    for i in range(size):
+        enemy = Enemy(f"Enemy {i}", "beast", rng.randint(10 ** 6, 2 * 10 ** 6), rng.randint(5, 30))
+        if rng.random() < 0.5:
+            enemy.inventory.append(Weapon.shared("Rusty Sword", rng.randint(15, 20)))
+        members.append(enemy)
+    return ArmyTeam("Bench Team", members)
+
+
+def picks(team, ops, strategy, linear=False, seed=0):
+    """Microsecondes par opération (choix puis dégâts ou soin)"""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(ops):
+        if linear:
+            target = min(team.get_alive_members(), key=lambda enemy: enemy._pv)
+        else:
+            target = team.pick(strategy, rng)
+        if rng.random() < 0.8:
+            target.take_damage(rng.randint(1, 50))
+        else:
+            target.heal(rng.randint(1, 50))
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for size in (100, 1_000, 10_000, 100_000):
+        row = {strategy: picks(make_team(size), args.ops, strategy)
+               for strategy in ("random", "lowest_hp", "highest_threat")}
+        if size <= 10_000:
+            row["linear lowest_hp"] = picks(make_team(size), args.ops // 10, None, linear=True)
+        print(f"{size:>7} members: " + " | ".join(f"{name} {us:.2f} µs" for name, us in row.items()))
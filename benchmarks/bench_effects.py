@@ -0,0 +1,73 @@
+"""Coût d'un tour avec beaucoup d'effets en cours (python -m benchmarks.bench_effects).
+
+Pose des effets sur une armée, puis compare EffectWheel.advance à un
+parcours de tous les effets à chaque tour (ce que coûterait une liste
+d'effets par personnage). Deux mélanges : des poisons et régénérations qui
+agissent souvent (tous les 5 à 20 tours), et des effets qui agissent
+rarement (bonus, poisons tous les 50 à 100 tours).
+"""
+import argparse
+import random
+import time
+
+from base import Enemy
+from effects import EffectWheel, Poison, Regeneration, Buff
+
+
+def effects(count, rng, periods):
+    kinds = (
+        lambda: Poison(1, rng.randint(50, 400), period=rng.randint(*periods)),
+        lambda: Regeneration(1, rng.randint(50, 400), period=rng.randint(*periods)),
+        lambda: Buff(1, rng.randint(50, 400)),
+    )
+    return [rng.choice(kinds)() for _ in range(count)]
+
+
+def army(size):
+    return [Enemy(f"Soldier {i}", "human", 10 ** 9, 10) for i in range(size)]
+
+
+def wheel_turns(members, pending, turns):
+    wheel = EffectWheel()
+    for i, effect in enumerate(pending):
+        wheel.apply(members[i % len(members)], effect)
+    start = time.perf_counter()
+    for turn in range(1, turns + 1):
+        wheel.advance(turn)
+    return time.perf_counter() - start
+
+
+def scan_turns(members, pending, turns):
+    """Chaque tour examine chaque effet : dû, expiré, ou rien à faire"""
+    active = []
+    for i, effect in enumerate(pending):
+        target = members[i % len(members)]
+        effect.target, effect.ends, effect.next_tick = target, effect.duration + 1, effect.period
+        effect.start(target)
+        active.append(effect)
+    start = time.perf_counter()
+    for turn in range(1, turns + 1):
+        still = []
+        for effect in active:
+            if effect.period and turn == effect.next_tick and turn < effect.ends:
+                effect.tick(effect.target)
+                effect.next_tick += effect.period
+            if turn >= effect.ends:
+                effect.end(effect.target)
+            else:
+                still.append(effect)
+        active = still
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    for label, periods in (("frequent", (5, 20)), ("rare", (50, 100))):
+        for count in (1_000, 10_000, 100_000):
+            wheel = wheel_turns(army(count // 4), effects(count, random.Random(0), periods), args.turns)
+            scan = scan_turns(army(count // 4), effects(count, random.Random(0), periods), args.turns)
+            print(f"{label:>8} | {count:>7,} effects | wheel {wheel / args.turns * 1e6:>8.1f} µs/turn | "
+                  f"scan {scan / args.turns * 1e6:>8.1f} µs/turn | x{scan / wheel:.1f}")
@@ -0,0 +1,85 @@
+"""Mémoire par ennemi créé par EnemyFactory.create_enemy (python -m benchmarks.bench_memory)
+
+Compare les classes à __slots__ de base.py avec une réplique de l'ancienne
+disposition (un __dict__ par instance, dict `upgrades`, liste `observers` et
+un GameObserver par ennemi au lieu du bus partagé).
+"""
+import argparse
+import contextlib
+import gc
+import os
+import random
+import tracemalloc
+
+from base import Hero
+from factories import EnemyFactory
+from observer import GameObserver, GAME_BUS
+
+
+class LegacyWeapon:
+    def __init__(self, name, damage):
+        self.name = name
+        self.damage = damage
+
+
+class LegacyEnemy:
+    """Mêmes attributs que Character avant l'ajout de __slots__"""
+    def __init__(self, name, type, pv=100, damage=10, exp=0):
+        self._pv = pv
+        self._max_pv = pv
+        self.name = name
+        self.damage = damage
+        self.type = type
+        self.inventory = []
+        self.exp = exp
+        self.upgrades = {"pv": 0, "damage": 0}
+        self.speed = random.randint(1, 20)
+        self.observers = []
+
+
+def create_legacy_enemy(hero, with_observer):
+    """Mêmes tirages que EnemyFactory.create_enemy, avec les anciennes classes"""
+    name = random.choice(["Bandit", "Wolf", "Spider", "Skeleton", "Goblin"])
+    enemy_type = random.choice(["warrior", "beast", "undead", "monster"])
+    enemy_exp = int(hero.exp * random.uniform(0.7, 1.0))
+    enemy = LegacyEnemy(name, enemy_type, 80 + (enemy_exp // 15), random.randint(12, 18), enemy_exp)
+    if with_observer:
+        enemy.observers.append(GameObserver())
+    if random.random() > 0.6:
+        enemy.inventory.append(LegacyWeapon("Rusty Sword", random.randint(15, 20)))
+    return enemy
+
+
+def measure(count, build):
+    """Octets alloués par entité pour `count` entités gardées en vie"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # La liste qui garde les entités en vie n'est pas comptée
+    list_bytes = entities.__sizeof__()
+    del entities
+    return (after - before - list_bytes) / count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--enemies", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    hero = Hero("Bench", "warrior", 80, 15)
+    hero.exp = 300
+    random.seed(0)
+
+    for with_observer in (False, True):
+        label = "with GameObserver" if with_observer else "no observer"
+        factory = EnemyFactory(bus=GAME_BUS if with_observer else None)
+        # Les annonces du GameObserver partent dans /dev/null
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            factory.create_enemy(hero)  # Chauffe les caches hors mesure
+            legacy = measure(args.enemies, lambda: create_legacy_enemy(hero, with_observer))
+            slotted = measure(args.enemies, lambda: factory.create_enemy(hero))
+        print(f"{label:18} before {legacy:7.1f} B/enemy | after {slotted:7.1f} B/enemy | "
+              f"-{100 * (1 - slotted / legacy):.0f}% ({args.enemies:,} enemies)")
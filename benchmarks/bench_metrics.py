@@ -0,0 +1,100 @@
+"""Surcoût de MetricsObserver sur la boucle de combat (python -m benchmarks.bench_metrics).
+
+Deux configurations : une partie en terminal (GameObserver, sortie vers
+/dev/null) et une simulation sans affichage, comparée à un bus vide (le coût
+d'un bus sans abonné, ~1 %, est celui de toute partie instrumentée). Les temps sont des temps CPU
+(process_time). Chaque essai joue les mêmes combats seedés sans puis avec
+métriques ; le surcoût est la médiane des rapports de ces paires, le minimum
+de quelques longs essais variant de plus de 10 % sur une machine chargée.
+Budget demandé : moins de 5 % sans affichage. La ligne "handler floor"
+remplace MetricsObserver par des handlers vides abonnés aux mêmes
+événements : c'est le coût des seuls appels de handlers (un par attaque,
+soin, mort, montée de niveau), déjà au-dessus de 5 % sur une machine
+d'1 vCPU (~+6 %, MetricsObserver ~+11 %). Les compteurs ne peuvent passer
+sous le budget qu'en sortant du bus d'observateurs.
+"""
+import argparse
+import contextlib
+import os
+import statistics
+import time
+
+from base import Team
+from events import EventBus
+from factories import HeroFactory, EnemyFactory
+from game import play_game
+from metrics import MetricsObserver
+from observer import Observer, GameObserver
+from policies import GreedyPolicy
+from rng import streams
+
+
+def battles(count, bus, seed=0):
+    """Temps CPU de `count` combats du Mode Classique sur le bus `bus` (None : sans observateur)"""
+    streams.seed(seed)
+    policy = GreedyPolicy()
+    start = time.process_time()
+    for _ in range(count):
+        hero = HeroFactory(bus).create_character("Bench Hero", policy)
+        hero_team, enemy_team = Team("Hero Team"), Team("Enemy Team")
+        hero_team.add_member(hero)
+        enemy_team.add_member(EnemyFactory(bus).create_enemy(hero))
+        play_game(hero_team, enemy_team, max_turns=200)
+    return time.process_time() - start
+
+
+def make_bus(*observers):
+    bus = EventBus()
+    for observer in observers:
+        bus.attach(observer)
+    return bus
+
+
+def _ignore(subject, event_type, data):
+    pass
+
+
+class HandlerFloor(Observer):
+    """Abonné aux événements de MetricsObserver avec des handlers vides"""
+    events = MetricsObserver().events
+
+    def notify(self, subject, event_type, data):
+        pass
+
+    def handler(self, event_type):
+        return _ignore
+
+
+def overhead(count, trials, base_observers, metrics=None):
+    """(combats/s sans métriques, combats/s avec, surcoût médian, observateur), essais appariés"""
+    metrics = metrics or MetricsObserver()
+    without = with_metrics = 0.0
+    ratios = []
+    for trial in range(trials):
+        plain = battles(count, make_bus(*base_observers), seed=trial)
+        measured = battles(count, make_bus(*base_observers, metrics), seed=trial)
+        without += plain
+        with_metrics += measured
+        ratios.append(measured / plain)
+    total = count * trials
+    return total / without, total / with_metrics, statistics.median(ratios) - 1, metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--battles", type=int, default=50, help="combats par essai")
+    parser.add_argument("--trials", type=int, default=300)
+    parser.add_argument("--export", help="écrit l'instantané JSON des métriques dans ce fichier")
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        session = overhead(args.battles, args.trials, (GameObserver(),))
+    floor = overhead(args.battles, args.trials, (), HandlerFloor())
+    headless = overhead(args.battles, args.trials, ())
+    for label, (without, with_metrics, cost, metrics) in (("terminal session", session), ("handler floor", floor),
+                                                          ("headless", headless)):
+        print(f"{label:17} {without:>9,.0f} -> {with_metrics:>9,.0f} battles/s | overhead {cost:+.1%}")
+    print(f"attacks {metrics.attacks:,} | deaths {metrics.deaths:,} | "
+          f"perform_turn samples {metrics.durations['perform_turn'].count:,}")
+    if args.export:
+        metrics.export(args.export)
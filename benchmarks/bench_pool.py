@@ -0,0 +1,54 @@
+"""Ramasse-miettes et allocations des combats du Mode Classique (python -m benchmarks.bench_pool).
+
+Même boucle que game.run_classic (héros conservé, PV remis à fond à chaque
+combat), avec et sans pool d'ennemis. Compte les passages du ramasse-miettes
+(toutes générations), les blocs mémoire encore alloués à la fin et le temps
+CPU de la série.
+"""
+import argparse
+import gc
+import sys
+import time
+
+from base import Team, Weapon
+from factories import HeroFactory, EnemyFactory
+from game import resolve_battle
+from policies import GreedyPolicy
+from pool import EnemyPool
+from rng import streams
+
+
+def classic_battles(count, pool, seed=0):
+    """(passages du GC, blocs alloués en plus, temps CPU) de `count` combats"""
+    streams.seed(seed)
+    hero = HeroFactory(bus=None).create_character("Bench Hero", GreedyPolicy())
+    hero_team = Team("Hero Team")
+    hero_team.add_member(hero)
+    factory = EnemyFactory(bus=None, pool=pool)
+    gc.collect()
+    collections = sum(generation["collections"] for generation in gc.get_stats())
+    blocks = sys.getallocatedblocks()
+    start = time.process_time()
+    for _ in range(count):
+        hero._pv = hero.max_pv
+        hero_team.refresh()
+        enemy = factory.create_enemy(hero)
+        if streams.factory.random() > 0.5:
+            enemy.inventory.append(Weapon.shared("Random Weapon", streams.factory.randint(20, 30)))
+        enemy_team = Team("Enemy Team")
+        enemy_team.add_member(enemy)
+        resolve_battle(hero_team, enemy_team, max_turns=200)
+        factory.release(enemy)
+    elapsed = time.process_time() - start
+    return (sum(generation["collections"] for generation in gc.get_stats()) - collections,
+            sys.getallocatedblocks() - blocks, elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--battles", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for label, pool in (("new enemy per battle", None), ("pooled enemies", EnemyPool())):
+        collections, blocks, elapsed = classic_battles(args.battles, pool)
+        print(f"{label:>22}: {collections:>6} GC collections | {blocks:>+7} blocks | {elapsed:.2f}s CPU")
@@ -0,0 +1,86 @@
+"""Affichage d'une partie jouée automatiquement (python -m benchmarks.bench_render).
+
+Joue les mêmes combats du Mode Classique avec GameObserver (un print par
+événement) puis avec FrameRenderer, la sortie allant vers un pseudo-terminal
+(lu par un thread, comme un émulateur de terminal) et vers /dev/null.
+Affiche le temps de la série et le nombre d'écritures.
+"""
+import argparse
+import contextlib
+import io
+import os
+import pty
+import threading
+import time
+
+from base import Team
+from events import EventBus
+from factories import HeroFactory, EnemyFactory
+from game import play_game
+from observer import GameObserver
+from policies import GreedyPolicy
+from render import FrameRenderer
+from rng import streams
+
+
+class CountingStream(io.TextIOWrapper):
+    """Flux texte ligne par ligne, comme sys.stdout sur un terminal, qui compte ses écritures"""
+
+    def __init__(self, fd):
+        super().__init__(open(fd, "wb", buffering=0, closefd=False), encoding="utf-8", line_buffering=True)
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def battles(count, observer, seed=0):
+    streams.seed(seed)
+    bus = EventBus()
+    bus.attach(observer)
+    policy = GreedyPolicy()
+    start = time.perf_counter()
+    for _ in range(count):
+        hero = HeroFactory(bus).create_character("Bench Hero", policy)
+        hero_team, enemy_team = Team("Hero Team"), Team("Enemy Team")
+        hero_team.add_member(hero)
+        enemy_team.add_member(EnemyFactory(bus).create_enemy(hero))
+        play_game(hero_team, enemy_team, max_turns=200)
+    if isinstance(observer, FrameRenderer):
+        observer.close()
+    return time.perf_counter() - start
+
+
+def drain(fd):
+    try:
+        while os.read(fd, 1 << 16):
+            pass
+    except OSError:
+        pass
+
+
+def run(count, fd, tty):
+    results = {}
+    stream = CountingStream(fd)
+    with contextlib.redirect_stdout(stream):
+        elapsed = battles(count, GameObserver())
+    stream.flush()
+    results["print per event"] = (elapsed, stream.writes)
+    stream = CountingStream(fd)
+    elapsed = battles(count, FrameRenderer(stream, tty=tty))
+    results["frames"] = (elapsed, stream.writes)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--battles", type=int, default=2_000)
+    args = parser.parse_args()
+
+    master, slave = pty.openpty()
+    threading.Thread(target=drain, args=(master,), daemon=True).start()
+    null = os.open(os.devnull, os.O_WRONLY)
+    for target, fd, tty in (("pty", slave, True), ("/dev/null", null, False)):
+        for label, (elapsed, writes) in run(args.battles, fd, tty).items():
+            print(f"{target:>9} | {label:>15}: {elapsed:.2f}s | {writes:,} writes")
@@ -0,0 +1,98 @@
+"""Tours par seconde de l'ordonnanceur (scheduler.py) comparé à l'ancienne boucle triée
+(python -m benchmarks.bench_scheduler), sur des combats 10 contre 1000."""
+import argparse
+import time
+
+from base import Hero, Team
+from factories import HeroFactory, EnemyFactory
+from game import resolve_battle
+from policies import GreedyPolicy
+from rng import streams
+from scheduler import InitiativeScheduler
+
+
+def legacy_resolve_battle(hero_team, enemy_team, max_turns=None):
+    """Ancienne boucle : tri par vitesse puis parcours de toute la liste à chaque tour,
+    équipes parcourues à chaque test de défaite et à chaque action"""
+    characters = hero_team.members + enemy_team.members
+    characters.sort(key=lambda c: c.speed, reverse=True)
+    turn = 0
+    while not all(m._pv <= 0 for m in hero_team.members) and not all(m._pv <= 0 for m in enemy_team.members):
+        if max_turns is not None and turn >= max_turns:
+            break
+        turn += 1
+        for character in characters:
+            if character._pv <= 0:
+                continue
+            opponents = enemy_team if isinstance(character, Hero) else hero_team
+            targets = [member for member in opponents.members if member._pv > 0]
+            if not targets:
+                break
+            character.perform_turn(targets)
+    return turn
+
+
+def make_teams(seed, heroes, enemies, hero_pv):
+    streams.seed(seed)
+    hero_team = Team("Hero Team")
+    for index in range(heroes):
+        hero = HeroFactory(bus=None).create_character(f"Hero {index}", GreedyPolicy(heal_threshold=0))
+        hero._max_pv = hero._pv = hero_pv  # Les héros tiennent jusqu'à la fin du combat
+        hero_team.add_member(hero)
+    enemy_team = Team("Enemy Team")
+    for enemy in EnemyFactory(bus=None).create_enemies(hero_team.members[0], enemies):
+        enemy_team.add_member(enemy)
+    return hero_team, enemy_team
+
+
+def rounds_per_second(resolve, args, **options):
+    best = 0
+    for repeat in range(args.repeat):
+        hero_team, enemy_team = make_teams(repeat, args.heroes, args.enemies, args.hero_pv)
+        start = time.perf_counter()
+        turns = resolve(hero_team, enemy_team, args.max_turns, **options)
+        best = max(best, turns / (time.perf_counter() - start))
+    return best, turns
+
+
+def ordering_only(args, dead_ratio=0.9, rounds=1000):
+    """Coût de l'ordonnancement seul (sans actions) une fois `dead_ratio` des ennemis morts"""
+    hero_team, enemy_team = make_teams(0, args.heroes, args.enemies, args.hero_pv)
+    for enemy in enemy_team.members[:int(len(enemy_team.members) * dead_ratio)]:
+        enemy._pv = 0
+    characters = sorted(hero_team.members + enemy_team.members, key=lambda c: c.speed, reverse=True)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for character in characters:
+            if character._pv <= 0:
+                continue
+    legacy = rounds / (time.perf_counter() - start)
+    scheduler = InitiativeScheduler(characters)
+    start = time.perf_counter()
+    for turn in range(1, rounds + 1):
+        for character in scheduler.round(turn):
+            if character._pv <= 0:
+                continue
+    return legacy, rounds / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--heroes", type=int, default=10)
+    parser.add_argument("--enemies", type=int, default=1000)
+    parser.add_argument("--hero-pv", type=int, default=10 ** 9)
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    legacy, legacy_turns = rounds_per_second(legacy_resolve_battle, args)
+    classic, classic_turns = rounds_per_second(resolve_battle, args)
+    weighted, weighted_turns = rounds_per_second(resolve_battle, args, weighted=True)
+    print(f"{args.heroes} vs {args.enemies}")
+    print(f"legacy loop        {legacy:>9,.1f} rounds/s ({legacy_turns} rounds)")
+    print(f"scheduler          {classic:>9,.1f} rounds/s ({classic_turns} rounds) x{classic / legacy:.2f}")
+    print(f"speed-weighted     {weighted:>9,.1f} rounds/s ({weighted_turns} rounds)")
+
+    legacy, scheduler = ordering_only(args)
+    print(f"ordering only, 90% of enemies dead: legacy {legacy:,.0f} rounds/s | scheduler {scheduler:,.0f} rounds/s "
+          f"x{scheduler / legacy:.1f}")
@@ -0,0 +1,39 @@
+"""Temps de démarrage de l'entrée en ligne de commande (python -m benchmarks.bench_startup).
+
+Chaque commande est lancée dans un nouvel interpréteur, comme le font les
+scripts de traitement par lots ; "import questionary" donne le coût évité
+par les commandes qui ne posent aucune question.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python (vide)": ["-c", "pass"],
+    "import questionary": ["-c", "import questionary"],
+    "main --help": ["-m", "main", "--help"],
+    "main scores": ["-m", "main", "scores", "-n", "3"],
+    "main play --headless": ["-m", "main", "play", "--headless", "--quiet", "--no-save", "--seed", "1", "--stages", "1"],
+    "main simulate -n 10": ["-m", "main", "simulate", "-n", "10", "--workers", "1"],
+}
+
+
+def startup_times(command, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + command, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for label, command in COMMANDS.items():
+        times = startup_times(command, args.runs)
+        print(f"{label:24} median {statistics.median(times) * 1000:7.1f} ms | min {min(times) * 1000:7.1f} ms")
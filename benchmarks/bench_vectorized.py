@@ -0,0 +1,33 @@
+"""Débit du moteur vectorisé comparé au moteur objet (python -m benchmarks.bench_vectorized)"""
+import argparse
+import time
+
+from simulation import run_simulation
+from vectorized import run_vectorized
+
+
+def best_of(repeat, func, *args, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-b", "--batch", type=int, default=100_000)
+    parser.add_argument("--object-battles", type=int, default=5_000,
+                        help="combats joués par le moteur objet (débit extrapolé)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, scenario in [("classic", {}), ("classic exp=400", {"hero_exp": 400}), ("boss", {"boss": True, "hero_exp": 300})]:
+        object_time, object_report = best_of(args.repeat, run_simulation, args.object_battles, seed=1, workers=1, **scenario)
+        vector_time, vector_report = best_of(args.repeat, run_vectorized, args.batch, seed=1, **scenario)
+        object_rate = args.object_battles / object_time
+        vector_rate = args.batch / vector_time
+        print(f"{label:16} object {object_rate:>10,.0f} battles/s (win {object_report.win_rate:.3f}) | "
+              f"vectorized {vector_rate:>12,.0f} battles/s (win {vector_report.win_rate:.3f}) | "
+              f"x{vector_rate / object_rate:.1f}")
@@ -0,0 +1,256 @@
+"""Suite de benchmarks des chemins chauds (python -m benchmarks.suite).
+
+Chaque cas prépare des entrées seedées puis chronomètre `ops` opérations
+(meilleur de --repeat essais). Les résultats sont écrits en JSON ; avec
+--compare, chaque débit est comparé à celui d'un fichier précédent et la
+commande échoue si l'un d'eux a baissé de plus de --tolerance.
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import scores
+from base import Hero, Enemy, Team, Weapon
+from events import EventBus
+from exploration import ExplorationZone
+from factories import HeroFactory, EnemyFactory
+from game import play_game
+from metrics import MetricsObserver
+from observer import Observer, GameObserver
+from policies import GreedyPolicy
+from rng import streams
+
+SEED = 1234
+CASES = {}
+
+
+def case(name, ops):
+    """Enregistre un cas : la fonction prépare ses entrées et retourne la fonction chronométrée"""
+    def register(setup):
+        CASES[name] = (setup, ops)
+        return setup
+    return register
+
+
+def _duelists():
+    streams.seed(SEED)
+    hero = Hero("Bench Hero", "warrior", 100, 15, GreedyPolicy())
+    dummy = Enemy("Dummy", "beast", 10 ** 12, 10)  # Ne meurt jamais pendant le benchmark
+    return hero, dummy
+
+
+@case("attack", 200_000)
+def bench_attack(ops):
+    hero, dummy = _duelists()
+    sword = Weapon("Iron Sword", 18)
+
+    def run():
+        for _ in range(ops):
+            hero.attack(dummy, sword)
+    return run
+
+
+@case("take_damage", 500_000)
+def bench_take_damage(ops):
+    hero, dummy = _duelists()
+
+    def run():
+        for _ in range(ops):
+            dummy.take_damage(7)
+    return run
+
+
+@case("heal", 500_000)
+def bench_heal(ops):
+    hero, dummy = _duelists()
+    hero.take_damage(50)
+
+    def run():
+        for _ in range(ops):
+            hero.heal(1)
+    return run
+
+
+class CountingObserver(Observer):
+    """Abonné à tous les événements de GameObserver, sans affichage"""
+    events = GameObserver.events
+
+    def __init__(self):
+        self.count = 0
+
+    def notify(self, subject, event_type, data):
+        self.count += 1
+
+
+@case("observer_dispatch", 500_000)
+def bench_observer_dispatch(ops):
+    hero, dummy = _duelists()
+    hero.add_observer(CountingObserver())
+
+    def run():
+        for _ in range(ops):
+            hero.notify_observers("damage_taken", 7)
+    return run
+
+
+def _battles(ops, bus):
+    policy = GreedyPolicy()
+
+    def run():
+        streams.seed(SEED)
+        for _ in range(ops):
+            hero = HeroFactory(bus).create_character("Bench Hero", policy)
+            hero_team, enemy_team = Team("Hero Team"), Team("Enemy Team")
+            hero_team.add_member(hero)
+            enemy_team.add_member(EnemyFactory(bus).create_enemy(hero))
+            play_game(hero_team, enemy_team, max_turns=200)
+    return run
+
+
+@case("play_game", 5_000)
+def bench_play_game(ops):
+    return _battles(ops, None)
+
+
+@case("play_game_bus", 5_000)
+def bench_play_game_bus(ops):
+    return _battles(ops, EventBus())
+
+
+@case("play_game_metrics", 5_000)
+def bench_play_game_metrics(ops):
+    """À comparer à play_game_bus : surcoût de MetricsObserver (voir benchmarks/bench_metrics.py)"""
+    bus = EventBus()
+    bus.attach(MetricsObserver())
+    return _battles(ops, bus)
+
+
+@case("explore_stage", 50_000)
+def bench_explore_stage(ops):
+    streams.seed(SEED)
+    hero = HeroFactory(bus=None).create_character("Bench Hero", GreedyPolicy())
+    zone = ExplorationZone("Bench Zone", hero, num_stages=ops)
+
+    def run():
+        for _ in range(ops):
+            zone.explore_stage()  # Les combats proposés ne sont pas joués
+    return run
+
+
+class _TemporaryScores:
+    """scores.py redirigé vers une base temporaire"""
+    def __init__(self, entries=0):
+        self.directory = tempfile.TemporaryDirectory()
+        self.saved = scores.SCORES_DB, scores.SCORES_FILE
+        scores.SCORES_DB = os.path.join(self.directory.name, "highscores.db")
+        scores.SCORES_FILE = os.path.join(self.directory.name, "missing.json")
+        if entries:
+            scores.get_leaderboard().add_many((f"P{i}", (i * 7919) % 100_000, i % 50) for i in range(entries))
+
+    def close(self):
+        scores._leaderboards.pop(scores.SCORES_DB).close()
+        scores.SCORES_DB, scores.SCORES_FILE = self.saved
+        self.directory.cleanup()
+
+
+@case("save_score", 10_000)
+def bench_save_score(ops):
+    board = _TemporaryScores()
+
+    def run():
+        try:
+            for i in range(ops):
+                scores.save_score(f"P{i}", (i * 7919) % 100_000, i % 50)
+        finally:
+            board.close()
+    return run
+
+
+@case("load_scores", 10_000)
+def bench_load_scores(ops):
+    board = _TemporaryScores(entries=10_000)
+
+    def run():
+        try:
+            for _ in range(ops):
+                scores.load_scores()
+        finally:
+            board.close()
+    return run
+
+
+def run_suite(names=None, repeat=3, scale=1.0):
+    results = {}
+    for name, (setup, ops) in CASES.items():
+        if names and name not in names:
+            continue
+        ops = max(1, int(ops * scale))
+        best = float("inf")
+        for _ in range(repeat):
+            run = setup(ops)
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        results[name] = {"ops": ops, "seconds": round(best, 6), "ops_per_sec": round(ops / best, 1)}
+    return {
+        "seed": SEED,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Liste des cas dont le débit a baissé de plus de `tolerance` (ratio)"""
+    regressions = []
+    for name, result in report["results"].items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        ratio = result["ops_per_sec"] / before["ops_per_sec"]
+        flag = "REGRESSION" if ratio < 1 - tolerance else ""
+        print(f"{name:18} {before['ops_per_sec']:>14,.0f} -> {result['ops_per_sec']:>14,.0f} ops/s  x{ratio:.2f} {flag}",
+              file=sys.stderr)
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks des chemins chauds du jeu")
+    parser.add_argument("cases", nargs="*", help=f"cas à lancer (défaut : tous) parmi {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplie le nombre d'opérations de chaque cas")
+    parser.add_argument("-o", "--output", help="fichier JSON de résultats (défaut : sortie standard)")
+    parser.add_argument("--compare", help="fichier JSON d'une exécution précédente")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="baisse de débit tolérée avant échec")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    report = run_suite(args.cases, args.repeat, args.scale)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Checkpoints d'une session d'exploration, pour reprendre une partie interrompue.
+
+Le fichier commence par un en-tête (magic, version, nombre de stages, noms de
+la zone et du héros, chacun précédé de sa longueur sur 2 octets) suivi d'enregistrements ajoutés au fil de la partie.
+Chaque enregistrement (octet de type, longueur sur 2 octets, contenu) ne
+décrit que ce qui a changé depuis le précédent :
+
+- STATE : PV, PV max, dégâts, EXP, améliorations, vitesse, stage, victoires ;
+- PATH : un chemin de plus dans paths_history ;
+- ITEM : la nouvelle quantité d'un objet de l'inventaire (0 : plus aucun) ;
+- END : la session est finie (victoire ou défaite), elle ne sera pas reprise.
+
+Une sauvegarde est un seul write() sur un fichier non bufferisé (pas de
+fsync) : quelques microsecondes, assez peu pour en faire une à chaque tour.
+Un dernier enregistrement tronqué par un arrêt brutal est ignoré à la
+lecture, et retiré du fichier avant que la session reprise n'y ajoute les
+siens. Les tirages aléatoires ne sont pas sauvegardés : la partie reprise
+continue avec de nouveaux tirages.
+"""
+import struct
+
+from base import Hero, Weapon, HealPotion
+from exploration import ExplorationZone
+from game import run_exploration
+
+MAGIC = b"RPGC"
+VERSION = 2  # 2 : noms précédés d'une longueur sur 2 octets
+STATE, PATH, ITEM, END = 0, 1, 2, 3
+ITEM_CLASSES = (Weapon, HealPotion)  # Indice = code de l'objet dans le fichier
+_HEADER = struct.Struct("<4sBH")
+_RECORD = struct.Struct("<BH")
+_STATE = struct.Struct("<7i2H")
+_ITEM = struct.Struct("<BiH")
+_END = struct.Struct("<?")
+_LENGTH = struct.Struct("<H")
+
+
+class CheckpointError(Exception):
+    """Le fichier n'est pas un checkpoint lisible"""
+
+
+def _item_key(item):
+    return (type(item), item.name, item.damage if isinstance(item, Weapon) else item.value)
+
+
+def _item_counts(inventory):
+    counts = {}
+    for item, count in inventory.stacks():
+        key = _item_key(item)
+        counts[key] = counts.get(key, 0) + count
+    return counts
+
+
+def _string(text):
+    data = text.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError(f"Nom trop long pour un checkpoint ({len(data)} octets) : {text[:32]}...")
+    return _LENGTH.pack(len(data)) + data
+
+
+class Checkpoint:
+    """Écrit les checkpoints d'une session dans `path`, en n'ajoutant que les différences"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._state = None  # Dernier STATE écrit
+        self._paths = 0  # Chemins de paths_history déjà écrits
+        self._items = {}  # Clé d'objet -> quantité écrite
+
+    @classmethod
+    def resume(cls, path, state):
+        """Checkpoint qui complète le fichier d'une session chargée (voir load)"""
+        checkpoint = cls(path)
+        checkpoint._file = open(path, "r+b", buffering=0)
+        checkpoint._file.truncate(state.size)  # Enregistrement tronqué retiré : les suivants restent lisibles
+        checkpoint._file.seek(state.size)
+        checkpoint._state = state.stats + (state.current_stage, state.battles_won)
+        checkpoint._paths = len(state.paths_history)
+        checkpoint._items = dict(state.items)
+        return checkpoint
+
+    def save(self, zone, battles_won=0):
+        """Ajoute au fichier ce qui a changé depuis la dernière sauvegarde"""
+        hero = zone.hero
+        out = bytearray()
+        if self._file is None:
+            self._file = open(self.path, "wb", buffering=0)
+            out += _HEADER.pack(MAGIC, VERSION, zone.num_stages) + _string(zone.name)
+            out += _string(hero.name) + _string(hero.type)
+
+        upgrades = hero.upgrades
+        state = (hero._pv, hero._max_pv, hero.damage, hero.exp, upgrades["pv"], upgrades["damage"], hero.speed,
+                 zone.current_stage, battles_won)
+        if state != self._state:
+            out += _RECORD.pack(STATE, _STATE.size) + _STATE.pack(*state)
+            self._state = state
+
+        history = zone.paths_history
+        for name in history[self._paths:]:
+            data = name.encode("utf-8")
+            out += _RECORD.pack(PATH, len(data)) + data
+        self._paths = len(history)
+
+        counts = _item_counts(hero.inventory)
+        if counts != self._items:
+            for key in self._items.keys() | counts.keys():
+                count = counts.get(key, 0)
+                if self._items.get(key) != count:
+                    item_class, name, value = key
+                    data = name.encode("utf-8")
+                    out += _RECORD.pack(ITEM, _ITEM.size + len(data))
+                    out += _ITEM.pack(ITEM_CLASSES.index(item_class), value, count) + data
+            self._items = counts
+
+        if out:
+            self._file.write(out)
+
+    def end(self, won):
+        """Marque la session comme finie : resume_exploration ne la rejouera pas"""
+        if self._file is not None:
+            self._file.write(_RECORD.pack(END, _END.size) + _END.pack(won))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CheckpointState:
+    """Dernier état d'une session, reconstitué depuis son fichier de checkpoints"""
+    __slots__ = ("num_stages", "zone_name", "hero_name", "hero_type", "stats", "current_stage", "battles_won",
+                 "paths_history", "items", "ended", "size")
+
+    def build_hero(self, policy=None, bus=None):
+        pv, max_pv, damage, exp, upgrade_pv, upgrade_damage, speed = self.stats
+        hero = Hero(self.hero_name, self.hero_type, max_pv, damage, policy)
+        hero._pv = pv
+        hero.exp = exp
+        hero.upgrades.update(pv=upgrade_pv, damage=upgrade_damage)
+        hero.speed = speed
+        for (item_class, name, value), count in self.items.items():
+            for _ in range(count):
+                hero.inventory.append(item_class(name, value))
+        hero.bus = bus
+        return hero
+
+    def build_zone(self, hero):
+        zone = ExplorationZone(self.zone_name, hero, self.num_stages)
+        zone.current_stage = self.current_stage
+        zone.paths_history = list(self.paths_history)
+        return zone
+
+
+def load(path):
+    """Relit un fichier de checkpoints et retourne le dernier état (CheckpointState)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise CheckpointError("Not a checkpoint file")
+    magic, version, num_stages = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise CheckpointError("Not a checkpoint file (or unsupported version)")
+
+    state = CheckpointState()
+    state.num_stages = num_stages
+    offset = _HEADER.size
+    names = []
+    for _ in range(3):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        names.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+    state.zone_name, state.hero_name, state.hero_type = names
+    state.stats = None
+    state.paths_history = []
+    state.items = {}
+    state.ended = None  # True / False : session finie par une victoire / une défaite
+
+    end = len(data)
+    while offset + _RECORD.size <= end:
+        kind, length = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        if start + length > end:
+            break  # Enregistrement interrompu par un arrêt brutal
+        if kind == STATE:
+            values = _STATE.unpack_from(data, start)
+            state.stats, state.current_stage, state.battles_won = values[:7], values[7], values[8]
+        elif kind == PATH:
+            state.paths_history.append(data[start:start + length].decode("utf-8"))
+        elif kind == ITEM:
+            code, value, count = _ITEM.unpack_from(data, start)
+            key = (ITEM_CLASSES[code], data[start + _ITEM.size:start + length].decode("utf-8"), value)
+            if count:
+                state.items[key] = count
+            else:
+                state.items.pop(key, None)
+        elif kind == END:
+            state.ended = _END.unpack_from(data, start)[0]
+        else:
+            raise CheckpointError(f"Unknown record type {kind} at byte {offset}")
+        offset = start + length
+    state.size = offset  # Fin du dernier enregistrement complet
+    if state.stats is None:
+        raise CheckpointError("Checkpoint file has no saved state")
+    return state
+
+
+def resume_exploration(path, policy=None, bus=None):
+    """Reprend une session depuis son dernier checkpoint, retourne (résultat de run_exploration, héros)
+
+    Le résultat est None si la session était déjà finie : rien n'est rejoué.
+    """
+    state = load(path)
+    hero = state.build_hero(policy, bus)
+    zone = state.build_zone(hero)
+    if state.ended is not None or zone.is_complete():
+        return None, hero
+    with Checkpoint.resume(path, state) as checkpoint:
+        result = run_exploration(hero, checkpoint=checkpoint, zone=zone, battles_won=state.battles_won)
+    return result, hero
@@ -0,0 +1,72 @@
+"""Client du serveur de parties : joue des sessions à la place de joueurs humains.
+
+    python -m client --sessions 1000 --port 8765
+    python -m client --unix /tmp/rpg.sock --sessions 10
+
+Chaque session répond aux questions comme RandomPolicy (deux fois sur trois
+une attaque, sinon un soin ; les autres choix au hasard).
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+
+async def play_session(name, host="127.0.0.1", port=8765, path=None, stages=10, seed=None, rng=None):
+    """Joue une session jusqu'au bout, retourne (message de fin, nombre de questions)"""
+    rng = rng or random.Random(seed)
+    if path:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write(json.dumps({"type": "start", "name": name, "stages": stages, "seed": seed}).encode() + b"\n")
+    prompts = 0
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return None, prompts
+            message = json.loads(line)
+            if message["type"] in ("end", "error"):
+                return message, prompts
+            if message["type"] == "prompt":
+                prompts += 1
+                if message["kind"] == "action":
+                    choice = message["choices"].index(rng.choice(["attack", "attack", "heal"]))
+                else:
+                    choice = rng.randrange(len(message["choices"]))
+                writer.write(json.dumps({"type": "answer", "choice": choice}).encode() + b"\n")
+    finally:
+        writer.close()
+
+
+async def play_sessions(count, **options):
+    """Lance `count` sessions simultanées, retourne la liste de leurs résultats"""
+    return await asyncio.gather(*(play_session(f"Player{i}", seed=i, **options) for i in range(count)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sessions jouées contre le serveur de parties")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="chemin du socket Unix du serveur")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--stages", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = asyncio.run(play_sessions(args.sessions, host=args.host, port=args.port, path=args.unix,
+                                        stages=args.stages))
+    elapsed = time.perf_counter() - start
+    ended = [end for end, prompts in results if end and end["type"] == "end"]
+    won = sum(end["won"] for end in ended)
+    prompts = sum(prompts for end, prompts in results)
+    print(f"{len(ended)}/{args.sessions} sessions ended ({won} won) in {elapsed:.2f}s | "
+          f"{prompts:,} answers ({prompts / elapsed:,.0f}/s)")
+    return 0 if len(ended) == args.sessions else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
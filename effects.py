@@ -0,0 +1,188 @@
+"""Effets d'état des combats : poison, régénération, étourdissement, bonus temporaires.
+
+Un effet dure `duration` tours après celui où il est posé et agit (tick)
+tous les `period` tours pendant cette durée ; un effet sans période n'agit
+qu'en commençant et en finissant (étourdissement, bonus).
+
+Les échéances (prochain tick, fin) sont rangées dans une roue temporelle
+(EffectWheel) indexée par le numéro de tour de game.resolve_battle et de
+army.resolve_army_battle. Chaque équipe a sa roue, créée au premier effet
+posé sur l'un de ses membres (Character.apply_effect) : un combat sans
+effet n'en alloue aucune. La case `tour % WHEEL_SIZE` contient ce qui
+arrive à ce tour, advance(tour) ne parcourt que cette case. Le coût d'un
+tour est donc proportionnel aux effets qui agissent, pas au nombre d'effets
+en cours. Une échéance à plus de WHEEL_SIZE tours reste dans sa case jusqu'à
+son tour (elle est revue une fois par tour de roue).
+
+Un effet retiré (cancel) ou dont la cible est morte est écarté quand son
+échéance arrive. En fin de combat, clear() termine les effets en cours
+(bonus retirés, étourdissements levés).
+"""
+WHEEL_SIZE = 64  # Cases de la roue : une par tour, sur 64 tours
+BUFF_STATS = ("damage", "speed")  # Attributs qu'un Buff peut modifier puis rendre tels quels
+
+
+class Effect:
+    """Effet d'état ; les sous-classes redéfinissent start, tick et end"""
+    __slots__ = ("duration", "period", "target", "next_tick", "ends", "active")
+    name = "effect"
+
+    def __init__(self, duration, period=0):
+        if duration < 1 or period < 0:
+            raise ValueError("Un effet dure au moins un tour et sa période est positive")
+        self.duration = duration
+        self.period = period
+        self.target = None
+        self.next_tick = self.ends = 0
+        self.active = False
+
+    def start(self, target):
+        pass
+
+    def tick(self, target):
+        pass
+
+    def end(self, target):
+        pass
+
+
+class Poison(Effect):
+    __slots__ = ("damage",)
+    name = "poison"
+
+    def __init__(self, damage, duration, period=1):
+        super().__init__(duration, period)
+        self.damage = damage
+
+    def tick(self, target):
+        target.take_damage(self.damage)
+
+
+class Regeneration(Effect):
+    __slots__ = ("amount",)
+    name = "regeneration"
+
+    def __init__(self, amount, duration, period=1):
+        super().__init__(duration, period)
+        self.amount = amount
+
+    def tick(self, target):
+        target.heal(self.amount)
+
+
+class Stun(Effect):
+    """Le personnage passe ses tours tant que l'effet dure"""
+    __slots__ = ()
+    name = "stun"
+
+    def start(self, target):
+        target.stunned += 1
+
+    def end(self, target):
+        target.stunned -= 1
+
+
+class Buff(Effect):
+    """Bonus (ou malus si amount < 0) de dégâts ou de vitesse (BUFF_STATS), retiré à la fin"""
+    __slots__ = ("stat", "amount")
+    name = "buff"
+
+    def __init__(self, amount, duration, stat="damage"):
+        if stat not in BUFF_STATS:
+            raise ValueError(f"Un bonus temporaire ne modifie que {', '.join(BUFF_STATS)}, pas {stat}")
+        super().__init__(duration)
+        self.stat = stat
+        self.amount = amount
+
+    def start(self, target):
+        setattr(target, self.stat, getattr(target, self.stat) + self.amount)
+
+    def end(self, target):
+        setattr(target, self.stat, getattr(target, self.stat) - self.amount)
+
+
+class EffectWheel:
+    """Roue temporelle des effets d'un combat, avancée d'une case par tour"""
+    __slots__ = ("turn", "_slots", "_active")
+
+    def __init__(self, turn=0):
+        self.turn = turn
+        self._slots = [None] * WHEEL_SIZE  # Case -> [(tour, effet)], créée au premier effet
+        self._active = set()
+
+    def __len__(self):
+        return len(self._active)
+
+    def apply(self, character, effect):
+        """Pose `effect` sur `character` au tour en cours"""
+        if effect.target is not None:
+            raise ValueError(f"L'effet {effect.name} a déjà été posé (un effet ne sert qu'une fois)")
+        effect.target = character
+        effect.active = True
+        effect.ends = self.turn + effect.duration + 1  # Levé au début du tour qui suit sa durée
+        self._active.add(effect)
+        effect.start(character)
+        if character.wants("effect_start"):
+            character.notify_observers("effect_start", effect)
+        if effect.period:
+            effect.next_tick = self.turn + effect.period
+            self._schedule(min(effect.next_tick, effect.ends), effect)
+        else:
+            self._schedule(effect.ends, effect)
+
+    def cancel(self, effect):
+        """Termine l'effet tout de suite ; son échéance sera écartée"""
+        if effect.active:
+            self._finish(effect)
+
+    def _schedule(self, turn, effect):
+        index = turn % WHEEL_SIZE
+        bucket = self._slots[index]
+        if bucket is None:
+            self._slots[index] = [(turn, effect)]
+        else:
+            bucket.append((turn, effect))
+
+    def _finish(self, effect):
+        effect.active = False
+        self._active.discard(effect)
+        target = effect.target
+        effect.end(target)
+        if target.wants("effect_end"):
+            target.notify_observers("effect_end", effect)
+
+    def advance(self, turn):
+        """Début du tour `turn` : ticks et fins d'effets prévus à ce tour"""
+        self.turn = turn
+        slots = self._slots
+        index = turn % WHEEL_SIZE
+        bucket = slots[index]
+        if not bucket:
+            return
+        slots[index] = None  # Les échéances replanifiées à ce même index repartent d'une case vide
+        for entry in bucket:
+            when, effect = entry
+            if when != turn:
+                self._schedule(when, effect)  # Un tour de roue plus tard
+                continue
+            if not effect.active:
+                continue  # Annulé
+            target = effect.target
+            if target._pv <= 0:
+                self._finish(effect)  # Les morts perdent leurs effets
+                continue
+            period = effect.period
+            ends = effect.ends
+            if period and turn == effect.next_tick and turn < ends:
+                effect.tick(target)
+                effect.next_tick += period
+            if turn >= ends or target._pv <= 0:
+                self._finish(effect)
+            else:
+                self._schedule(min(effect.next_tick, ends) if period else ends, effect)
+
+    def clear(self):
+        """Fin du combat : termine tous les effets en cours"""
+        for effect in list(self._active):
+            self._finish(effect)
+        self._slots = [None] * WHEEL_SIZE
@@ -0,0 +1,64 @@
+class EventBus:
+    """Bus d'événements indexé par type d'événement.
+
+    Chaque type a son propre tuple d'abonnés : la recherche est en O(1) et un
+    événement sans abonné ne coûte qu'une recherche dans un dict. Les émetteurs
+    testent `wants(event_type)` avant de construire des données coûteuses.
+    Les handlers ont la signature de Observer.notify : (subject, event_type, data).
+
+    shared=True marque un bus commun à tout le processus (observer.GAME_BUS) :
+    Character.add_observer ne l'étend pas, il en copie les abonnés sur un bus
+    propre au personnage.
+    """
+    __slots__ = ("_handlers", "handlers_for", "observers", "shared")
+
+    def __init__(self, shared=False):
+        self._handlers = {}
+        # handlers_for(event_type) : tuple des abonnés, None sans abonné. C'est le get du
+        # dict (modifié sur place, jamais remplacé) : aucun appel Python sur le chemin chaud
+        self.handlers_for = self._handlers.get
+        self.observers = ()
+        self.shared = shared
+
+    def copy(self):
+        """Bus non partagé avec les mêmes abonnés"""
+        bus = EventBus()
+        bus._handlers.update(self._handlers)
+        bus.observers = self.observers
+        return bus
+
+    def subscribe(self, event_type, handler):
+        handlers = self._handlers.get(event_type, ())
+        if handler not in handlers:
+            self._handlers[event_type] = handlers + (handler,)
+
+    def unsubscribe(self, event_type, handler):
+        handlers = tuple(h for h in self._handlers.get(event_type, ()) if h != handler)
+        if handlers:
+            self._handlers[event_type] = handlers
+        else:
+            self._handlers.pop(event_type, None)
+
+    def wants(self, event_type):
+        return event_type in self._handlers
+
+    def emit(self, subject, event_type, data=None):
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            for handler in handlers:
+                handler(subject, event_type, data)
+
+    def attach(self, observer):
+        """Abonne un Observer à chacun des types d'événements qu'il écoute"""
+        if observer in self.observers:
+            return
+        self.observers = self.observers + (observer,)
+        for event_type in observer.events:
+            self.subscribe(event_type, observer.handler(event_type))
+
+    def detach(self, observer):
+        if observer not in self.observers:
+            return
+        self.observers = tuple(o for o in self.observers if o is not observer)
+        for event_type in observer.events:
+            self.unsubscribe(event_type, observer.handler(event_type))
@@ -1,11 +1,112 @@
+"""Zones d'exploration.
+
+Les stages d'une zone sont produits par un générateur paresseux
+(generate_stages) : chaque stage est une liste de chemins dont l'événement,
+et sa valeur, sont tirés dès la génération. Un outil peut donc prévisualiser
+ou analyser une zone avant de la jouer, et parcourir des milliers de stages
+en mémoire constante puisque rien n'est gardé d'un stage à l'autre.
+ExplorationZone consomme ce flux au fur et à mesure de la partie.
+"""
 import random
-from questionary import select
+from itertools import count as _count
+from time import perf_counter
+
 from factories import EnemyFactory, WeaponFactory, BossFactory
 from base import HealPotion
+from rng import streams
+from sampling import AliasTable
+
+# Probabilités des événements selon la difficulté (poids relatifs)
+EVENT_WEIGHTS = {
+    "easy": {"exp": 0.35, "heal": 0.15, "weapon": 0.25, "combat": 0.15, "potion": 0.3},
+    "hard": {"combat": 0.5, "weapon": 0.3, "exp": 0.2, "potion": 0.3},
+    "normal": {"combat": 0.3, "weapon": 0.25, "exp": 0.25, "heal": 0.1, "potion": 0.3},
+}
+# Tables précalculées, reconstruites par set_event_weights
+EVENT_TABLES = {difficulty: AliasTable.from_dict(weights) for difficulty, weights in EVENT_WEIGHTS.items()}
+
+# Bornes des valeurs tirées pour les événements "exp", "heal" et "potion"
+EXP_MIN, EXP_MAX = 15, 30
+HEAL_MIN, HEAL_MAX = 20, 40
+POTION_MIN, POTION_MAX = 25, 50
+
+# (nom, dégâts min, dégâts max) des armes trouvées sur les chemins
+WEAPON_TABLE = [
+    ("Magic Blade", 25, 35),
+    ("Flaming Sword", 28, 38),
+    ("Ice Staff", 22, 32),
+    ("Thunder Axe", 30, 40),
+    ("Shadow Dagger", 20, 30),
+    ("Holy Mace", 26, 36),
+    ("Poison Spear", 24, 34),
+    ("Crystal Bow", 27, 37),
+]
+
+PATH_TEMPLATES = [
+    ("Dark Forest", "A gloomy path through ancient trees", "normal"),
+    ("Mountain Pass", "A treacherous climb up rocky slopes", "hard"),
+    ("Riverside Trail", "A peaceful path along a flowing river", "easy"),
+    ("Abandoned Mine", "A dark tunnel full of mysteries", "hard"),
+    ("Meadow Path", "A sunny trail through open fields", "easy"),
+    ("Ancient Ruins", "Crumbling stones of a forgotten civilization", "normal"),
+    ("Cave System", "A network of dark underground passages", "hard"),
+    ("Village Road", "A well-traveled path near settlements", "easy"),
+]
+
+
+def set_event_weights(difficulty, weights):
+    """Remplace les poids des événements d'une difficulté (équilibrage)"""
+    EVENT_WEIGHTS[difficulty] = dict(weights)
+    EVENT_TABLES[difficulty] = AliasTable.from_dict(weights)
+
+
+def event_table(difficulty):
+    """Table de tirage des événements, "normal" pour une difficulté inconnue"""
+    return EVENT_TABLES.get(difficulty, EVENT_TABLES["normal"])
+
+
+def roll_event(difficulty, rng=None):
+    """Tire l'événement d'un chemin et sa valeur (EXP, soin, arme, potion ; None pour un combat)"""
+    rng = streams.events if rng is None else rng
+    event_type = event_table(difficulty).sample(rng)
+    if event_type == "exp":
+        value = rng.randint(EXP_MIN, EXP_MAX)
+    elif event_type == "heal":
+        value = rng.randint(HEAL_MIN, HEAL_MAX)
+    elif event_type == "potion":
+        value = rng.randint(POTION_MIN, POTION_MAX)
+    elif event_type == "weapon":
+        name, min_dmg, max_dmg = rng.choice(WEAPON_TABLE)
+        value = WeaponFactory().create_weapon(name, rng.randint(min_dmg, max_dmg))
+    else:
+        value = None  # L'ennemi dépend de l'EXP du héros au moment du combat
+    return PathEvent(event_type, value)
+
+
+def generate_stages(rng=None, count=None):
+    """Flux des stages d'une zone (`count` stages, sans fin si None) : listes de 2 à 4 chemins déjà tirés"""
+    rng = streams.events if rng is None else rng
+    stages = _count() if count is None else range(count)
+    sample, randint = rng.sample, rng.randint
+    for _ in stages:
+        num_paths = randint(2, 4)
+        paths = []
+        for name, description, difficulty in sample(PATH_TEMPLATES, min(num_paths, len(PATH_TEMPLATES))):
+            path = Path(name, description, difficulty)
+            path.event = roll_event(difficulty, rng)
+            paths.append(path)
+        yield paths
+
+
+def generate_events(difficulty, count):
+    """Tire `count` événements d'un chemin de difficulté `difficulty` en un appel"""
+    return [PathEvent(event_type) for event_type in event_table(difficulty).sample_many(streams.events, count)]
 
 
 class PathEvent:
     """Représente un événement aléatoire sur un chemin"""
+    __slots__ = ("event_type", "value")
+
     def __init__(self, event_type, value=None):
         self.event_type = event_type  # "combat", "exp", "weapon", "heal"
         self.value = value
@@ -13,55 +114,43 @@ class PathEvent:
     def execute(self, hero, event_callback=None):
         """Exécute l'événement et retourne (needs_combat, enemy) si un combat doit avoir lieu"""
         if self.event_type == "combat":
-            print("\n⚔️  You encounter an enemy on this path!")
-            enemy = EnemyFactory().create_enemy(hero)
+            hero.notify_observers("path_combat", None)
+            enemy = EnemyFactory(hero.bus).create_enemy(hero)
             if event_callback:
                 return event_callback("combat", enemy)
             return (True, enemy)
         
         elif self.event_type == "exp":
-            exp_gain = self.value or random.randint(15, 30)
-            before_level = hero.get_xp_level()
-            hero.exp += exp_gain
-            print(f"\n✨ You found a magical artifact! +{exp_gain} EXP! Total: {hero.exp}")
-            if hero.get_xp_level() > before_level:
-                hero.level_up()
+            exp_gain = self.value or streams.events.randint(EXP_MIN, EXP_MAX)
+            hero.gain_exp(exp_gain, "artifact_found")
         
         elif self.event_type == "weapon":
             if self.value:
                 weapon = self.value
             else:
                 # Générer une arme avec un nom aléatoire et des dégâts variés
-                weapon_names = [
-                    ("Magic Blade", 25, 35),
-                    ("Flaming Sword", 28, 38),
-                    ("Ice Staff", 22, 32),
-                    ("Thunder Axe", 30, 40),
-                    ("Shadow Dagger", 20, 30),
-                    ("Holy Mace", 26, 36),
-                    ("Poison Spear", 24, 34),
-                    ("Crystal Bow", 27, 37)
-                ]
-                name, min_dmg, max_dmg = random.choice(weapon_names)
-                weapon = WeaponFactory().create_weapon(name, random.randint(min_dmg, max_dmg))
+                name, min_dmg, max_dmg = streams.events.choice(WEAPON_TABLE)
+                weapon = WeaponFactory().create_weapon(name, streams.events.randint(min_dmg, max_dmg))
             hero.inventory.append(weapon)
-            print(f"\n🗡️  You found a {weapon.name}! ({weapon.damage} DMG)")
+            hero.notify_observers("weapon_found", weapon)
         
         elif self.event_type == "heal":
-            heal_amount = self.value or random.randint(20, 40)
+            heal_amount = self.value or streams.events.randint(HEAL_MIN, HEAL_MAX)
             hero.heal(heal_amount)
         
         elif self.event_type == "potion":
-            potion_value = self.value or random.randint(25, 50)
+            potion_value = self.value or streams.events.randint(POTION_MIN, POTION_MAX)
             potion = HealPotion("Health Potion", potion_value)
             hero.inventory.append(potion)
-            print(f"\n🧪 You found a {potion.name}! (Heals {potion_value} HP)")
+            hero.notify_observers("potion_found", potion)
         
         return False
 
 
 class Path:
     """Représente un chemin d'exploration"""
+    __slots__ = ("name", "description", "difficulty", "event")
+
     def __init__(self, name, description, difficulty="normal"):
         self.name = name
         self.description = description
@@ -69,21 +158,9 @@ class Path:
         self.event = None
     
     def generate_event(self):
-        """Génère un événement aléatoire basé sur la difficulté"""
-        # Probabilités selon la difficulté
-        if self.difficulty == "easy":
-            weights = {"exp": 0.35, "heal": 0.15, "weapon": 0.25, "combat": 0.15, "potion": 0.3}
-        elif self.difficulty == "hard":
-            weights = {"combat": 0.5, "weapon": 0.3, "exp": 0.2, "potion": 0.3}
-        else:  # normal
-            weights = {"combat": 0.3, "weapon": 0.25, "exp": 0.25, "heal": 0.1, "potion": 0.3}
-        
-        event_type = random.choices(
-            list(weights.keys()),
-            weights=list(weights.values())
-        )[0]
-        
-        self.event = PathEvent(event_type)
+        """Événement du chemin, tiré selon la difficulté s'il ne l'a pas été à la génération"""
+        if self.event is None:
+            self.event = PathEvent(event_table(self.difficulty).sample(streams.events))
         return self.event
     
     def __str__(self):
@@ -97,56 +174,42 @@ class Path:
 
 class ExplorationZone:
     """Représente une zone d'exploration complète"""
-    def __init__(self, name, hero, num_stages=3):
+    def __init__(self, name, hero, num_stages=3, seed=None):
         self.name = name
         self.hero = hero
         self.num_stages = num_stages
         self.current_stage = 0
         self.paths_history = []
+        # Avec une graine, la zone ne dépend que d'elle (sinon : flux streams.events)
+        self.stages = generate_stages(None if seed is None else random.Random(seed))
     
     def generate_paths(self):
-        """Génère 2-4 chemins aléatoires"""
-        num_paths = random.randint(2, 4)
-        
-        path_templates = [
-            ("Dark Forest", "A gloomy path through ancient trees", "normal"),
-            ("Mountain Pass", "A treacherous climb up rocky slopes", "hard"),
-            ("Riverside Trail", "A peaceful path along a flowing river", "easy"),
-            ("Abandoned Mine", "A dark tunnel full of mysteries", "hard"),
-            ("Meadow Path", "A sunny trail through open fields", "easy"),
-            ("Ancient Ruins", "Crumbling stones of a forgotten civilization", "normal"),
-            ("Cave System", "A network of dark underground passages", "hard"),
-            ("Village Road", "A well-traveled path near settlements", "easy"),
-        ]
-        
-        selected = random.sample(path_templates, min(num_paths, len(path_templates)))
-        paths = [Path(name, desc, diff) for name, desc, diff in selected]
-        
-        return paths
+        """Chemins (2 à 4) du prochain stage du flux"""
+        return next(self.stages)
     
     def explore_stage(self, combat_callback=None):
         """Explore un étage de la zone"""
+        if not self.hero.wants("explore_stage_time"):
+            return self._explore_stage(combat_callback)
+        start = perf_counter()
+        result = self._explore_stage(combat_callback)
+        self.hero.notify_observers("explore_stage_time", perf_counter() - start)
+        return result
+
+    def _explore_stage(self, combat_callback=None):
         self.current_stage += 1
         
         # Si on a dépassé le nombre de stages, c'est le boss
         if self.current_stage > self.num_stages:
             return self._boss_fight(combat_callback)
         
-        print(f"\n{'='*60}")
-        print(f"🗺️  EXPLORATION - Stage {self.current_stage}/{self.num_stages}")
-        print(f"   Zone: {self.name}")
-        print(f"{'='*60}\n")
+        self.hero.notify_observers("stage_start", self)
         
         paths = self.generate_paths()
-        
-        print("Available paths:\n")
-        path_choices = [str(path) for path in paths]
-        choice = select("Choose your path:", choices=path_choices).ask()
-        
-        chosen_path = paths[path_choices.index(choice)]
+        chosen_path = self.hero.policy.choose_path(self.hero, paths)
         self.paths_history.append(chosen_path.name)
         
-        print(f"\n🚶 You take the {chosen_path.name}...")
+        self.hero.notify_observers("path_taken", chosen_path)
         event = chosen_path.generate_event()
         
         # Exécute l'événement
@@ -159,15 +222,8 @@ class ExplorationZone:
     
     def _boss_fight(self, combat_callback=None):
         """Combat de boss final"""
-        print(f"\n{'='*60}")
-        print("👑 BOSS FIGHT!")
-        print(f"{'='*60}\n")
-        
-        boss = BossFactory().create_boss(self.hero)
-        
-        print(f"💀 {boss.name} appears!")
-        print(f"   HP: {boss.max_pv} | DMG: {boss.damage} | EXP: {boss.exp}")
-        print("\n⚠️  This will be a legendary battle!\n")
+        boss = BossFactory(self.hero.bus).create_boss(self.hero)
+        boss.notify_observers("boss_appears", None)
         
         if combat_callback:
             return combat_callback("boss", boss)
@@ -1,49 +1,94 @@
 from base import Hero, Enemy, Boss, Weapon
-import random
-from observer import GameObserver
+from observer import GAME_BUS
+from pool import ENEMY_POOL
+from rng import streams
 
 class HeroFactory:
-    def create_character(self, name):
+    def __init__(self, bus=GAME_BUS):
+        self.bus = bus  # None : personnages sans observateur (simulation)
+
+    def create_character(self, name, policy=None):
         starting_weapon = WeaponFactory().create_weapon("Iron Sword", 18)
-        hero = Hero(name, "warrior", 80, 15)
+        hero = Hero(name, "warrior", 80, 15, policy)
         hero.inventory.append(starting_weapon)
-        hero.add_observer(GameObserver())
+        hero.bus = self.bus
         return hero
 
 class WeaponFactory:
     def create_weapon(self, name, damage):
         return Weapon(name, damage)
-    
+
+class EnemyTemplate:
+    """Données immuables d'un modèle d'ennemi (nom, type, statistiques de base), partagées par ses ennemis"""
+    __slots__ = ("name", "type", "base_pv", "pv_per_exp", "damage_min", "damage_max")
+
+    def __init__(self, name, type, base_pv, pv_per_exp, damage_min, damage_max):
+        self.name = name
+        self.type = type
+        self.base_pv = base_pv
+        self.pv_per_exp = pv_per_exp
+        self.damage_min = damage_min
+        self.damage_max = damage_max
+
+    def pv(self, exp):
+        return self.base_pv + exp // self.pv_per_exp
+
 class EnemyFactory:
+    NAMES = ("Bandit", "Wolf", "Spider", "Skeleton", "Goblin")
+    TYPES = ("warrior", "beast", "undead", "monster")
+    BASE_PV = 80  # PV d'un ennemi sans EXP, plus 1 PV par PV_PER_EXP points d'EXP
+    PV_PER_EXP = 15
+    DAMAGE_MIN, DAMAGE_MAX = 12, 18
+
+    _templates = {}  # (nom, type, statistiques) -> EnemyTemplate
+
+    def __init__(self, bus=GAME_BUS, pool=ENEMY_POOL):
+        self.bus = bus  # None : personnages sans observateur (simulation)
+        self.pool = pool  # None : un nouvel ennemi à chaque fois
+
+    def template(self, name, enemy_type):
+        """Modèle partagé ; les statistiques en font partie pour suivre les réglages (tuning.py)"""
+        key = (name, enemy_type, self.BASE_PV, self.PV_PER_EXP, self.DAMAGE_MIN, self.DAMAGE_MAX)
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = EnemyTemplate(*key)
+        return template
+
     def create_enemy(self, hero):
-        enemy_names = ["Bandit", "Wolf", "Spider", "Skeleton", "Goblin"]
-        enemy_types = ["warrior", "beast", "undead", "monster"]
-        
-        name = random.choice(enemy_names)
-        enemy_type = random.choice(enemy_types)
-        exp_multiplier = random.uniform(0.7, 1.0)
+        template = self.template(streams.factory.choice(self.NAMES), streams.factory.choice(self.TYPES))
+        exp_multiplier = streams.factory.uniform(0.7, 1.0)
         enemy_exp = int(hero.exp * exp_multiplier)
-        
-        pv = 80 + (enemy_exp // 15)
-        damage = random.randint(12, 18)
-        
-        enemy = Enemy(name, enemy_type, pv, damage, enemy_exp)
-        enemy.add_observer(GameObserver())
-        
-        if random.random() > 0.6:
-            enemy.inventory.append(WeaponFactory().create_weapon("Rusty Sword", random.randint(15, 20)))
-        
-        print(f"\n{'='*50}")
-        print(f"👹 A wild {name} ({enemy_type}) appears!")
-        print(f"   HP: {pv} | DMG: {damage} | EXP: {enemy_exp} | Speed: {enemy.speed}")
-        print(f"{'='*50}")
-        
+        damage = streams.factory.randint(template.damage_min, template.damage_max)
+
+        args = (template.name, template.type, template.pv(enemy_exp), damage, enemy_exp)
+        enemy = self.pool.acquire(Enemy, *args) if self.pool is not None else Enemy(*args)
+        enemy.bus = self.bus
+
+        if streams.factory.random() > 0.6:
+            enemy.inventory.append(Weapon.shared("Rusty Sword", streams.factory.randint(15, 20)))
+
+        enemy.notify_observers("enemy_appears", None)
+
         return enemy
 
+    def create_enemies(self, hero, count):
+        """Crée `count` ennemis d'un coup (même suite de tirages que `count` appels à create_enemy)"""
+        return [self.create_enemy(hero) for _ in range(count)]
+
+    def release(self, *enemies):
+        """Rend au pool les ennemis (et boss) d'un combat terminé"""
+        if self.pool is not None:
+            self.pool.release(*enemies)
+
 class BossFactory:
+    NAMES = ("Demon Lord", "Ancient Dragon", "Lich King", "Dark Sorcerer", "Giant Troll")
+
+    def __init__(self, bus=GAME_BUS, pool=ENEMY_POOL):
+        self.bus = bus  # None : personnages sans observateur (simulation)
+        self.pool = pool
+
     def create_boss(self, hero):
-        boss_names = ["Demon Lord", "Ancient Dragon", "Lich King", "Dark Sorcerer", "Giant Troll"]
-        boss_name = random.choice(boss_names)   
-        boss = Boss(boss_name, hero)
-        boss.add_observer(GameObserver())
-        return boss
\ No newline at end of file
+        boss_name = streams.factory.choice(self.NAMES)
+        boss = self.pool.acquire(Boss, boss_name, hero) if self.pool is not None else Boss(boss_name, hero)
+        boss.bus = self.bus
+        return boss
@@ -0,0 +1,175 @@
+from itertools import count
+from time import perf_counter
+
+from base import Hero, Boss, Team, Weapon
+from exploration import ExplorationZone
+from factories import EnemyFactory
+from rng import streams
+from scheduler import InitiativeScheduler
+
+TIMING_SAMPLE = 32  # Un combat sur 32 est chronométré ("perform_turn_time", "play_game_time")
+_play_clock = count()  # Combats de play_game
+_resolve_clock = count()  # Combats lancés directement par resolve_battle
+
+ZONE_NAMES = ["Cursed Forest", "Dragon's Lair", "Undead Catacombs", "Frozen Peaks", "Shadow Realm"]
+
+
+def resolve_battle(hero_team, enemy_team, max_turns=None, weighted=False, timed=None):
+    """Boucle de combat par ordre de vitesse, retourne le nombre de tours joués
+
+    weighted=True : initiative pondérée par la vitesse (voir scheduler.py).
+    timed=True : émet la durée de chaque action ("perform_turn_time") ; par
+    défaut, un combat sur TIMING_SAMPLE quand un observateur l'écoute.
+    Les effets d'état (effects.py) posés pendant le combat avancent au début
+    de chaque tour et sont terminés à la fin du combat.
+    """
+    scheduler = InitiativeScheduler(hero_team.members + enemy_team.members, weighted)
+    hero = hero_team.members[0]
+    if timed is None:
+        timed = next(_resolve_clock) % TIMING_SAMPLE == 0 and hero.wants("perform_turn_time")
+    turn = 0
+    hero_team.start_turn(turn)
+    enemy_team.start_turn(turn)
+
+    try:
+        while not hero_team.is_defeated() and not enemy_team.is_defeated():
+            if max_turns is not None and turn >= max_turns:
+                break
+            turn += 1
+            hero.notify_observers("turn_start", turn)
+            hero_team.start_turn(turn)
+            enemy_team.start_turn(turn)
+            for character in scheduler.round(turn):
+                if character._pv <= 0:
+                    continue
+                targets = enemy_team.get_alive_members() if isinstance(character, Hero) else hero_team.get_alive_members()
+                if not targets:
+                    break  # Le combat est terminé au milieu du tour
+                if character.stunned:
+                    character.notify_observers("stunned", None)
+                    continue
+                if timed:
+                    start = perf_counter()
+                    character.perform_turn(targets)
+                    hero.notify_observers("perform_turn_time", perf_counter() - start)
+                else:
+                    character.perform_turn(targets)
+    finally:
+        hero_team.end_battle()
+        enemy_team.end_battle()
+    return turn
+
+
+def play_game(hero_team, enemy_team, is_boss=False, max_turns=None, weighted=False):
+    """Gère un combat entre le héros et un ennemi"""
+    hero = hero_team.members[0]
+    timed = next(_play_clock) % TIMING_SAMPLE == 0 and (hero.wants("play_game_time") or hero.wants("perform_turn_time"))
+    start = perf_counter() if timed else 0
+    if hero.wants("battle_start"):
+        starter = max(hero_team.members + enemy_team.members, key=lambda c: c.speed)  # Premier à jouer
+        battle_type = "BOSS BATTLE" if is_boss else "BATTLE START"
+        hero.notify_observers("battle_start", {"battle_type": battle_type, "starter": starter})
+    resolve_battle(hero_team, enemy_team, max_turns, weighted, timed)
+    hero.notify_observers("battle_end", None)
+    if timed:
+        hero.notify_observers("play_game_time", perf_counter() - start)
+
+    return not hero_team.is_defeated()  # Return True if hero won
+
+
+def run_exploration(hero, num_stages=10, zone_name=None, checkpoint=None, zone=None, battles_won=0):
+    """Boucle du Mode Exploration, retourne (victoire, combats gagnés, stage atteint)
+
+    checkpoint (checkpoint.Checkpoint) est sauvegardé après chaque stage
+    réussi et marqué comme fini à la victoire ou à la défaite ; zone et
+    battles_won reprennent une session interrompue.
+    """
+    if zone is not None:
+        zone_name, num_stages = zone.name, zone.num_stages
+    zone_name = zone_name or streams.events.choice(ZONE_NAMES)
+    hero_team = Team("Hero Team")
+    hero_team.add_member(hero)
+    enemy_factory = EnemyFactory(hero.bus)
+
+    if hero.wants("exploration_start"):
+        hero.notify_observers("exploration_start", {"zone_name": zone_name, "num_stages": num_stages})
+
+    exploration = zone or ExplorationZone(zone_name, hero, num_stages)
+
+    # Boucle d'exploration
+    while not exploration.is_complete():
+        # Restaurer les PV du héros entre les stages (mais pas complètement)
+        heal_amount = min(hero.max_pv - hero._pv, hero.max_pv // 3)
+        if heal_amount > 0:
+            hero.heal(heal_amount)
+
+        result = exploration.explore_stage()
+
+        # Si l'événement est un combat avec un ennemi
+        if isinstance(result, tuple) and len(result) > 1 and result[1] is not None:
+            enemy = result[1]
+            is_boss = isinstance(enemy, Boss)
+
+            enemy_team = Team("Enemy Team")
+            enemy_team.add_member(enemy)
+
+            # Si c'est un boss, ajouter deux ennemis faibles à l'équipe
+            if is_boss:
+                for escort in enemy_factory.create_enemies(hero, 2):
+                    enemy_team.add_member(escort)
+
+            hero_won = play_game(hero_team=hero_team, enemy_team=enemy_team, is_boss=is_boss)
+            enemy_factory.release(*enemy_team.members)
+
+            if not hero_won:
+                if checkpoint is not None:
+                    checkpoint.end(False)
+                hero.notify_observers("death", hero)
+                if hero.wants("battle_stats"):
+                    stage_msg = "the boss fight" if is_boss else f"stage {exploration.current_stage}/{exploration.num_stages}"
+                    hero.notify_observers("battle_stats", {"battles_won": battles_won, "stage_msg": stage_msg})
+                return False, battles_won, exploration.current_stage
+            battles_won += 1
+            if is_boss:
+                if checkpoint is not None:
+                    checkpoint.save(exploration, battles_won)
+                    checkpoint.end(True)
+                if hero.wants("exploration_victory"):
+                    hero.notify_observers("exploration_victory", {"zone_name": zone_name})
+                return True, battles_won, exploration.current_stage
+        if checkpoint is not None:
+            checkpoint.save(exploration, battles_won)
+    return False, battles_won, exploration.current_stage
+
+
+def run_classic(hero, play_again=None, max_battles=None):
+    """Boucle du Mode Classique, retourne (victoire, combats gagnés)
+
+    Après chaque victoire, play_again() décide de continuer (None : jusqu'à la
+    défaite ou max_battles victoires).
+    """
+    hero_team = Team("Hero Team")
+    hero_team.add_member(hero)
+    enemy_factory = EnemyFactory(hero.bus)
+    battles_won = 0
+    hero.notify_observers("start_classic_mode", None)
+    while True:
+        # Reset hero PV for new battle
+        hero._pv = hero.max_pv
+        hero_team.refresh()
+
+        enemy = enemy_factory.create_enemy(hero)
+        if streams.factory.random() > 0.5:
+            enemy.inventory.append(Weapon.shared("Random Weapon", streams.factory.randint(20, 30)))
+        enemy_team = Team("Enemy Team")
+        enemy_team.add_member(enemy)
+
+        hero_won = play_game(hero_team=hero_team, enemy_team=enemy_team)
+        enemy_factory.release(enemy)
+        if not hero_won:
+            hero.notify_observers("end_classic_mode", {"win": False, "battles_won": battles_won})
+            return False, battles_won
+        battles_won += 1
+        if (max_battles is not None and battles_won >= max_battles) or (play_again is not None and not play_again()):
+            hero.notify_observers("end_classic_mode", {"win": True, "battles_won": battles_won})
+            return True, battles_won
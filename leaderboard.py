@@ -0,0 +1,95 @@
+"""Classement des scores dans une base SQLite locale"""
+import os
+import sqlite3
+import threading
+import time
+
+SORT_COLUMNS = {"exp": "exp", "battles_won": "battles_won"}
+
+
+class Leaderboard:
+    """Classement persistant, partagé sans risque entre sessions et processus.
+
+    Chaque insertion est une transaction (BEGIN IMMEDIATE) : plusieurs processus
+    peuvent écrire en même temps, SQLite les sérialise et attend jusqu'à
+    `timeout` secondes que le verrou se libère. Les index sur exp et
+    battles_won évitent tout tri : top-K parcourt les K premières entrées de
+    l'index et rank() compte les entrées au-dessus d'un score dans l'index.
+    """
+    def __init__(self, path, timeout=30):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        # isolation_level=None : les transactions sont ouvertes explicitement
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")  # Lecteurs et écrivain ne se bloquent pas
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS scores (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                exp INTEGER NOT NULL,
+                battles_won INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_scores_exp ON scores(exp DESC, id);
+            CREATE INDEX IF NOT EXISTS idx_scores_battles_won ON scores(battles_won DESC, id);
+        """)
+
+    def add(self, name, exp, battles_won):
+        """Ajoute un score de manière atomique et retourne son identifiant"""
+        return self.add_many([(name, exp, battles_won)])[0]
+
+    def add_many(self, scores):
+        """Ajoute plusieurs scores (name, exp, battles_won) dans une seule transaction"""
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                ids = []
+                for name, exp, battles_won in scores:
+                    cursor.execute(
+                        "INSERT INTO scores (name, exp, battles_won, created_at) VALUES (?, ?, ?, ?)",
+                        (name, exp, battles_won, now),
+                    )
+                    ids.append(cursor.lastrowid)
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+        return ids
+
+    def top(self, k=10, by="exp"):
+        """Les K meilleurs scores, à égalité le plus ancien d'abord"""
+        column = SORT_COLUMNS[by]
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT name, exp, battles_won FROM scores ORDER BY {column} DESC, id LIMIT ?", (k,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def rank(self, value, by="exp"):
+        """Place qu'obtiendrait un score `value` (1 = meilleur)"""
+        column = SORT_COLUMNS[by]
+        with self._lock:
+            (above,) = self._connection.execute(
+                f"SELECT COUNT(*) FROM scores WHERE {column} > ?", (value,)
+            ).fetchone()
+        return above + 1
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,128 +1,146 @@
-import random
-from base import Weapon, Boss, Hero, Team
-from questionary import text, confirm, select
-from scores import save_score, display_top_scores
-from exploration import ExplorationZone
-from factories import HeroFactory, EnemyFactory
-
-# Display top scores at start
-display_top_scores()
-
-hero_name = text("Enter your hero's name:").ask()
-hero = HeroFactory().create_character(hero_name)
-hero_team = Team("Hero Team")
-hero_team.add_member(hero)
-
-battles_won = 0
-
-def play_game(hero_team, enemy_team, is_boss=False):
-    """Gère un combat entre le héros et un ennemi"""
-    characters = hero_team.members + enemy_team.members
-    characters.sort(key=lambda c: c.speed, reverse=True)  # Tri par vitesse pour déterminer l'ordre des tours
-    turn = 1
-    # Emoji and color for starter
-    starter = characters[0]
-    starter_emoji = "🦸" if isinstance(starter, Hero) else "👹"
-    # ANSI color codes
-    color = "\033[92m" if isinstance(starter, Hero) else "\033[91m"
-    reset = "\033[0m"
-    print(f"\nStarter: {color}{starter_emoji} {starter.name} (Speed: {starter.speed}){reset}\n")
-    
-    battle_type = "BOSS BATTLE" if is_boss else "BATTLE START"
-
-    hero.notify_observers("battle_start", {"battle_type": battle_type, "starter": characters[0]})
-    
-    while not hero_team.is_defeated() and not enemy_team.is_defeated():
-        print(f"\n--- Turn {turn} ---")
-        for character in characters:
-            if character._pv <= 0:
-                continue  # Skip if already defeated
-            if isinstance(character, Hero):
-                character.perform_turn(enemy_team.get_alive_members())
-            else:
-                character.perform_turn(hero_team.get_alive_members())
-        turn += 1
-    
-    hero.notify_observers("battle_end", None)
-    
-    return not hero_team.is_defeated()  # Return True if hero won
-
-# Choix du mode de jeu
-mode_choices = ["🗺️  Exploration Mode", "⚔️  Classic Mode (Endless Battles)"]
-mode = select("Choose game mode:", choices=mode_choices).ask()
-
-if mode == mode_choices[0]:  # Exploration Mode
-    zone_names = ["Cursed Forest", "Dragon's Lair", "Undead Catacombs", "Frozen Peaks", "Shadow Realm"]
-    zone_name = random.choice(zone_names)
-    num_stages = 10
-    
-    hero.notify_observers("exploration_start", {"zone_name": zone_name, "num_stages": num_stages})
-
-    exploration = ExplorationZone(zone_name, hero, num_stages)
-    
-    # Boucle d'exploration
-    while not exploration.is_complete():
-        # Restaurer les PV du héros entre les stages (mais pas complètement)
-        heal_amount = min(hero.max_pv - hero._pv, hero.max_pv // 3)
-        if heal_amount > 0:
-            hero._pv += heal_amount
-            hero.notify_observers("heal", heal_amount)
-        
-        result = exploration.explore_stage()
-        
-        # Si l'événement est un combat avec un ennemi
-        if isinstance(result, tuple) and len(result) > 1 and result[1] is not None:
-            enemy = result[1]
-            is_boss = isinstance(enemy, Boss)
-            
-            enemy_team = Team("Enemy Team")
-            enemy_team.add_member(enemy)
-            
-            # Si c'est un boss, ajouter deux ennemis faibles à l'équipe
-            if is_boss:
-                weak_enemy_1 = EnemyFactory().create_enemy(hero)
-                weak_enemy_2 = EnemyFactory().create_enemy(hero)
-                enemy_team.add_member(weak_enemy_1)
-                enemy_team.add_member(weak_enemy_2)
-            
-            hero_won = play_game(hero_team=hero_team, enemy_team=enemy_team, is_boss=is_boss)
-            
-            if not hero_won:
-                hero.notify_observers("death", hero)
-                stage_msg = "the boss fight" if is_boss else f"stage {exploration.current_stage}/{exploration.num_stages}"
-                hero.notify_observers("battle_stats", {"battles_won": battles_won, "stage_msg": stage_msg})
-                save_score(hero.name, hero.exp, battles_won)
-                break
-            else:
-                battles_won += 1
-                if is_boss:
-                    hero.notify_observers("victory", {"zone_name": zone_name})
-                    save_score(hero.name, hero.exp, battles_won)
-                    break
-    
-else:  # Classic Mode
-    hero.notify_observers("start_classic_mode", None)    
-    while True:
-        # Reset hero PV for new battle
-        hero._pv = hero.max_pv
-        
-        enemy = EnemyFactory().create_enemy(hero)
-        
-        if random.random() > 0.5:
-            enemy.inventory.append(Weapon("Random Weapon", random.randint(20, 30)))
-        
-        enemy_team = Team("Enemy Team")
-        enemy_team.add_member(enemy)
-        
-        hero_won = play_game(hero_team=hero_team, enemy_team=enemy_team)
-        
-        if hero_won:
-            battles_won += 1
-            if not confirm("Play again?").ask():
-                hero.notify_observers("end_classic_mode", {"win": True, "battles_won": battles_won})
-                save_score(hero.name, hero.exp, battles_won)
-                break
+"""Point d'entrée du jeu : python -m main [play|simulate|scores] (play par défaut).
+
+Rien n'est lancé à l'import. questionary et les modules lourds ne sont
+importés que par la commande qui en a besoin : une partie sans interface
+(play --headless) ou un lancement de simulation ne paient jamais le coût
+de l'interface interactive.
+"""
+import argparse
+import os
+import sys
+
+MODES = {"exploration": "🗺️  Exploration Mode", "classic": "⚔️  Classic Mode (Endless Battles)"}
+POLICIES = ("greedy", "random", "expectimax")
+
+
+def make_policy(name, seed=None):
+    from policies import GreedyPolicy, RandomPolicy
+    if name == "expectimax":
+        from search import ExpectimaxPolicy
+        return ExpectimaxPolicy()
+    return RandomPolicy(seed) if name == "random" else GreedyPolicy()
+
+
+def play(args):
+    from rng import streams
+    from scores import save_score, display_top_scores
+
+    streams.seed(args.seed)
+    if not args.quiet:
+        display_top_scores()
+    bus = renderer = None
+    if not args.quiet:
+        from events import EventBus
+        from render import FrameRenderer
+        renderer = FrameRenderer(fps=args.fps)
+        bus = EventBus()
+        bus.attach(renderer)
+
+    if args.headless:
+        hero_name = args.name or "Hero"
+        policy = make_policy(args.policy, args.seed)
+        mode = args.mode or "exploration"
+        play_again = None
+    else:
+        from base import InteractivePolicy, TerminalInput
+        from questionary import text, confirm, select
+        hero_name = args.name or text("Enter your hero's name:").ask()
+        policy = InteractivePolicy(TerminalInput(renderer))  # Image en cours affichée avant chaque question
+        if args.mode:
+            mode = args.mode
         else:
-            hero.notify_observers("end_classic_mode", {"win": False, "battles_won": battles_won})
-            save_score(hero.name, hero.exp, battles_won)
-            break
\ No newline at end of file
+            # Choix du mode de jeu
+            label = select("Choose game mode:", choices=list(MODES.values())).ask()
+            mode = next(key for key, value in MODES.items() if value == label)
+
+        def play_again():
+            if renderer is not None:
+                renderer.flush()
+            return confirm("Play again?").ask()
+
+    try:
+        hero, battles_won = _play_mode(args, mode, hero_name, policy, play_again, bus)
+    finally:
+        if renderer is not None:
+            renderer.close()
+    if battles_won is None:  # Checkpoint d'une session déjà finie : rien n'a été joué
+        if not args.quiet:
+            print(f"The run saved in {args.checkpoint} is already over; delete it to start a new one.")
+    elif not args.no_save:
+        save_score(hero.name, hero.exp, battles_won)
+    return 0
+
+
+def _play_mode(args, mode, hero_name, policy, play_again, bus):
+    from factories import HeroFactory
+    from game import run_classic, run_exploration
+
+    if mode == "exploration" and args.checkpoint and os.path.exists(args.checkpoint):
+        from checkpoint import resume_exploration
+        result, hero = resume_exploration(args.checkpoint, policy, bus)
+        battles_won = None if result is None else result[1]
+    elif mode == "exploration":
+        hero = HeroFactory(bus).create_character(hero_name, policy)
+        checkpoint = None
+        if args.checkpoint:
+            from checkpoint import Checkpoint
+            checkpoint = Checkpoint(args.checkpoint)
+        try:
+            hero_won, battles_won, stage = run_exploration(hero, num_stages=args.stages, checkpoint=checkpoint)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+    else:
+        hero = HeroFactory(bus).create_character(hero_name, policy)
+        hero_won, battles_won = run_classic(hero, play_again, args.battles)
+    return hero, battles_won
+
+
+def scores(args):
+    from scores import display_top_scores
+    display_top_scores(args.limit)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m main", description="RPG en ligne de commande")
+    commands = parser.add_subparsers(dest="command")
+
+    play_parser = commands.add_parser("play", help="jouer une partie (par défaut)")
+    play_parser.add_argument("--name", help="nom du héros (demandé sinon)")
+    play_parser.add_argument("--mode", choices=list(MODES), help="mode de jeu (demandé sinon)")
+    play_parser.add_argument("--headless", action="store_true", help="aucune question : le héros suit --policy")
+    play_parser.add_argument("--policy", choices=POLICIES, default="greedy")
+    play_parser.add_argument("--seed", type=int, default=None)
+    play_parser.add_argument("--stages", type=int, default=10, help="stages du Mode Exploration")
+    play_parser.add_argument("--battles", type=int, default=None, help="victoires max en Mode Classique")
+    play_parser.add_argument("--checkpoint", help="fichier de checkpoints du Mode Exploration (repris s'il existe)")
+    play_parser.add_argument("--quiet", action="store_true", help="n'affiche rien")
+    play_parser.add_argument("--fps", type=int, default=30, help="images affichées par seconde au plus (0 : sans limite)")
+    play_parser.add_argument("--no-save", action="store_true", help="n'enregistre pas le score")
+    play_parser.set_defaults(func=play)
+
+    simulate_parser = commands.add_parser("simulate", help="simulation de combats (options de simulation.py)",
+                                          add_help=False)
+    simulate_parser.set_defaults(func=None)
+
+    scores_parser = commands.add_parser("scores", help="meilleurs scores")
+    scores_parser.add_argument("-n", "--limit", type=int, default=10)
+    scores_parser.set_defaults(func=scores)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in ("play", "simulate", "scores", "-h", "--help"):
+        argv = ["play"] + argv
+    if argv[0] == "simulate":
+        # Options transmises telles quelles au simulateur
+        from simulation import main as simulate
+        return simulate(argv[1:])
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
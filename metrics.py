@@ -0,0 +1,169 @@
+"""Instrumentation d'une session : compteurs et histogrammes de durée.
+
+MetricsObserver s'attache comme n'importe quel observateur : au bus d'une
+partie (bus.attach(metrics)), il voit les événements de tous les
+personnages ; avec hero.add_observer(metrics), ceux de ce héros seulement. Les durées de perform_turn, play_game et
+explore_stage ne sont mesurées que si un observateur écoute les événements
+"*_time" correspondants : sans MetricsObserver, elles ne coûtent rien.
+
+Chaque compteur est un handler du bus : sans MetricsObserver, un événement
+ne coûte que la recherche de ses abonnés (Character.wants, EventBus.handlers_for).
+Attaché, il ajoute un appel Python par attaque, soin, mort et montée de
+niveau : python -m benchmarks.bench_metrics mesure ce surcoût et le plancher
+d'un handler vide sur les mêmes événements.
+
+Les instantanés s'exportent en JSON ou au format texte de Prometheus.
+"""
+import json
+import os
+from bisect import bisect_left
+from collections import defaultdict
+
+from observer import Observer
+
+# Bornes supérieures (secondes) des tranches des histogrammes, comme les "le" de Prometheus
+DURATION_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+TIMED = ("perform_turn", "play_game", "explore_stage")
+
+
+class Histogram:
+    """Histogramme cumulable à tranches fixes"""
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Dernière case : au-delà de la dernière borne
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def record(self, subject, event_type, data):
+        """Handler d'un événement "*_time" : observe sans appel supplémentaire"""
+        self.counts[bisect_left(self.buckets, data)] += 1
+        self.count += 1
+        self.sum += data
+
+    def cumulative(self):
+        """Paires (borne, nombre de valeurs <= borne), la dernière borne étant +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def snapshot(self):
+        return {"count": self.count, "sum": self.sum,
+                "buckets": {("+Inf" if bound == float("inf") else repr(bound)): total
+                            for bound, total in self.cumulative()}}
+
+
+class MetricsObserver(Observer):
+    """Compte les actions de combat et mesure la durée des tours, combats et stages"""
+
+    def __init__(self):
+        self.attacks = 0
+        self.damage_by_weapon = defaultdict(int)  # Nom de l'arme ("none" à mains nues) -> dégâts infligés
+        self.heals = 0
+        self.healed = 0
+        self.deaths = 0
+        self.level_ups = 0
+        self.boss_double_attacks = 0
+        self.durations = {name: Histogram() for name in TIMED}
+        self._handlers = {
+            "attack": self._attack,
+            "heal": self._heal,
+            "death": self._death,
+            "level_up": self._level_up,
+            "boss_double_attack": self._boss_double_attack,
+        }
+        for name, histogram in self.durations.items():
+            self._handlers[name + "_time"] = histogram.record
+        self.events = tuple(self._handlers)
+
+    def notify(self, subject, event_type, data):
+        handler = self._handlers.get(event_type)
+        if handler:
+            handler(subject, event_type, data)
+
+    def handler(self, event_type):
+        return self._handlers[event_type]
+
+    def _attack(self, subject, event_type, data):
+        self.attacks += 1
+        weapon = data["weapon"]
+        self.damage_by_weapon[weapon.name if weapon else "none"] += data["damage"]
+
+    def _heal(self, subject, event_type, data):
+        self.heals += 1
+        self.healed += data
+
+    def _death(self, subject, event_type, data):
+        # run_exploration signale aussi la mort du héros avec data=hero : déjà comptée par take_damage
+        if data is None:
+            self.deaths += 1
+
+    def _level_up(self, subject, event_type, data):
+        self.level_ups += 1
+
+    def _boss_double_attack(self, subject, event_type, data):
+        self.boss_double_attacks += 1
+
+    def snapshot(self):
+        return {
+            "counters": {
+                "attacks": self.attacks,
+                "damage_by_weapon": dict(self.damage_by_weapon),
+                "heals": self.heals,
+                "healed": self.healed,
+                "deaths": self.deaths,
+                "level_ups": self.level_ups,
+                "boss_double_attacks": self.boss_double_attacks,
+            },
+            "durations": {name: histogram.snapshot() for name, histogram in self.durations.items()},
+        }
+
+    def to_prometheus(self, prefix="rpg"):
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        counter("attacks_total", "Attacks performed", [("", self.attacks)])
+        counter("damage_dealt_total", "Damage rolled by attacks, per weapon",
+                [(f'{{weapon="{_escape(name)}"}}', value) for name, value in sorted(self.damage_by_weapon.items())])
+        counter("heals_total", "Heal actions", [("", self.heals)])
+        counter("healed_total", "Hit points healed", [("", self.healed)])
+        counter("deaths_total", "Characters defeated", [("", self.deaths)])
+        counter("level_ups_total", "Levels gained", [("", self.level_ups)])
+        counter("boss_double_attacks_total", "Boss double attacks", [("", self.boss_double_attacks)])
+        for name, histogram in self.durations.items():
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# HELP {metric} Wall-clock duration of {name}")
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, total in histogram.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{le="{le}"}} {total}')
+            lines.append(f"{metric}_sum {histogram.sum}")
+            lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, format="json"):
+        """Écrit un instantané dans `path` ("json" ou "prometheus"), remplacé d'un bloc"""
+        text = json.dumps(self.snapshot(), indent=2) if format == "json" else self.to_prometheus()
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temporary, path)  # Un lecteur ne voit jamais un fichier à moitié écrit
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
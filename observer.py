@@ -1,70 +1,215 @@
 from abc import ABC, abstractmethod
+from base import Hero
+from events import EventBus
 
 class Observer(ABC):
+    events = ()  # Types d'événements auxquels l'observateur s'abonne sur un EventBus
+
     @abstractmethod
     def notify(self, subject, event_type, data):
         """Mise à jour de l'observateur en fonction de l'événement"""
         pass
 
+    def handler(self, event_type):
+        """Fonction appelée par l'EventBus pour `event_type`"""
+        return self.notify
+
+# ----- Texte affiché pour chaque événement de combat et d'exploration -----
+def _increase_hp(subject, event_type, data):
+    return f"❤️ Max HP increased by {data}! Current HP: {subject._pv}/{subject.max_pv}"
+
+def _damage_taken(subject, event_type, data):
+    return f"💔 {subject.name} takes {data} damage! {subject.get_health_bar()} {subject._pv}/{subject.max_pv}"
+
+def _damage_increased(subject, event_type, data):
+    return f"⚔️ Damage increased! Current Damage: {subject.damage}"
+
+def _xp_gained(subject, event_type, data):
+    return f"⭐ {subject.name} gains {data} EXP! Total EXP: {subject.exp}"
+
+def _attack(subject, event_type, data):
+    return f"\n{subject.name} attacks {data['target'].name} with {data['weapon'].name if data['weapon'] else 'no weapon'}!"
+
+def _death(subject, event_type, data):
+    return f"💀 {subject.name} has been defeated!"
+
+def _heal(subject, event_type, data):
+    return f"\n{subject.name} heals for {data} HP! {subject.get_health_bar()} {subject._pv}/{subject.max_pv}"
+
+def _boss_double_attack(subject, event_type, data):
+    return f"💥 {subject.name} performs a DOUBLE ATTACK!"
+
+def _pass(subject, event_type, data):
+    return f"\n{subject.name} decides to pass this turn."
+
+def _exit_game(subject, event_type, data):
+    return f"\n{subject.name} has chosen to exit the game. Thanks for playing!"
+
+def _invalid_choice(subject, event_type, data):
+    return "Invalid choice! Turn skipped."
+
+def _level_up(subject, event_type, data):
+    return f"🎉 {subject.name} leveled up to Level {data}!"
+
+def _battle_start(subject, event_type, data):
+    starter = data['starter']
+    starter_emoji = "🦸" if isinstance(starter, Hero) else "👹"
+    # ANSI color codes
+    color = "\033[92m" if isinstance(starter, Hero) else "\033[91m"
+    reset = "\033[0m"
+    return "\n".join((
+        f"\nStarter: {color}{starter_emoji} {starter.name} (Speed: {starter.speed}){reset}\n",
+        f"\n{'='*50}",
+        f"⚔️  {data['battle_type']}! {data['starter'].name} goes first!",
+        f"{'='*50}\n",
+    ))
+
+def _turn_start(subject, event_type, data):
+    return f"\n--- Turn {data} ---"
+
+def _enemy_appears(subject, event_type, data):
+    return "\n".join((
+        f"\n{'='*50}",
+        f"👹 A wild {subject.name} ({subject.type}) appears!",
+        f"   HP: {subject._pv} | DMG: {subject.damage} | EXP: {subject.exp} | Speed: {subject.speed}",
+        f"{'='*50}",
+    ))
+
+def _battle_end(subject, event_type, data):
+    return "\n".join((
+        f"\n{'='*50}",
+        f"📊 BATTLE END - {subject.name}: {subject._pv}/{subject.max_pv} HP | {subject.exp} EXP",
+        f"{'='*50}",
+    ))
+
+def _exploration_start(subject, event_type, data):
+    return "\n".join((
+        f"\n🎮 Starting exploration of the {data['zone_name']}!",
+        f"   You will traverse {data['num_stages']} stages before facing the final boss.\n",
+    ))
+
+def _battle_stats(subject, event_type, data):
+    return "\n".join((
+        f"   Final stats: {subject.exp} EXP | {data['battles_won']} battles won",
+        f"   Defeated at {data['stage_msg']}",
+    ))
+
+def _exploration_victory(subject, event_type, data):
+    return f"\n🎉 VICTORY! You have conquered the {data['zone_name']}!"
+
+def _start_classic_mode(subject, event_type, data):
+    return "\n🎮 Starting Classic Mode! Endless battles await...\n"
+
+def _end_classic_mode(subject, event_type, data):
+    if data['win'] == True:
+        title = "\n🎉 Thanks for playing! Final stats:"
+    else:
+        title = f"\n💀 GAME OVER! {subject.name} has been defeated!"
+    return f"{title}\n   Final stats: {subject.exp} EXP | {data['battles_won']} battles won"
+
+def _no_items(subject, event_type, data):
+    return "\n🛒 No items available in inventory!"
+
+def _stage_start(subject, event_type, data):
+    return "\n".join((
+        f"\n{'='*60}",
+        f"🗺️  EXPLORATION - Stage {data.current_stage}/{data.num_stages}",
+        f"   Zone: {data.name}",
+        f"{'='*60}\n",
+        "Available paths:\n",
+    ))
+
+def _path_taken(subject, event_type, data):
+    return f"\n🚶 You take the {data.name}..."
+
+def _path_combat(subject, event_type, data):
+    return "\n⚔️  You encounter an enemy on this path!"
+
+def _artifact_found(subject, event_type, data):
+    return f"\n✨ You found a magical artifact! +{data} EXP! Total: {subject.exp}"
+
+def _weapon_found(subject, event_type, data):
+    return f"\n🗡️  You found a {data.name}! ({data.damage} DMG)"
+
+def _potion_found(subject, event_type, data):
+    return f"\n🧪 You found a {data.name}! (Heals {data.value} HP)"
+
+def _boss_appears(subject, event_type, data):
+    return "\n".join((
+        f"\n{'='*60}",
+        "👑 BOSS FIGHT!",
+        f"{'='*60}\n",
+        f"💀 {subject.name} appears!",
+        f"   HP: {subject.max_pv} | DMG: {subject.damage} | EXP: {subject.exp}",
+        "\n⚠️  This will be a legendary battle!\n",
+    ))
+
+def _effect_start(subject, event_type, data):
+    return f"🌀 {subject.name} is affected by {data.name} for {data.duration} turns!"
+
+def _effect_end(subject, event_type, data):
+    return f"🌀 {data.name.capitalize()} wears off {subject.name}."
+
+def _stunned(subject, event_type, data):
+    return f"\n💫 {subject.name} is stunned and loses this turn!"
+
+def _printer(format):
+    """Handler qui affiche le texte de `format`"""
+    def handler(subject, event_type, data):
+        print(format(subject, event_type, data))
+    return handler
+
 class GameObserver(Observer):
-    @staticmethod
-    def notify(subject, event_type, data):
-        """Affiche les événements de combat et d'exploration"""
-        if event_type == "increase_hp":
-            print(
-                f"❤️ Max HP increased by {data}! Current HP: {subject._pv}/{subject.max_pv}"
-            )
-        elif event_type == "damage_taken":
-            print(
-                f"💔 {subject.name} takes {data} damage! {subject.get_health_bar()} {subject._pv}/{subject.max_pv}"
-            )
-        elif event_type == "damage_increased":
-            print(f"⚔️ Damage increased! Current Damage: {subject.damage}")
-        elif event_type == "xp_gained":
-            print(f"⭐ {subject.name} gains {data} EXP! Total EXP: {subject.exp}")
-        elif event_type == "attack":
-            print(
-                f"\n{subject.name} attacks {data['target'].name} with {data['weapon'].name if data['weapon'] else 'no weapon'}!"
-            )
-        elif event_type == "death":
-            print(f"💀 {subject.name} has been defeated!")
-        elif event_type == "heal":
-            print(
-                f"\n{subject.name} heals for {data} HP! {subject.get_health_bar()} {subject._pv}/{subject.max_pv}"
-            )
-        elif event_type == "boss_double_attack":
-            print(f"💥 {subject.name} performs a DOUBLE ATTACK!")
-        elif event_type == "pass":
-            print(f"\n{subject.name} decides to pass this turn.")
-        elif event_type == "exit_game":
-            print(f"\n{subject.name} has chosen to exit the game. Thanks for playing!")
-        elif event_type == "invalid_choice":
-            print("Invalid choice! Turn skipped.")
-        elif event_type == "level_up":
-            print(f"🎉 {subject.name} leveled up to Level {data}!")
-        elif event_type == "battle_start":
-            print(f"\n{'='*50}")
-            print(f"⚔️  {data['battle_type']}! {data['starter'].name} goes first!")
-            print(f"{'='*50}\n")
-        elif event_type == "battle_end":
-            print(f"\n{'='*50}")
-            print(f"📊 BATTLE END - {subject.name}: {subject._pv}/{subject.max_pv} HP | {subject.exp} EXP")
-            print(f"{'='*50}")
-        elif event_type == "exploration_start":
-            print(f"\n🎮 Starting exploration of the {data['zone_name']}!")
-            print(f"   You will traverse {data['num_stages']} stages before facing the final boss.\n")
-        elif event_type == "battle_stats":
-            print(f"   Final stats: {subject.exp} EXP | {data['battles_won']} battles won")
-            print(f"   Defeated at {data['stage_msg']}")
-        elif event_type == "exploration_victory":
-            print(f"\n🎉 VICTORY! You have conquered the {data['zone_name']}!")
-        elif event_type == "start_classic_mode":
-            print("\n🎮 Starting Classic Mode! Endless battles await...\n")
-        elif event_type == "end_classic_mode":
-            if data['win'] == True:
-                print("\n🎉 Thanks for playing! Final stats:")
-            else:
-                print(f"\n💀 GAME OVER! {subject.name} has been defeated!")
-            print(f"   Final stats: {subject.exp} EXP | {data['battles_won']} battles won")
-        elif event_type == "no_items":
-            print("\n🛒 No items available in inventory!")
+    """Affiche les événements de combat et d'exploration, un print par événement (voir render.py)"""
+    FORMATS = {
+        "increase_hp": _increase_hp,
+        "damage_taken": _damage_taken,
+        "damage_increased": _damage_increased,
+        "xp_gained": _xp_gained,
+        "attack": _attack,
+        "death": _death,
+        "heal": _heal,
+        "boss_double_attack": _boss_double_attack,
+        "pass": _pass,
+        "exit_game": _exit_game,
+        "invalid_choice": _invalid_choice,
+        "level_up": _level_up,
+        "battle_start": _battle_start,
+        "turn_start": _turn_start,
+        "enemy_appears": _enemy_appears,
+        "battle_end": _battle_end,
+        "exploration_start": _exploration_start,
+        "battle_stats": _battle_stats,
+        "exploration_victory": _exploration_victory,
+        "start_classic_mode": _start_classic_mode,
+        "end_classic_mode": _end_classic_mode,
+        "no_items": _no_items,
+        "stage_start": _stage_start,
+        "path_taken": _path_taken,
+        "path_combat": _path_combat,
+        "artifact_found": _artifact_found,
+        "weapon_found": _weapon_found,
+        "potion_found": _potion_found,
+        "boss_appears": _boss_appears,
+        "effect_start": _effect_start,
+        "effect_end": _effect_end,
+        "stunned": _stunned,
+    }
+    events = tuple(FORMATS)
+
+    def __init__(self):
+        # Handlers propres à l'instance : le bus les dédoublonne, détacher un GameObserver
+        # ne doit pas retirer ceux d'un autre
+        self.handlers = {event_type: _printer(format) for event_type, format in self.FORMATS.items()}
+
+    def notify(self, subject, event_type, data):
+        handler = self.handlers.get(event_type)
+        if handler:
+            handler(subject, event_type, data)
+
+    def handler(self, event_type):
+        return self.handlers[event_type]
+
+# Bus partagé par tous les personnages d'une partie en terminal
+GAME_BUS = EventBus(shared=True)
+GAME_BUS.attach(GameObserver())
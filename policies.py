@@ -0,0 +1,73 @@
+import random
+from base import HeroPolicy, Hero
+
+
+class GreedyPolicy(HeroPolicy):
+    """Politique scriptée : frappe l'ennemi le plus faible avec la meilleure arme,
+    se soigne quand ses PV passent sous le seuil"""
+    def __init__(self, heal_threshold=0.35, upgrade="Increase Damage"):
+        self.heal_threshold = heal_threshold
+        self.upgrade = upgrade
+
+    def choose_action(self, hero, targets):
+        if hero._pv <= hero.max_pv * self.heal_threshold:
+            if hero.inventory.consumables:
+                return "use item"
+            return "heal"
+        return "attack"
+
+    def choose_target(self, hero, targets):
+        return min(targets, key=lambda enemy: enemy._pv)
+
+    def choose_weapon(self, hero, weapons):
+        return hero.inventory.best_weapon
+
+    def choose_item(self, hero, consumables):
+        return max(consumables, key=lambda item: item.value)
+
+    def choose_upgrade(self, hero):
+        return self.upgrade
+
+    def choose_path(self, hero, paths):
+        """Chemin le plus facile quand les PV sont bas, le plus difficile sinon"""
+        order = {"easy": 0, "normal": 1, "hard": 2}
+        if hero._pv <= hero.max_pv // 2:
+            return min(paths, key=lambda path: order.get(path.difficulty, 1))
+        return max(paths, key=lambda path: order.get(path.difficulty, 1))
+
+
+class RandomPolicy(HeroPolicy):
+    """Politique scriptée : choix uniformes parmi les actions de combat"""
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)  # Indépendant des flux du jeu
+
+    def choose_action(self, hero, targets):
+        return self.rng.choice(["attack", "attack", "heal"])
+
+    def choose_target(self, hero, targets):
+        return self.rng.choice(targets)
+
+    def choose_weapon(self, hero, weapons):
+        return self.rng.choice(weapons + [None])
+
+    def choose_item(self, hero, consumables):
+        return self.rng.choice(consumables)
+
+    def choose_upgrade(self, hero):
+        return self.rng.choice(Hero.UPGRADES)
+
+    def choose_path(self, hero, paths):
+        return self.rng.choice(paths)
+
+
+class DifficultyPolicy(GreedyPolicy):
+    """GreedyPolicy qui prend toujours les chemins d'une difficulté donnée quand il y en a"""
+    ORDER = {"easy": 0, "normal": 1, "hard": 2}
+
+    def __init__(self, difficulty, **options):
+        super().__init__(**options)
+        self.difficulty = difficulty
+
+    def choose_path(self, hero, paths):
+        goal = self.ORDER[self.difficulty]
+        return min(paths, key=lambda path: abs(self.ORDER.get(path.difficulty, 1) - goal))
@@ -0,0 +1,56 @@
+"""Réutilisation des ennemis et des boss entre les combats.
+
+Un combat du Mode Classique ou d'une simulation crée un ennemi, son
+inventaire et ses listes, puis les abandonne ; l'ennemi et son Team se
+référencent mutuellement, seul le ramasse-miettes les libère. Les boucles de
+jeu rendent leurs ennemis au pool à la fin du combat (release) et les
+factories les reprennent (acquire) en les remettant à neuf avec
+Character.reset : les mêmes tirages aléatoires, sans nouvelle allocation.
+
+Un ennemi rendu ne doit plus être utilisé par l'appelant.
+
+Chaque thread a ses listes de personnages libres (threading.local) : les
+sessions du serveur de parties, une par thread, ne se prennent pas leurs
+ennemis.
+"""
+import threading
+
+
+class EnemyPool(threading.local):
+    """Personnages libres par classe et par thread, au plus `max_size` par classe"""
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._free = {}  # classe -> liste de personnages libres
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, cls, *args):
+        """Personnage de classe `cls` remis à neuf avec les arguments de son constructeur"""
+        free = self._free.get(cls)
+        if free:
+            character = free.pop()
+            character.reset(*args)
+            self.reused += 1
+            return character
+        self.created += 1
+        return cls(*args)
+
+    def release(self, *characters):
+        """Rend des personnages au pool à la fin de leur combat"""
+        for character in characters:
+            character.team = None  # Casse le cycle avec l'équipe
+            character.bus = None
+            free = self._free.setdefault(type(character), [])
+            if len(free) < self.max_size and character not in free:
+                free.append(character)
+
+    def clear(self):
+        self._free.clear()
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
+
+
+# Pool partagé par les factories d'ennemis par défaut
+ENEMY_POOL = EnemyPool()
@@ -0,0 +1,68 @@
+"""Courbes d'expérience : seuils de niveau chargés depuis la configuration.
+
+Un personnage garde en cache son niveau et les bornes d'EXP de ce niveau :
+tant qu'un gain d'EXP ne franchit pas la borne, le niveau se lit en O(1).
+La recherche par bisect (O(log n)) ne sert qu'au franchissement d'un seuil
+et aux requêtes en masse (levels_for).
+"""
+import json
+from bisect import bisect_right
+
+# Niveau 1 à 0 EXP, niveau 2 à 20 EXP, niveau 3 à 50 EXP...
+DEFAULT_THRESHOLDS = (20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+class XpCurve:
+    """Seuils d'EXP croissants : thresholds[i] est l'EXP nécessaire pour le niveau i + 2"""
+    __slots__ = ("thresholds", "_floors", "_ceilings")
+
+    def __init__(self, thresholds):
+        thresholds = tuple(thresholds)
+        if any(low >= high for low, high in zip(thresholds, thresholds[1:])):
+            raise ValueError("XP thresholds must be strictly increasing")
+        self.thresholds = thresholds
+        # Bornes [plancher, plafond) de chaque niveau, indexées par niveau
+        self._floors = (float("-inf"), float("-inf")) + thresholds
+        self._ceilings = (float("inf"),) + thresholds + (float("inf"),)
+
+    @classmethod
+    def geometric(cls, first, growth, max_level):
+        """Courbe exponentielle : `first` EXP pour le niveau 2, puis x `growth` par niveau"""
+        thresholds = []
+        value = first
+        for _ in range(max_level - 1):
+            thresholds.append(int(round(value)))
+            value *= growth
+        return cls(thresholds)
+
+    @classmethod
+    def from_config(cls, config):
+        """{"thresholds": [...]} ou {"first": 20, "growth": 2.0, "max_level": 30}"""
+        if "thresholds" in config:
+            return cls(config["thresholds"])
+        return cls.geometric(config["first"], config["growth"], config["max_level"])
+
+    @property
+    def max_level(self):
+        return len(self.thresholds) + 1
+
+    def level_for(self, exp):
+        return bisect_right(self.thresholds, exp) + 1
+
+    def levels_for(self, exps):
+        """Niveaux d'une série d'EXP (triée ou non)"""
+        thresholds = self.thresholds
+        return [bisect_right(thresholds, exp) + 1 for exp in exps]
+
+    def bounds(self, level):
+        """(EXP minimale, EXP du niveau suivant) du niveau `level`"""
+        return self._floors[level], self._ceilings[level]
+
+
+def load_curve(path):
+    """Charge une courbe depuis un fichier JSON (voir XpCurve.from_config)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return XpCurve.from_config(json.load(f))
+
+
+DEFAULT_CURVE = XpCurve(DEFAULT_THRESHOLDS)
@@ -0,0 +1,141 @@
+"""Affichage des parties en terminal par images (frames).
+
+GameObserver écrit chaque événement dès qu'il arrive, un print (et, sur un
+terminal, une écriture) par ligne. FrameRenderer range le texte des mêmes
+événements (GameObserver.FORMATS) dans l'image en cours ; une image se
+termine à chaque début de tour, de combat ou de stage, et n'est écrite que
+si la précédente date d'au moins 1/fps seconde (sinon elle est fusionnée
+avec la suivante) : une seule écriture par image.
+
+Sur un terminal, les PV des combattants sont affichés dans un panneau fixe
+en haut de l'écran, le journal défile en dessous (zone de défilement ANSI) ;
+seules les lignes du panneau qui ont changé sont redessinées. Ailleurs
+(fichier, tube), le journal seul est écrit, sans séquence ANSI, en gardant
+le tampon du flux.
+
+Avant une question au joueur, flush() écrit l'image en cours (voir
+base.TerminalInput).
+"""
+import os
+import sys
+import time
+
+from base import Hero, health_bar
+from observer import Observer, GameObserver
+
+FPS = 30
+PANEL_LINES = 4  # Le héros, le boss et ses deux escortes
+NAME_WIDTH = 18
+BAR_LENGTH = 20
+FRAME_EVENTS = frozenset(("turn_start", "battle_start", "battle_end", "stage_start"))  # Commencent une image
+TRACKED_EVENTS = frozenset(("enemy_appears", "boss_appears", "battle_start"))
+
+
+class FrameRenderer(Observer):
+    """Observateur d'affichage par images ; tty=None : détecté sur `stream`"""
+    events = GameObserver.events
+
+    def __init__(self, stream=None, fps=FPS, tty=None, clock=time.monotonic):
+        self.stream = stream or sys.stdout
+        self.tty = self.stream.isatty() if tty is None else tty
+        self.interval = 1 / fps if fps else 0
+        self.clock = clock
+        self.lines = []  # Texte de l'image en cours
+        self.fighters = []  # Combattants du panneau
+        self.arriving = []  # Ennemis annoncés, ajoutés au panneau au début du combat
+        self.panel = [""] * PANEL_LINES  # Lignes du panneau à l'écran
+        self.writes = 0
+        self._last_write = None
+        self._started = False
+        self._handlers = {event_type: self._handler_for(event_type, format)
+                          for event_type, format in GameObserver.FORMATS.items()}
+
+    def _handler_for(self, event_type, format):
+        lines = self.lines
+        starts_frame = event_type in FRAME_EVENTS
+        tracked = event_type in TRACKED_EVENTS
+
+        def handler(subject, event_type, data):
+            if starts_frame:
+                self.end_frame()
+            if tracked:
+                self._track(subject, event_type)
+            lines.append(format(subject, event_type, data))
+        return handler
+
+    def handler(self, event_type):
+        return self._handlers[event_type]
+
+    def notify(self, subject, event_type, data):
+        handler = self._handlers.get(event_type)
+        if handler:
+            handler(subject, event_type, data)
+
+    def _track(self, subject, event_type):
+        """Les ennemis annoncés rejoignent le panneau, derrière le héros, quand le combat commence"""
+        if event_type == "battle_start":
+            self.fighters = [subject] + self.arriving
+            self.arriving = []
+        else:
+            self.arriving.append(subject)
+
+    # --- Écriture ---
+    def end_frame(self):
+        """Termine l'image en cours ; écrite si la précédente date d'au moins 1/fps seconde"""
+        if not self.lines:
+            return
+        now = self.clock()
+        if self._last_write is None or now - self._last_write >= self.interval:
+            self._write(now)
+
+    def flush(self):
+        """Écrit tout de suite l'image en cours (avant une question au joueur, en fin de partie)"""
+        if self.lines:
+            self._write(self.clock())
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+        if self.tty and self._started:
+            self.stream.write("\x1b[r")  # Zone de défilement d'origine
+            self.stream.flush()
+
+    def panel_lines(self):
+        lines = []
+        for fighter in self.fighters[:PANEL_LINES]:
+            max_pv = fighter.max_pv
+            icon = "🦸" if isinstance(fighter, Hero) else "👹"
+            bar = health_bar(fighter._pv / max_pv if max_pv > 0 else 0, BAR_LENGTH)
+            lines.append(f"{icon} {fighter.name[:NAME_WIDTH]:<{NAME_WIDTH}} {bar} {fighter._pv}/{max_pv}")
+        return lines + [""] * (PANEL_LINES - len(lines))
+
+    def _write(self, now):
+        text = "\n".join(self.lines) + "\n"
+        self.lines.clear()
+        if self.tty:
+            text = self._start() + text + self._redraw_panel()
+        self.stream.write(text)
+        self.writes += 1
+        self._last_write = now
+
+    def _start(self):
+        """Au premier affichage : panneau en haut de l'écran, journal défilant en dessous"""
+        if self._started:
+            return ""
+        self._started = True
+        try:
+            rows = os.get_terminal_size(self.stream.fileno()).lines
+        except (AttributeError, OSError, ValueError):
+            rows = 24
+        # Le texte déjà affiché remonte dans l'historique du terminal
+        return "\n" * rows + f"\x1b[{PANEL_LINES + 2};{rows}r\x1b[{rows};1H"
+
+    def _redraw_panel(self):
+        parts = []
+        for row, line in enumerate(self.panel_lines()):
+            if line != self.panel[row]:
+                self.panel[row] = line
+                parts.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+        if not parts:
+            return ""
+        return "\x1b7" + "".join(parts) + "\x1b8"  # Curseur sauvegardé puis rendu au journal
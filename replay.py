@@ -0,0 +1,233 @@
+"""Enregistrement et rejeu d'une session d'exploration.
+
+Le journal contient, dans l'ordre où ils ont lieu, chaque tirage des flux de
+rng.streams et chaque décision du héros (un indice dans la liste des choix
+proposés). Le rejeu sert les tirages depuis le journal au lieu de les
+recalculer, et remplace la politique du héros par les décisions enregistrées :
+il ne pose aucune question et n'affiche rien.
+
+Format : en-tête (magic, version, présence d'une graine, graine, nombre de
+stages sur 4 octets, longueur du nom du héros sur 2 octets, nom) puis les enregistrements compressés par zlib. Chaque enregistrement commence
+par un octet de tag (type sur les 4 bits forts, flux sur les 4 bits faibles) :
+un double pour random(), un varint pour getrandbits() et les décisions.
+"""
+import random
+import struct
+import zlib
+
+from base import HeroPolicy, Hero
+from factories import HeroFactory
+from game import run_exploration
+from rng import streams, STREAMS
+
+MAGIC = b"RPGL"
+VERSION = 2  # 2 : drapeau de graine, stages et longueur du nom élargis
+FLOAT, BITS, DECISION = 0, 1, 2
+DECISION_STREAM = 0x0F
+_HEADER = struct.Struct("<4sB?qIH")
+_DOUBLE = struct.Struct("<d")
+
+
+class ReplayError(Exception):
+    """Le journal ne correspond pas à la partie rejouée"""
+
+
+class SessionLog:
+    """Journal binaire en cours d'écriture"""
+    def __init__(self):
+        self.records = bytearray()
+
+    def write_float(self, stream, value):
+        self.records.append(FLOAT << 4 | stream)
+        self.records += _DOUBLE.pack(value)
+
+    def write_varint(self, kind, stream, value):
+        records = self.records
+        records.append(kind << 4 | stream)
+        while value >= 0x80:
+            records.append(value & 0x7F | 0x80)
+            value >>= 7
+        records.append(value)
+
+    def to_bytes(self, seed, num_stages, hero_name):
+        name = hero_name.encode("utf-8")
+        if len(name) > 0xFFFF:
+            raise ValueError(f"Nom du héros trop long pour un journal ({len(name)} octets)")
+        header = _HEADER.pack(MAGIC, VERSION, seed is not None, seed or 0, num_stages, len(name))
+        return header + name + zlib.compress(bytes(self.records), 9)
+
+
+class LogReader:
+    """Lecture séquentielle d'un journal, vérifie que chaque tirage est celui attendu"""
+    def __init__(self, data):
+        if len(data) < _HEADER.size or data[:4] != MAGIC:
+            raise ReplayError("Not a session log")
+        magic, version, seeded, seed, num_stages, name_length = _HEADER.unpack_from(data)
+        if version != VERSION:
+            raise ReplayError("Unsupported session log version")
+        offset = _HEADER.size
+        self.seed = seed if seeded else None
+        self.num_stages = num_stages
+        self.hero_name = data[offset:offset + name_length].decode("utf-8")
+        self.records = zlib.decompress(data[offset + name_length:])
+        self.position = 0
+
+    def _expect(self, kind, stream):
+        if self.position >= len(self.records):
+            raise ReplayError("Session log exhausted")
+        tag = self.records[self.position]
+        if tag != kind << 4 | stream:
+            raise ReplayError(f"Replay diverged at byte {self.position}: expected tag {kind << 4 | stream:#04x}, got {tag:#04x}")
+        self.position += 1
+
+    def read_float(self, stream):
+        self._expect(FLOAT, stream)
+        if self.position + _DOUBLE.size > len(self.records):
+            raise ReplayError("Session log truncated")
+        (value,) = _DOUBLE.unpack_from(self.records, self.position)
+        self.position += _DOUBLE.size
+        return value
+
+    def read_varint(self, kind, stream):
+        self._expect(kind, stream)
+        records = self.records
+        value = shift = 0
+        while True:
+            if self.position >= len(records):
+                raise ReplayError("Session log truncated")
+            byte = records[self.position]
+            self.position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def at_end(self):
+        return self.position == len(self.records)
+
+
+class RecordingRandom(random.Random):
+    """random.Random qui inscrit chaque tirage élémentaire dans le journal"""
+    def __init__(self, log, stream, seed=None):
+        self._log = log
+        self._stream = stream
+        super().__init__(seed)
+
+    def random(self):
+        value = super().random()
+        self._log.write_float(self._stream, value)
+        return value
+
+    def getrandbits(self, k):
+        value = super().getrandbits(k)
+        self._log.write_varint(BITS, self._stream, value)
+        return value
+
+
+class ReplayRandom(random.Random):
+    """random.Random qui relit les tirages du journal au lieu de les calculer"""
+    def __init__(self, reader, stream):
+        self._reader = reader
+        self._stream = stream
+        super().__init__(0)
+
+    def random(self):
+        return self._reader.read_float(self._stream)
+
+    def getrandbits(self, k):
+        return self._reader.read_varint(BITS, self._stream)
+
+
+class RecordingPolicy(HeroPolicy):
+    """Délègue chaque décision à `policy` et inscrit l'indice du choix dans le journal"""
+    def __init__(self, policy, log):
+        self.policy = policy
+        self.log = log
+
+    def _record(self, index):
+        self.log.write_varint(DECISION, DECISION_STREAM, index)
+
+    def choose_action(self, hero, targets):
+        choice = self.policy.choose_action(hero, targets)
+        self._record(Hero.ACTIONS.index(choice) if choice in Hero.ACTIONS else len(Hero.ACTIONS))
+        return choice
+
+    def choose_target(self, hero, targets):
+        target = self.policy.choose_target(hero, targets)
+        self._record(next(i for i, candidate in enumerate(targets) if candidate is target))
+        return target
+
+    def choose_weapon(self, hero, weapons):
+        weapon = self.policy.choose_weapon(hero, weapons)
+        self._record(0 if weapon is None else next(i for i, w in enumerate(weapons) if w is weapon) + 1)
+        return weapon
+
+    def choose_item(self, hero, consumables):
+        item = self.policy.choose_item(hero, consumables)
+        self._record(next(i for i, candidate in enumerate(consumables) if candidate is item))
+        return item
+
+    def choose_upgrade(self, hero):
+        choice = self.policy.choose_upgrade(hero)
+        self._record(Hero.UPGRADES.index(choice))
+        return choice
+
+    def choose_path(self, hero, paths):
+        path = self.policy.choose_path(hero, paths)
+        self._record(next(i for i, candidate in enumerate(paths) if candidate is path))
+        return path
+
+
+class ReplayPolicy(HeroPolicy):
+    """Rejoue les décisions inscrites dans le journal"""
+    def __init__(self, reader):
+        self.reader = reader
+
+    def _next(self):
+        return self.reader.read_varint(DECISION, DECISION_STREAM)
+
+    def choose_action(self, hero, targets):
+        index = self._next()
+        return Hero.ACTIONS[index] if index < len(Hero.ACTIONS) else None
+
+    def choose_target(self, hero, targets):
+        return targets[self._next()]
+
+    def choose_weapon(self, hero, weapons):
+        index = self._next()
+        return weapons[index - 1] if index else None
+
+    def choose_item(self, hero, consumables):
+        return consumables[self._next()]
+
+    def choose_upgrade(self, hero):
+        return Hero.UPGRADES[self._next()]
+
+    def choose_path(self, hero, paths):
+        return paths[self._next()]
+
+
+def record_exploration(policy, seed=None, num_stages=10, hero_name="Hero", bus=None):
+    """Joue une session d'exploration en l'enregistrant, retourne (résultat, héros, journal)"""
+    log = SessionLog()
+    streams.install(lambda index, name: RecordingRandom(log, index, None if seed is None else seed * len(STREAMS) + index))
+    try:
+        hero = HeroFactory(bus).create_character(hero_name, RecordingPolicy(policy, log))
+        result = run_exploration(hero, num_stages)
+    finally:
+        streams.reset()
+    return result, hero, log.to_bytes(seed, num_stages, hero_name)
+
+
+def replay_exploration(data, bus=None):
+    """Rejoue une session depuis son journal, sans question ni affichage (avec bus=None)"""
+    reader = LogReader(data)
+    streams.install(lambda index, name: ReplayRandom(reader, index))
+    try:
+        hero = HeroFactory(bus).create_character(reader.hero_name, ReplayPolicy(reader))
+        result = run_exploration(hero, reader.num_stages)
+    finally:
+        streams.reset()
+    if not reader.at_end():
+        raise ReplayError("Replay finished before the end of the session log")
+    return result, hero
@@ -0,0 +1,62 @@
+"""Flux de nombres aléatoires par sous-système.
+
+Chaque sous-système tire dans son propre random.Random : une même graine
+rejoue exactement la même partie, et les tirages d'un sous-système ne
+décalent pas ceux des autres (ajouter un tirage d'exploration ne change pas
+les jets de combat).
+"""
+import random
+import threading
+
+STREAMS = ("speed", "combat", "ai", "factory", "events")
+
+
+class RngStreams:
+    """Un random.Random par sous-système, accessibles en attributs (streams.combat...)"""
+    def __init__(self, seed=None):
+        for name in STREAMS:
+            setattr(self, name, random.Random())
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Réinitialise tous les flux à partir d'une graine unique (None = aléatoire)"""
+        for index, name in enumerate(STREAMS):
+            getattr(self, name).seed(None if seed is None else seed * len(STREAMS) + index)
+
+    def install(self, factory):
+        """Remplace chaque flux par factory(index, name), par ex. pour enregistrer ou rejouer"""
+        for index, name in enumerate(STREAMS):
+            setattr(self, name, factory(index, name))
+
+    def per_thread(self):
+        """Chaque thread tire dans ses propres flux (serveur de parties), à seeder dans le thread"""
+        self.install(lambda index, name: ThreadLocalRandom())
+
+    def reset(self, seed=None):
+        """Revient à des random.Random ordinaires après un enregistrement ou un rejeu"""
+        self.install(lambda index, name: random.Random())
+        self.seed(seed)
+
+
+class ThreadLocalRandom:
+    """random.Random propre à chaque thread, derrière un seul attribut de RngStreams
+
+    Chaque tirage passe par __getattr__ : plus lent qu'un random.Random, ce
+    mode n'est installé que par le serveur de parties (RngStreams.per_thread).
+    """
+    __slots__ = ("_local",)
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        local = self._local
+        try:
+            rng = local.random
+        except AttributeError:
+            rng = local.random = random.Random()
+        return getattr(rng, name)
+
+
+# Flux utilisés par tout le jeu
+streams = RngStreams()
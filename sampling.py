@@ -0,0 +1,58 @@
+"""Tirages pondérés précalculés (méthode d'alias)."""
+
+class AliasTable:
+    """Tirage pondéré en O(1) par la méthode d'alias (Vose).
+
+    La table est construite une seule fois : chaque tirage ne coûte ensuite
+    qu'un rng.random(), une multiplication et une comparaison, quel que soit
+    le nombre d'éléments. `rng` est un random.Random (par ex. rng.streams.events)
+    pour rester reproductible.
+    """
+    __slots__ = ("items", "_columns", "_size")
+
+    def __init__(self, items, weights):
+        items = list(items)
+        weights = list(weights)
+        if not items or len(items) != len(weights):
+            raise ValueError("AliasTable needs one weight per item")
+        size = len(items)
+        total = sum(weights)
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] += scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Les restes (erreurs d'arrondi) gardent une probabilité de 1
+        self.items = items
+        self._columns = [(items[i], probability[i], items[alias[i]]) for i in range(size)]
+        self._size = size
+
+    @classmethod
+    def from_dict(cls, weights):
+        return cls(weights.keys(), weights.values())
+
+    def sample(self, rng):
+        u = rng.random() * self._size
+        index = int(u)
+        item, probability, alias = self._columns[index]
+        return item if u - index < probability else alias
+
+    def sample_many(self, rng, k):
+        """K tirages indépendants en un appel"""
+        columns = self._columns
+        size = self._size
+        random = rng.random
+        result = []
+        append = result.append
+        for _ in range(k):
+            u = random() * size
+            index = int(u)
+            item, probability, alias = columns[index]
+            append(item if u - index < probability else alias)
+        return result
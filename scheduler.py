@@ -0,0 +1,86 @@
+"""Ordre de jeu des combats.
+
+En mode classique tout le monde joue une fois par tour, par vitesse
+décroissante (à vitesse égale, dans l'ordre d'arrivée) : l'ordre ne change
+jamais, le tour est la liste triée elle-même, retriée seulement quand un
+personnage est ajouté ou retiré (c'est l'ancienne boucle triée, que rien ne
+bat en mode classique).
+
+En mode pondéré (weighted=True) chaque personnage a une date de prochaine
+action, rangée dans un tas (heapq) : l'intervalle entre deux actions vaut
+SPEED_BASE / speed, un personnage de vitesse 20 joue donc deux fois par tour
+et un de vitesse 5 un tour sur deux.
+
+Les morts restent dans l'ordre de jeu : un soin peut les ranimer (Team.on_revive)
+et ils rejouent alors à leur place. C'est à l'appelant de sauter les personnages
+à 0 PV. Retirer un personnage (fuite...) ne fait que le marquer en O(1) ; en
+mode classique il joue encore le tour en cours.
+"""
+from heapq import heappush, heappop, heapreplace
+
+SPEED_BASE = 10
+
+
+class InitiativeScheduler:
+    __slots__ = ("weighted", "_queue", "_entries", "_count", "_unsorted")
+
+    def __init__(self, characters=(), weighted=False):
+        self.weighted = weighted
+        self._queue = []  # Liste triée (classique) ou tas de [date, -vitesse, arrivée, personnage] (pondéré)
+        self._entries = {}  # Personnage -> sa clé de tri (classique) ou son entrée du tas (pondéré)
+        self._count = 0
+        self._unsorted = False  # Liste classique à reconstruire avant le prochain tour
+        for character in characters:
+            self.add(character)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, character):
+        return character in self._entries
+
+    def add(self, character, time=0):
+        """Ajoute un personnage ; en mode pondéré il jouera à la date `time`"""
+        if character in self._entries:
+            return
+        self._count += 1
+        if self.weighted:
+            entry = [time, -character.speed, self._count, character]
+            self._entries[character] = entry
+            heappush(self._queue, entry)
+        else:
+            self._entries[character] = (-character.speed, self._count)
+            self._unsorted = True
+
+    def remove(self, character):
+        """Retire un personnage, il ne jouera plus"""
+        entry = self._entries.pop(character, None)
+        if entry is None:
+            return
+        if self.weighted:
+            entry[3] = None  # Entrée jetée quand elle arrive en tête du tas
+        else:
+            self._unsorted = True
+
+    def round(self, turn):
+        """Personnages qui agissent pendant le tour `turn`, dans l'ordre, morts compris"""
+        if self.weighted:
+            return self._weighted_round(turn)
+        if self._unsorted:
+            entries = self._entries
+            self._queue = sorted(entries, key=entries.__getitem__)  # Nouvelle liste : le tour en cours n'est pas modifié
+            self._unsorted = False
+        return self._queue
+
+    def _weighted_round(self, turn):
+        heap = self._queue
+        while heap and heap[0][0] < turn:
+            time, rank, order, character = heap[0]
+            if character is None:
+                heappop(heap)
+                continue
+            # Reprogrammé avant de jouer, même mort : ranimé, il retrouve son rythme
+            entry = [time + SPEED_BASE / max(character.speed, 1), rank, order, character]
+            self._entries[character] = entry
+            heapreplace(heap, entry)
+            yield character
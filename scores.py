@@ -1,49 +1,52 @@
 import json
 import os
+from leaderboard import Leaderboard
 
-SCORES_FILE = "Jour 1/highscores.json"
+SCORES_FILE = "Jour 1/highscores.json"  # Ancien format, importé une fois dans la base
+SCORES_DB = "Jour 1/highscores.db"
 
-def load_scores():
-    """Load high scores from file"""
-    if os.path.exists(SCORES_FILE):
-        try:
-            with open(SCORES_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return []
-            raise
-    return []
+_leaderboards = {}
+
+def get_leaderboard():
+    """Classement SQLite du processus courant (ouvert une seule fois par chemin)"""
+    leaderboard = _leaderboards.get(SCORES_DB)
+    if leaderboard is None:
+        leaderboard = _leaderboards[SCORES_DB] = Leaderboard(SCORES_DB)
+        if not len(leaderboard):
+            _import_json_scores(leaderboard)
+    return leaderboard
+
+def _import_json_scores(leaderboard):
+    """Reprend les scores de l'ancien fichier JSON s'il existe"""
+    if not os.path.exists(SCORES_FILE):
+        return
+    try:
+        with open(SCORES_FILE, 'r') as f:
+            scores = json.load(f)
+    except (OSError, ValueError) as error:
+        print(f"⚠️  Could not import {SCORES_FILE}: {error}")
+        return
+    leaderboard.add_many((s["name"], s["exp"], s["battles_won"]) for s in scores)
+
+def load_scores(limit=10):
+    """Load high scores, best EXP first"""
+    return get_leaderboard().top(limit)
 
 def save_score(name, exp, battles_won):
-    """Save a new score to the file"""
-    scores = load_scores()
-    scores.append({
-        "name": name,
-        "exp": exp,
-        "battles_won": battles_won
-    })
-    # Sort by EXP descending
-    scores.sort(key=lambda x: x["exp"], reverse=True)
-    # Keep only top 10
-    scores = scores[:10]
-    with open(SCORES_FILE, 'w') as f:
-        json.dump(scores, f, indent=2)
+    """Save a new score"""
+    get_leaderboard().add(name, exp, battles_won)
 
-def display_top_scores():
-    """Display the top 3 high scores"""
-    scores = load_scores()
+def display_top_scores(limit=3):
+    """Display the top high scores"""
+    scores = load_scores(limit)
     if scores:
         print(f"\n{'='*50}")
-        print("🏆 TOP 3 HIGH SCORES 🏆")
+        print(f"🏆 TOP {limit} HIGH SCORES 🏆")
         print(f"{'='*50}")
-        for i, score in enumerate(scores[:3], 1):
-            if i == 1:
-                medal = "🥇"
-            elif i == 2:
-                medal = "🥈"
-            else:
-                medal = "🥉"
+        medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+        for i, score in enumerate(scores, 1):
+            medal = medals.get(i, "  ")
             print(f"{medal} {i}. {score['name']}: {score['exp']} EXP ({score['battles_won']} battles won)")
         print(f"{'='*50}\n")
     else:
-        print("\n🏆 No high scores yet! Be the first!\n")
\ No newline at end of file
+        print("\n🏆 No high scores yet! Be the first!\n")
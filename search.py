@@ -0,0 +1,253 @@
+"""Politique de recherche : expectimax sur un modèle compact du combat.
+
+Le modèle voit le combat du point de vue du héros : il joue (attaque d'un
+ennemi avec sa meilleure arme, soin ou potion), puis chaque ennemi vivant
+répond selon les règles de Enemy.perform_turn / Boss.perform_turn (attaque
+ou soin, arme tirée au hasard, double attaque du boss). Un jet de dégâts
+est réduit à deux issues : la cible meurt (avec sa probabilité exacte) ou
+elle survit et perd la moyenne des dégâts non mortels.
+
+L'état compact (PV du héros, PV des ennemis, potions) sert de clé à la
+table de transposition, valable tant que les données fixes du combat
+(PV max, dégâts, armes) ne changent pas. La profondeur est augmentée
+tant que le budget de temps de la décision n'est pas épuisé ; la dernière
+profondeur terminée donne la décision. L'ordre d'initiative, l'EXP et les
+montées de niveau pendant la recherche ne sont pas modélisés.
+"""
+from time import perf_counter
+
+from base import Hero, Enemy, Boss
+from policies import GreedyPolicy
+
+# Comportement des ennemis (voir Enemy.perform_turn et Boss.perform_turn)
+ENEMY_ATTACK = 0.5
+BOSS_ATTACK = 0.8
+BOSS_DOUBLE = 0.3
+WIN = 1000.0
+POTION_WORTH = 0.5  # Valeur d'un PV de potion gardée pour plus tard, par rapport à un PV du héros
+
+
+class _Timeout(Exception):
+    pass
+
+
+def roll_range(damage):
+    """Bornes du jet de Character.randomize(damage)"""
+    return int(damage * 0.9), int(damage * 1.1)
+
+
+def hit(low, high, pv):
+    """(probabilité que le jet tue une cible à `pv` PV, dégâts moyens quand elle survit)"""
+    if pv <= low:
+        return 1.0, 0.0
+    if pv > high:
+        return 0.0, (low + high) / 2
+    return (high - pv + 1) / (high - low + 1), (low + pv - 1) / 2
+
+
+class BattleModel:
+    """Données fixes d'un combat vu par le héros : PV max, jets de dégâts, comportement des ennemis"""
+    __slots__ = ("hero_max", "hero_roll", "enemies", "signature", "_hits")
+
+    def __init__(self, hero, targets):
+        self.hero_max = hero.max_pv
+        weapon = hero.inventory.best_weapon
+        self.hero_roll = roll_range(hero.damage + (weapon.damage if weapon else 0))
+        enemies = []
+        for enemy in targets:
+            boss = isinstance(enemy, Boss)
+            rolls = tuple(roll_range(enemy.damage + (w.damage if w else 0)) for w in enemy.inventory.armed)
+            heal = Boss.HEAL if boss else Enemy.HEAL
+            enemies.append((enemy.max_pv, heal, BOSS_ATTACK if boss else ENEMY_ATTACK, BOSS_DOUBLE if boss else 0.0, rolls))
+        self.enemies = tuple(enemies)
+        self.signature = (self.hero_max, self.hero_roll, self.enemies)
+        self._hits = {}  # (ennemi, PV du héros) -> (probabilité de tuer le héros, dégâts moyens sinon)
+
+    def enemy_hit(self, index, hero_pv):
+        """Issue d'une attaque de l'ennemi `index` : arme tirée uniformément, double attaque éventuelle"""
+        key = (index, hero_pv)
+        cached = self._hits.get(key)
+        if cached is None:
+            double = self.enemies[index][3]
+            rolls = self.enemies[index][4]
+            kill = survived = 0.0
+            for low, high in rolls:
+                for chance, (lo, hi) in ((1 - double, (low, high)), (double, (2 * low, 2 * high))):
+                    if chance:
+                        p, damage = hit(lo, hi, hero_pv)
+                        kill += chance * p
+                        survived += chance * (1 - p) * damage
+            kill /= len(rolls)
+            survived /= len(rolls)
+            cached = self._hits[key] = (kill, round(survived / (1 - kill)) if kill < 1 else 0)
+        return cached
+
+
+class ExpectimaxPolicy(GreedyPolicy):
+    """Joue les combats par recherche expectimax bornée en temps (budget en secondes par décision).
+    Les choix hors combat (chemins) sont ceux de GreedyPolicy."""
+
+    def __init__(self, budget=0.008, max_depth=6, table_size=200_000, **options):
+        super().__init__(**options)
+        self.budget = budget
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.table = {}  # (PV héros, PV ennemis, potions, profondeur) -> (valeur, action)
+        self.model = None
+        self.plan = None  # Décision du tour : ("attack", indice de cible) / ("heal",) / ("use item", valeur)
+        self.targets_alive = ()
+        self.depth = 0  # Profondeur atteinte à la dernière décision
+        self._deadline = 0.0
+
+    def __getstate__(self):
+        # Le cache ne voyage pas vers les processus de simulation
+        state = dict(self.__dict__)
+        state.update(table={}, model=None, plan=None, targets_alive=())
+        return state
+
+    # --- Décisions ---
+    def choose_action(self, hero, targets):
+        plan = self.plan = self.decide(hero, targets)
+        if plan is None:
+            return super().choose_action(hero, targets)
+        return plan[0]
+
+    def choose_target(self, hero, targets):
+        plan = self.plan
+        if plan and plan[0] == "attack" and plan[1] < len(targets):
+            return targets[plan[1]]
+        return super().choose_target(hero, targets)
+
+    def choose_item(self, hero, consumables):
+        plan = self.plan
+        if plan and plan[0] == "use item":
+            for item in consumables:
+                if item.value == plan[1]:
+                    return item
+        return super().choose_item(hero, consumables)
+
+    def choose_upgrade(self, hero):
+        """Amélioration dont l'état résultant vaut le plus, selon le modèle du combat en cours"""
+        model = self.model
+        if model is None or not self.targets_alive:
+            return Hero.UPGRADES[0] if hero._pv < hero.max_pv // 2 else Hero.UPGRADES[1]
+        enemy_pvs = tuple(max(enemy._pv, 0) for enemy in self.targets_alive)
+        potions = self._potions(hero)
+        values = []
+        for upgrade in Hero.UPGRADES:
+            if upgrade == Hero.UPGRADES[0]:
+                self.model = BattleModel(hero, self.targets_alive)
+                self.model.hero_max += 20
+                state = (self.model.hero_max, enemy_pvs, potions)  # Soigné à fond
+            else:
+                hero.damage += 5
+                self.model = BattleModel(hero, self.targets_alive)
+                hero.damage -= 5
+                state = (hero._pv, enemy_pvs, potions)
+            self.table.clear()  # Les entrées ne valent que pour un même modèle
+            values.append(self._value_within_budget(state))
+        self.model = None
+        self.table.clear()
+        return Hero.UPGRADES[0] if values[0] >= values[1] else Hero.UPGRADES[1]
+
+    # --- Recherche ---
+    @staticmethod
+    def _potions(hero):
+        inventory = hero.inventory
+        values = []
+        for item in inventory.consumables:
+            values += [item.value] * inventory.count(item)
+        return tuple(sorted(values))
+
+    def _prepare(self, hero, targets):
+        model = BattleModel(hero, targets)
+        if self.model is None or model.signature != self.model.signature or len(self.table) > self.table_size:
+            self.table.clear()
+        self.model = model
+        self.targets_alive = targets
+
+    def decide(self, hero, targets):
+        """Meilleure décision pour ce tour, None si même la profondeur 1 dépasse le budget"""
+        self._prepare(hero, targets)
+        state = (hero._pv, tuple(enemy._pv for enemy in targets), self._potions(hero))
+        self._deadline = perf_counter() + self.budget
+        best = None
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._max(*state, depth)[1]
+            except _Timeout:
+                break
+            self.depth = depth
+        return best
+
+    def _value_within_budget(self, state):
+        self._deadline = perf_counter() + self.budget / 2
+        value = None
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value = self._max(*state, depth)[0]
+            except _Timeout:
+                break
+        return value if value is not None else self._leaf(*state)
+
+    def _leaf(self, hero_pv, enemy_pvs, potions):
+        return hero_pv - sum(enemy_pvs) + POTION_WORTH * sum(potions)
+
+    def _max(self, hero_pv, enemy_pvs, potions, depth):
+        """(valeur, action) du héros à jouer"""
+        key = (hero_pv, enemy_pvs, potions, depth)
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+        if perf_counter() > self._deadline:
+            raise _Timeout()
+
+        model = self.model
+        best = (-2 * WIN, None)
+        low, high = model.hero_roll
+        for index, pv in enumerate(enemy_pvs):
+            if pv <= 0:
+                continue
+            p_kill, damage = hit(low, high, pv)
+            value = 0.0
+            if p_kill:
+                value += p_kill * self._respond(hero_pv, enemy_pvs[:index] + (0,) + enemy_pvs[index + 1:], potions, depth)
+            if p_kill < 1:
+                wounded = enemy_pvs[:index] + (pv - round(damage),) + enemy_pvs[index + 1:]
+                value += (1 - p_kill) * self._respond(hero_pv, wounded, potions, depth)
+            if value > best[0]:
+                best = (value, ("attack", index))
+        if hero_pv < model.hero_max:
+            value = self._respond(min(model.hero_max, hero_pv + Hero.HEAL), enemy_pvs, potions, depth)
+            if value > best[0]:
+                best = (value, ("heal",))
+            for potion in sorted(set(potions)):
+                rest = list(potions)
+                rest.remove(potion)
+                value = self._respond(min(model.hero_max, hero_pv + potion), enemy_pvs, tuple(rest), depth)
+                if value > best[0]:
+                    best = (value, ("use item", potion))
+        self.table[key] = best
+        return best
+
+    def _respond(self, hero_pv, enemy_pvs, potions, depth, index=0):
+        """Valeur espérée après la réponse des ennemis à partir de l'ennemi `index`"""
+        if index == 0 and not any(pv > 0 for pv in enemy_pvs):
+            return WIN + hero_pv + POTION_WORTH * sum(potions)
+        if index == len(enemy_pvs):
+            if depth <= 1:
+                return self._leaf(hero_pv, enemy_pvs, potions)
+            return self._max(hero_pv, enemy_pvs, potions, depth - 1)[0]
+        pv = enemy_pvs[index]
+        if pv <= 0:
+            return self._respond(hero_pv, enemy_pvs, potions, depth, index + 1)
+
+        max_pv, heal, attack, double, rolls = self.model.enemies[index]
+        healed = enemy_pvs[:index] + (min(max_pv, pv + heal),) + enemy_pvs[index + 1:]
+        value = (1 - attack) * self._respond(hero_pv, healed, potions, depth, index + 1)
+        p_kill, damage = self.model.enemy_hit(index, hero_pv)
+        value -= attack * p_kill * WIN
+        if p_kill < 1:
+            value += attack * (1 - p_kill) * self._respond(max(hero_pv - damage, 1), enemy_pvs, potions, depth,
+                                                         index + 1)
+        return value
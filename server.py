@@ -0,0 +1,255 @@
+"""Serveur de parties : des sessions d'exploration simultanées sur un socket local.
+
+Protocole : un objet JSON par ligne, dans les deux sens.
+
+    client  {"type": "start", "name": "Jane", "stages": 10, "seed": 3}
+    serveur {"type": "event", "event": "damage_taken", "subject": "Jane", "data": 12}
+    serveur {"type": "prompt", "kind": "action", "message": "...", "choices": ["attack", ...]}
+    client  {"type": "answer", "choice": 0}
+    serveur {"type": "end", "won": true, "battles_won": 4, "stage": 11, "exp": 230}
+
+Chaque session a son héros, son bus d'événements, son Team et son
+ExplorationZone. La boucle asyncio ne fait que les entrées/sorties ; la
+partie elle-même est le code synchrone de game.py, joué dans un thread de
+la session qui reste bloqué (sans consommer de CPU) tant que le joueur n'a
+pas répondu. La pile d'un thread n'occupe en mémoire que les pages touchées
+(quelques dizaines de Ko pour une partie) : la taille de pile du processus
+n'est pas modifiée. Chaque thread a ses flux aléatoires (rng.streams passe
+en mode per_thread) et son pool d'ennemis : une session seedée se rejoue à
+l'identique, quelles que soient les autres sessions. Les événements d'une session sont envoyés par paquets à
+chaque question, ce qui borne la mémoire de chaque session.
+"""
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from base import InputProvider, InteractivePolicy, Character
+from events import EventBus
+from exploration import ExplorationZone
+from factories import HeroFactory
+from game import run_exploration
+from observer import Observer, GameObserver
+from rng import streams
+
+MAX_PENDING = 256  # Événements mis en attente avant un envoi forcé
+MAX_STAGES = 100
+
+logger = logging.getLogger(__name__)
+
+
+class SessionClosed(Exception):
+    """Le client s'est déconnecté pendant la partie"""
+
+
+def _jsonable(value):
+    """Données d'événement sérialisables : personnages par leur nom, objets par leur libellé"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Character):
+        return value.name
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, ExplorationZone):
+        return {"zone": value.name, "stage": value.current_stage, "num_stages": value.num_stages}
+    return str(value)
+
+
+def _line(message):
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class SessionObserver(Observer):
+    """Transmet au client les événements affichés d'habitude dans le terminal"""
+    events = GameObserver.events
+
+    def __init__(self, session):
+        self.session = session
+
+    def notify(self, subject, event_type, data):
+        self.session.send({"type": "event", "event": event_type, "subject": subject.name, "data": _jsonable(data)})
+
+
+class Session(InputProvider):
+    """Une partie en cours : le thread de jeu pose les questions, la boucle asyncio reçoit les réponses"""
+
+    def __init__(self, loop, writer):
+        self.loop = loop
+        self.writer = writer
+        self.pending = []  # Lignes produites par le thread de jeu, pas encore envoyées
+        self.choices = None  # Libellés de la question en cours
+        self.answer = None  # Future de la réponse attendue par le thread de jeu
+        self.closed = False
+
+    # --- Côté thread de jeu ---
+    def send(self, message):
+        self.pending.append(_line(message))
+        if len(self.pending) >= MAX_PENDING:
+            self.flush()
+
+    def flush(self):
+        """Envoie les lignes en attente et attend que le client les lise (pas de tampon sans limite)"""
+        if self.pending:
+            data = b"".join(self.pending)
+            self.pending = []
+            try:
+                asyncio.run_coroutine_threadsafe(self._write(data), self.loop).result()
+            except (ConnectionError, RuntimeError) as error:
+                raise SessionClosed() from error
+
+    async def _write(self, data):
+        self.writer.write(data)
+        await self.writer.drain()  # Bloque le thread de jeu tant que le client ne lit pas
+
+    def select(self, kind, message, choices):
+        if self.closed:
+            raise SessionClosed()
+        self.answer = Future()
+        self.choices = choices
+        self.send({"type": "prompt", "kind": kind, "message": message, "choices": choices})
+        self.flush()
+        return self.answer.result()
+
+    def play(self, name, num_stages, seed):
+        streams.seed(seed)  # Flux du thread de la session (voir GameServer._executor)
+        bus = EventBus()
+        bus.attach(SessionObserver(self))
+        hero = HeroFactory(bus).create_character(name, InteractivePolicy(self))
+        zone = ExplorationZone(f"Zone of {name}", hero, num_stages, seed=seed)
+        try:
+            won, battles_won, stage = run_exploration(hero, zone=zone)
+            end = {"type": "end", "won": won, "battles_won": battles_won, "stage": stage, "exp": hero.exp}
+        except SystemExit:  # Action "exit game"
+            end = {"type": "end", "won": False, "exit": True, "exp": hero.exp}
+        except SessionClosed:
+            return
+        self.send(end)
+        try:
+            self.flush()
+        except SessionClosed:
+            pass
+
+    # --- Côté boucle asyncio ---
+    def receive(self, message):
+        """Traite une ligne du client, retourne un message d'erreur à lui renvoyer ou None"""
+        if message.get("type") != "answer" or self.answer is None or self.answer.done():
+            return {"type": "error", "message": "no question pending"}
+        choice = message.get("choice")
+        if not isinstance(choice, int) or not 0 <= choice < len(self.choices):
+            return {"type": "error", "message": f"choice must be an index below {len(self.choices)}"}
+        self.answer.set_result(choice)
+        return None
+
+    def close(self):
+        self.closed = True
+        if self.answer is not None and not self.answer.done():
+            self.answer.set_exception(SessionClosed())
+
+
+class GameServer:
+    """Sessions simultanées, au plus `max_sessions` (les suivantes sont refusées)"""
+
+    def __init__(self, max_sessions=2048):
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.executor = None
+
+    def _executor(self):
+        if self.executor is None:
+            streams.per_thread()
+            self.executor = ThreadPoolExecutor(self.max_sessions, thread_name_prefix="session")
+        return self.executor
+
+    async def handle(self, reader, writer):
+        try:
+            start = json.loads(await reader.readline() or b"null")
+        except ValueError:
+            start = None
+        if not isinstance(start, dict) or start.get("type") != "start":
+            writer.write(_line({"type": "error", "message": "expected a start message"}))
+        elif not isinstance(start.get("stages", 10), int) or not isinstance(start.get("seed"), (int, type(None))):
+            writer.write(_line({"type": "error", "message": "stages and seed must be integers"}))
+        elif self.sessions >= self.max_sessions:
+            writer.write(_line({"type": "error", "message": "server full"}))
+        else:
+            name = str(start.get("name") or "Hero")[:32]
+            num_stages = max(1, min(start.get("stages", 10), MAX_STAGES))
+            await self._run(reader, writer, name, num_stages, start.get("seed"))
+        writer.close()
+
+    async def _run(self, reader, writer, name, num_stages, seed):
+        loop = asyncio.get_running_loop()
+        session = Session(loop, writer)
+        self.sessions += 1
+        game = loop.run_in_executor(self._executor(), session.play, name, num_stages, seed)
+        try:
+            while not game.done():
+                read = asyncio.ensure_future(reader.readline())
+                await asyncio.wait((read, game), return_when=asyncio.FIRST_COMPLETED)
+                if not read.done():
+                    read.cancel()
+                    break
+                line = read.result()
+                if not line:
+                    break  # Client déconnecté
+                try:
+                    error = session.receive(json.loads(line))
+                except (ValueError, AttributeError):
+                    error = {"type": "error", "message": "invalid JSON"}
+                if error:
+                    writer.write(_line(error))
+                await writer.drain()
+        finally:
+            session.close()
+            try:
+                await game  # Le thread de la partie occupe sa place dans l'executor jusqu'ici
+            except Exception:
+                logger.exception("Session of %s ended with an error", name)
+            finally:
+                self.sessions -= 1
+        await writer.drain()
+
+    async def serve(self, host="127.0.0.1", port=8765, path=None):
+        # File d'attente à la taille du serveur : des centaines de clients se connectent d'un coup
+        if path:
+            return await asyncio.start_unix_server(self.handle, path, backlog=self.max_sessions)
+        return await asyncio.start_server(self.handle, host, port, backlog=self.max_sessions)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            streams.reset()  # Flux ordinaires, partagés par tout le processus
+
+
+async def _main(args):
+    game_server = GameServer(args.max_sessions)
+    server = await game_server.serve(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving game sessions on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        game_server.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur de parties (JSON ligne par ligne)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="chemin d'un socket Unix (à la place de --host/--port)")
+    parser.add_argument("--max-sessions", type=int, default=2048)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
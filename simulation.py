@@ -0,0 +1,170 @@
+"""Simulation de combats sans interface, pour l'équilibrage du jeu"""
+import argparse
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from base import Team, Weapon
+from factories import HeroFactory, EnemyFactory, BossFactory
+from game import resolve_battle
+from policies import GreedyPolicy
+from rng import streams
+
+MAX_TURNS = 200  # Un combat qui dépasse cette limite est compté comme nul
+HP_BUCKET = 5  # Largeur (en %) des tranches de l'histogramme des PV restants
+
+
+class SimulationReport:
+    """Statistiques agrégées d'une série de combats"""
+    def __init__(self):
+        self.battles = 0
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.turns = Counter()
+        self.hp_remaining = Counter()  # tranche de PV restants (en %) -> nombre de combats gagnés
+
+    def record(self, outcome, turns, hp_ratio):
+        self.battles += 1
+        if outcome == "win":
+            self.wins += 1
+            self.hp_remaining[int(hp_ratio * 100) // HP_BUCKET * HP_BUCKET] += 1
+        elif outcome == "loss":
+            self.losses += 1
+        else:
+            self.draws += 1
+        self.turns[turns] += 1
+
+    def merge(self, other):
+        self.battles += other.battles
+        self.wins += other.wins
+        self.losses += other.losses
+        self.draws += other.draws
+        self.turns.update(other.turns)
+        self.hp_remaining.update(other.hp_remaining)
+        return self
+
+    @property
+    def win_rate(self):
+        return self.wins / self.battles if self.battles else 0.0
+
+    @property
+    def mean_turns(self):
+        return sum(turns * count for turns, count in self.turns.items()) / self.battles if self.battles else 0.0
+
+    def turns_percentile(self, percentile):
+        """Nombre de tours en dessous duquel se trouvent `percentile` % des combats"""
+        threshold = self.battles * percentile / 100
+        seen = 0
+        for turns in sorted(self.turns):
+            seen += self.turns[turns]
+            if seen >= threshold:
+                return turns
+        return 0
+
+    def summary(self):
+        return {
+            "battles": self.battles,
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "win_rate": round(self.win_rate, 4),
+            "mean_turns": round(self.mean_turns, 2),
+            "turns_p50": self.turns_percentile(50),
+            "turns_p95": self.turns_percentile(95),
+            "turns": dict(sorted(self.turns.items())),
+            "hp_remaining": dict(sorted(self.hp_remaining.items())),
+        }
+
+
+def battle_seed(seed, index):
+    """Graine dérivée pour le combat numéro `index` d'une série"""
+    return seed * 1_000_000_007 + index
+
+
+def simulate_battle(seed, policy, hero_exp=0, boss=False, max_turns=MAX_TURNS):
+    """Joue un combat complet sans affichage, retourne (issue, tours, ratio de PV du héros)"""
+    streams.seed(seed)
+    hero = HeroFactory(bus=None).create_character("Sim Hero", policy)
+    hero.exp = hero_exp
+    hero_team = Team("Hero Team")
+    hero_team.add_member(hero)
+
+    enemy_factory = EnemyFactory(bus=None)
+    enemy_team = Team("Enemy Team")
+    if boss:
+        # Même composition que le boss de fin d'exploration
+        enemy_team.add_member(BossFactory(bus=None).create_boss(hero))
+        for escort in enemy_factory.create_enemies(hero, 2):
+            enemy_team.add_member(escort)
+    else:
+        # Même tirage que le Mode Classique
+        enemy = enemy_factory.create_enemy(hero)
+        if streams.factory.random() > 0.5:
+            enemy.inventory.append(Weapon.shared("Random Weapon", streams.factory.randint(20, 30)))
+        enemy_team.add_member(enemy)
+
+    turns = resolve_battle(hero_team, enemy_team, max_turns)
+    if enemy_team.is_defeated():
+        outcome = "win"
+    elif hero_team.is_defeated():
+        outcome = "loss"
+    else:
+        outcome = "draw"
+    enemy_factory.release(*enemy_team.members)
+    return outcome, turns, hero._pv / hero.max_pv
+
+
+def _run_chunk(args):
+    """Joue une tranche de combats dans un processus et renvoie son rapport partiel"""
+    seed, start, count, policy, scenario = args
+    report = SimulationReport()
+    for index in range(start, start + count):
+        report.record(*simulate_battle(battle_seed(seed, index), policy, **scenario))
+    return report
+
+
+def run_simulation(num_battles, policy=None, seed=0, workers=None, chunk_size=2000, **scenario):
+    """Répartit `num_battles` combats seedés sur un pool de processus et agrège les résultats.
+
+    Chaque tranche de `chunk_size` combats est agrégée dans son processus, seul le
+    rapport partiel transite entre processus. Avec `workers=1` tout est joué sur place.
+    """
+    policy = policy or GreedyPolicy()
+    chunks = [
+        (seed, start, min(chunk_size, num_battles - start), policy, scenario)
+        for start in range(0, num_battles, chunk_size)
+    ]
+    report = SimulationReport()
+    if workers == 1:
+        for chunk in chunks:
+            report.merge(_run_chunk(chunk))
+        return report
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for partial in pool.map(_run_chunk, chunks):
+            report.merge(partial)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless battle simulator")
+    parser.add_argument("-n", "--battles", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--hero-exp", type=int, default=0)
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("--policy", choices=("greedy", "expectimax"), default="greedy")
+    args = parser.parse_args(argv)
+
+    policy = None
+    if args.policy == "expectimax":
+        from search import ExpectimaxPolicy
+        policy = ExpectimaxPolicy()
+    result = run_simulation(args.battles, policy, seed=args.seed, workers=args.workers,
+                            hero_exp=args.hero_exp, boss=args.boss)
+    print(json.dumps(result.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Test d'endurance du Mode Classique : la mémoire grandit-elle avec le nombre de combats ?
+
+Joue run_classic sans interface, sans fin (un nouveau héros remplace celui
+qui meurt), et relève tous les --interval combats la mémoire suivie par
+tracemalloc (après un passage du ramasse-miettes) et la mémoire résidente
+du processus. Les premiers combats (--warmup) remplissent les caches (armes
+partagées, modèles d'ennemis, pool, barres de vie) et ne comptent pas.
+
+La croissance est la pente (moindres carrés) de la mémoire suivie en
+fonction du nombre de combats, ramenée à 10 000 combats ; au-delà de
+--budget octets, la commande échoue (code 1) et le rapport liste les lignes
+de code dont les allocations ont le plus grandi depuis la fin de l'échauffement.
+
+    python -m soak --battles 1000000 --interval 50000 --budget 65536
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+from events import EventBus
+from factories import HeroFactory
+from game import run_classic
+from policies import GreedyPolicy
+from rng import streams
+
+PER = 10_000  # La croissance est exprimée par PER combats
+TOP_SITES = 10
+
+
+def rss():
+    """Mémoire résidente actuelle du processus en octets (pic si /proc n'existe pas)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def slope(points):
+    """Pente des moindres carrés de [(x, y)]"""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance if variance else 0.0
+
+
+class SoakReport:
+    """Relevés d'un test d'endurance et verdict par rapport au budget"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.samples = []  # (combats, octets suivis par tracemalloc, RSS)
+        self.sites = []  # (fichier:ligne, octets en plus, allocations en plus)
+        self.heroes = 0
+        self.elapsed = 0.0
+
+    @property
+    def battles(self):
+        return self.samples[-1][0] if self.samples else 0
+
+    @property
+    def growth(self):
+        """Octets suivis en plus par PER combats"""
+        return slope([(battles, traced) for battles, traced, _ in self.samples]) * PER
+
+    @property
+    def rss_growth(self):
+        return slope([(battles, resident) for battles, _, resident in self.samples]) * PER
+
+    @property
+    def ok(self):
+        return self.growth <= self.budget
+
+    def summary(self):
+        return {
+            "battles": self.battles,
+            "heroes": self.heroes,
+            "seconds": round(self.elapsed, 1),
+            "budget_per_10k": self.budget,
+            "growth_per_10k": round(self.growth),
+            "rss_growth_per_10k": round(self.rss_growth),
+            "ok": self.ok,
+            "samples": [{"battles": b, "traced": t, "rss": r} for b, t, r in self.samples],
+            "growing_sites": [{"site": s, "size_diff": size, "count_diff": count} for s, size, count in self.sites],
+        }
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+
+def soak(battles, interval=10_000, warmup=None, budget=64 * 1024, seed=0, policy=None, bus=None, frames=1):
+    """Joue `battles` combats du Mode Classique (au moins) et retourne un SoakReport"""
+    warmup = interval if warmup is None else warmup
+    report = SoakReport(budget)
+    policy = policy or GreedyPolicy()
+    streams.seed(seed)
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start(frames)
+    baseline = None
+    played = 0
+    next_sample = warmup
+    start = time.perf_counter()
+    try:
+        while played < battles:
+            hero = HeroFactory(bus).create_character(f"Soak Hero {report.heroes}", policy)
+            report.heroes += 1
+            while played < battles:
+                # Un appel de run_classic par intervalle : le héros continue tant qu'il gagne
+                won, battles_won = run_classic(hero, max_battles=max(next_sample - played, 1))
+                played += battles_won + (not won)
+                if played >= next_sample:
+                    gc.collect()
+                    if baseline is None:
+                        baseline = _snapshot()
+                    report.samples.append((played, tracemalloc.get_traced_memory()[0], rss()))
+                    next_sample += interval
+                if not won:
+                    break
+        report.elapsed = time.perf_counter() - start
+        if baseline is not None:
+            growth = _snapshot().compare_to(baseline, "lineno")
+            report.sites = [(f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff,
+                             stat.count_diff) for stat in growth[:TOP_SITES] if stat.size_diff > 0]
+    finally:
+        if not started:
+            tracemalloc.stop()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test d'endurance mémoire du Mode Classique")
+    parser.add_argument("--battles", type=int, default=1_000_000)
+    parser.add_argument("--interval", type=int, default=50_000, help="combats entre deux relevés")
+    parser.add_argument("--warmup", type=int, default=None, help="combats d'échauffement (par défaut : --interval)")
+    parser.add_argument("--budget", type=int, default=64 * 1024, help="croissance tolérée, en octets par 10 000 combats")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--render", action="store_true", help="affichage par images vers /dev/null pendant le test")
+    parser.add_argument("--json", action="store_true", help="rapport complet en JSON")
+    args = parser.parse_args(argv)
+
+    bus = renderer = None
+    if args.render:
+        from render import FrameRenderer
+        renderer = FrameRenderer(open(os.devnull, "w", encoding="utf-8"), tty=False)
+        bus = EventBus()
+        bus.attach(renderer)
+    report = soak(args.battles, args.interval, args.warmup, args.budget, args.seed, bus=bus)
+    if renderer is not None:
+        renderer.close()
+
+    if args.json:
+        print(json.dumps(report.summary(), indent=2))
+    else:
+        print(f"{report.battles:,} battles ({report.heroes:,} heroes) in {report.elapsed:.0f}s | "
+              f"traced growth {report.growth:+,.0f} B / 10k battles (budget {args.budget:,}) | "
+              f"RSS growth {report.rss_growth:+,.0f} B / 10k battles")
+        for site, size, count in report.sites:
+            print(f"  {size:>+12,} B {count:>+9,} blocks  {site}")
+        print("OK" if report.ok else "FAIL: memory grows faster than the budget")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
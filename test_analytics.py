@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from analytics import EventSink, Aggregator, read_chunk
+from events import EventBus
+from factories import HeroFactory
+from game import run_exploration
+from policies import GreedyPolicy
+from rng import streams
+
+
+@pytest.fixture
+def events(tmp_path):
+    """Événements de quelques explorations seedées, en petits blocs"""
+    directory = tmp_path / "events"
+    sink = EventSink(directory, chunk_rows=100)
+    bus = EventBus()
+    bus.attach(sink)
+    streams.seed(5)
+    results = []
+    for _ in range(30):
+        hero = HeroFactory(bus).create_character("Test Hero", GreedyPolicy())
+        results.append(run_exploration(hero, 4))
+    sink.close()
+    return directory, sink, results
+
+
+def test_chunks(events):
+    """Test que les blocs sont relus tels qu'écrits, en mémoire mappée"""
+    directory, sink, results = events
+    assert sink.chunks > 1
+    columns = read_chunk(directory / "chunk-000000.bin")
+    assert isinstance(columns["kind"], np.memmap)
+    assert len(columns["run"]) == 100
+    assert columns["run"][0] == 1 and np.all(np.diff(columns["run"]) >= 0)
+    # Un nouvel EventSink sur le même répertoire continue la numérotation des blocs et des sessions
+    resumed = EventSink(directory)
+    assert resumed.chunks == sink.chunks and resumed.run == 30
+
+
+def test_summary(events):
+    """Test des résumés : combats, morts et victoires comptés une seule fois"""
+    directory, sink, results = events
+    aggregator = Aggregator(directory).run()
+    summary = aggregator.summary()
+    assert aggregator.wins.sum() == sum(battles for won, battles, stage in results)
+    deaths = [stage for won, battles, stage in results if not won]
+    assert summary["stage_of_death"] == {stage: deaths.count(stage) for stage in set(deaths)}
+    assert summary["victories"] == sum(won for won, battles, stage in results)
+    assert set(summary["win_rate_by_difficulty"]) <= {"easy", "normal", "hard", "boss"}
+    assert summary["damage_by_weapon"]["Iron Sword"]["attacks"] > 0
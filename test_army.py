@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from army import ArmyTeam, create_armies, resolve_army_battle, threat
+from base import Enemy, Weapon
+from rng import streams
+
+
+@pytest.fixture
+def team():
+    """Équipe de 200 ennemis aux PV et dégâts variés, noms répétés"""
+    rng = random.Random(1)
+    members = []
+    for _ in range(200):
+        enemy = Enemy("Goblin", "beast", rng.randint(50, 150), rng.randint(5, 30))
+        if rng.random() < 0.3:
+            enemy.inventory.append(Weapon.shared("Rusty Sword", rng.randint(15, 20)))
+        members.append(enemy)
+    return ArmyTeam("Goblins", members)
+
+
+def test_index_follows_damage_and_heal(team):
+    """Test que les cibles indexées sont celles d'une recherche linéaire, après dégâts, soins et morts"""
+    rng = random.Random(2)
+    for _ in range(2000):
+        alive = team.get_alive_members()
+        if not alive:
+            break
+        assert team.pick("lowest_hp")._pv == min(enemy._pv for enemy in alive)
+        assert threat(team.pick("highest_threat")) == max(threat(enemy) for enemy in alive)
+        assert team.pick("random", rng) in alive
+        target = rng.choice(team.members)
+        if rng.random() < 0.7:
+            target.take_damage(rng.randint(1, 60))
+        else:
+            target.heal(rng.randint(1, 30))  # Peut ressusciter un mort
+        assert sorted(map(id, team.get_alive_members())) == sorted(id(m) for m in team.members if m._pv > 0)
+
+
+def test_area_hits_neighbours(team):
+    """Test qu'une attaque de zone touche la cible et ses voisins vivants dans la formation"""
+    members = team.members
+    members[11].take_damage(1000)
+    assert team.area(members[10], 2) == [members[8], members[9], members[10], members[12]]
+    assert team.area(members[0], 1) == members[:2]
+
+
+def test_army_battle():
+    """Test d'une bataille de centaines de personnages jusqu'à la victoire d'un camp"""
+    streams.seed(3)
+    heroes, enemies = create_armies(150, 200)
+    turns = resolve_army_battle(heroes, enemies, ("highest_threat", "lowest_hp"), max_turns=500, area_chance=0.2)
+    assert 0 < turns < 500
+    assert heroes.is_defeated() != enemies.is_defeated()
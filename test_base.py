@@ -1,5 +1,5 @@
 import pytest
-from base import Hero, Enemy, Boss
+from base import Hero, Enemy, Boss, Team, Weapon, HealPotion
 from observer import GameObserver
 
 @pytest.fixture
@@ -13,9 +13,9 @@ def enemy():
     return Enemy("Goblin", "beast", 50, 10)
 
 @pytest.fixture
-def boss():
-    """Fixture pour créer un boss de test"""
-    return Boss("Dragon", 200, 30)
+def boss(hero):
+    """Fixture pour créer un boss de test (ses stats dépendent du héros)"""
+    return Boss("Dragon", hero)
 
 # ----- Tests pour Hero -----
 def test_hero_initialization(hero):
@@ -53,4 +53,60 @@ def test_hero_attack(hero, enemy): # randomize(weapon.damage + self.damage) qui
     damage_max = int(20 * 1.1)  # damage de base 20, randomisé à 110%
     hero.attack(enemy)
     assert enemy._pv <= 50 - damage_min
-    assert enemy._pv >= 50 - damage_max
\ No newline at end of file
+    assert enemy._pv >= 50 - damage_max
+# ----- Tests pour Boss -----
+def test_boss_scales_with_hero(hero, boss):
+    """Test que le boss est plus fort que le héros qu'il affronte"""
+    assert boss.max_pv == int(hero.max_pv * 1.2) + int(int(hero.max_pv * 1.2) * 0.3)
+    assert boss.damage == hero.damage
+    assert boss.inventory.best_weapon.damage == hero.damage + 15
+
+# ----- Tests pour Team -----
+def test_team_tracks_deaths_and_revives(hero, enemy):
+    """Test que les vivants de l'équipe suivent les morts et les soins sans rescanner"""
+    team = Team("Heroes")
+    team.add_member(hero)
+    team.add_member(enemy)
+    alive = team.get_alive_members()
+    enemy.take_damage(50)
+    assert alive == [hero, enemy]  # Copie : une mort ne la modifie pas
+    assert team.get_alive_members() == [hero] and team.alive_count == 1
+    hero.take_damage(500)
+    assert team.is_defeated()
+    hero.heal(10)
+    assert team.get_alive_members() == [hero] and not team.is_defeated()
+
+    crowd = Team("Goblins")
+    goblins = [Enemy(f"Goblin {i}", "beast", 10, 1) for i in range(6)]
+    for goblin in goblins:
+        crowd.add_member(goblin)
+    goblins[0].take_damage(10)  # Le dernier vivant prend la place du mort dans _alive
+    goblins[3].take_damage(10)
+    goblins[3].take_damage(10)  # Déjà mort : rien ne change
+    assert crowd._alive == [goblins[5], goblins[1], goblins[2], goblins[4]]
+    assert crowd.get_alive_members() == [goblins[1], goblins[2], goblins[4], goblins[5]]  # Ordre de members
+    goblins[0].heal(5)
+    assert sorted(map(id, crowd.get_alive_members())) == sorted(id(g) for g in goblins if g._pv > 0)
+
+# ----- Tests pour Inventory -----
+def test_inventory_buckets_and_best_weapon(hero):
+    """Test que l'inventaire range les armes à part et suit la meilleure"""
+    sword, axe = Weapon("Sword", 10), Weapon("Axe", 25)
+    hero.inventory.append(sword)
+    hero.inventory.append(axe)
+    hero.inventory.append(HealPotion("Health Potion", 30))
+    assert hero.inventory.weapons == [sword, axe]
+    assert hero.inventory.best_weapon is axe
+    hero.inventory.remove(axe)
+    assert hero.inventory.best_weapon is sword
+
+def test_inventory_stacks_potions(hero):
+    """Test que les potions identiques sont empilées"""
+    for _ in range(100):
+        hero.inventory.append(HealPotion("Health Potion", 30))
+    potion = hero.inventory.consumables[0]
+    assert len(hero.inventory.consumables) == 1 and hero.inventory.count(potion) == 100
+    hero.take_damage(50)
+    potion.use(hero)
+    hero.inventory.remove(potion)
+    assert hero._pv == 80 and len(hero.inventory) == 99
@@ -0,0 +1,11 @@
+from benchmarks.suite import CASES, run_suite, compare
+
+
+def test_suite_runs_every_case():
+    """Test que chaque cas de la suite tourne et produit un débit comparable"""
+    report = run_suite(repeat=1, scale=0.001)
+    assert set(report["results"]) == set(CASES)
+    assert all(result["ops_per_sec"] > 0 for result in report["results"].values())
+    slower = {"results": {name: dict(result, ops_per_sec=result["ops_per_sec"] * 10)
+                          for name, result in report["results"].items()}}
+    assert compare(report, slower, 0.1) == list(CASES)
@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from checkpoint import Checkpoint, CheckpointError, load, resume_exploration
+from exploration import ExplorationZone
+from factories import HeroFactory
+from policies import GreedyPolicy
+from rng import streams
+
+
+@pytest.fixture
+def zone():
+    """Zone dont le héros a déjà un peu progressé"""
+    streams.seed(2)
+    hero = HeroFactory(bus=None).create_character("Jane", GreedyPolicy())
+    zone = ExplorationZone("Test Zone", hero, num_stages=10)
+    for _ in range(3):
+        zone.explore_stage()
+    hero.gain_exp(60)
+    return zone
+
+
+def test_checkpoint_round_trip(zone, tmp_path):
+    """Test que le dernier état relu correspond à la partie, deltas compris"""
+    path = tmp_path / "run.ckpt"
+    hero = zone.hero
+    with Checkpoint(path) as checkpoint:
+        checkpoint.save(zone, battles_won=1)
+        size = path.stat().st_size
+        checkpoint.save(zone, battles_won=1)
+        assert path.stat().st_size == size  # Rien n'a changé, rien n'est écrit
+        zone.explore_stage()
+        hero.take_damage(7)
+        checkpoint.save(zone, battles_won=2)
+
+    state = load(path)
+    restored = state.build_hero(GreedyPolicy())
+    assert (restored._pv, restored.max_pv, restored.damage, restored.exp, restored.speed) == \
+        (hero._pv, hero.max_pv, hero.damage, hero.exp, hero.speed)
+    assert sorted((str(item), count) for item, count in restored.inventory.stacks()) == \
+        sorted((str(item), count) for item, count in hero.inventory.stacks())
+    restored_zone = state.build_zone(restored)
+    assert (restored_zone.current_stage, restored_zone.paths_history) == (zone.current_stage, zone.paths_history)
+    assert state.battles_won == 2
+
+
+def test_truncated_record_is_ignored(zone, tmp_path):
+    """Test qu'un enregistrement interrompu est ignoré et qu'un fichier étranger est refusé"""
+    path = tmp_path / "run.ckpt"
+    with Checkpoint(path) as checkpoint:
+        checkpoint.save(zone)
+    stage = zone.current_stage
+    with open(path, "ab") as f:
+        f.write(b"\x00\x24\x00\x01")
+    assert load(path).current_stage == stage
+
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(CheckpointError):
+        load(path)
+
+
+def test_resume_after_truncated_record(zone, tmp_path):
+    """Test qu'une reprise retire l'enregistrement tronqué avant d'ajouter les siens"""
+    path = tmp_path / "run.ckpt"
+    zone.name = "Zone " + "é" * 200  # Plus de 255 octets en UTF-8
+    with Checkpoint(path) as checkpoint:
+        checkpoint.save(zone, battles_won=1)
+    with open(path, "ab") as f:
+        f.write(b"\x00\x24\x00\x01")  # STATE interrompu après 1 octet
+    state = load(path)
+    hero = state.build_hero(GreedyPolicy())
+    resumed = state.build_zone(hero)
+    with Checkpoint.resume(path, state) as checkpoint:
+        resumed.explore_stage()
+        hero.take_damage(3)
+        checkpoint.save(resumed, battles_won=2)
+
+    reloaded = load(path)
+    assert (reloaded.zone_name, reloaded.current_stage, reloaded.battles_won) == \
+        (zone.name, resumed.current_stage, 2)
+    assert reloaded.stats[0] == hero._pv and reloaded.ended is None
+
+
+def test_save_is_fast(zone, tmp_path):
+    """Test qu'une sauvegarde prend bien moins d'une milliseconde"""
+    with Checkpoint(tmp_path / "run.ckpt") as checkpoint:
+        start = time.perf_counter()
+        for battles_won in range(1000):
+            checkpoint.save(zone, battles_won)
+        assert (time.perf_counter() - start) / 1000 < 0.001
+
+
+def test_resume_exploration(tmp_path):
+    """Test qu'une session interrompue reprend au stage sauvegardé"""
+    path = tmp_path / "run.ckpt"
+    streams.seed(5)
+    hero = HeroFactory(bus=None).create_character("Jane", GreedyPolicy())
+    zone = ExplorationZone("Test Zone", hero, num_stages=6)
+    with Checkpoint(path) as checkpoint:
+        for _ in range(3):
+            zone.explore_stage()  # Combats ignorés : seule la progression compte ici
+            checkpoint.save(zone)
+
+    (won, battles_won, stage), resumed = resume_exploration(path, GreedyPolicy())
+    assert stage > 3 and resumed.name == "Jane"
+    assert load(path).current_stage >= 3
+
+
+def test_finished_session_is_not_replayed(tmp_path, monkeypatch):
+    """Test qu'une session finie (victoire ou défaite) n'est ni rejouée ni comptée deux fois au classement"""
+    import main
+    import scores
+    saved = []
+    monkeypatch.setattr(scores, "save_score", lambda *args: saved.append(args))
+    path = tmp_path / "run.ckpt"
+    args = ["play", "--headless", "--quiet", "--stages", "3", "--checkpoint", str(path)]
+    for seed in range(4):
+        path.unlink(missing_ok=True)
+        for _ in range(3):
+            assert main.main(args + ["--seed", str(seed)]) == 0
+        if path.exists():
+            assert load(path).ended is not None
+            assert resume_exploration(path, GreedyPolicy())[0] is None
+    assert len(saved) == 4
@@ -0,0 +1,86 @@
+import pytest
+
+from base import Enemy, Hero, Team
+from effects import EffectWheel, Poison, Regeneration, Stun, Buff, WHEEL_SIZE
+from events import EventBus
+from game import resolve_battle
+from observer import Observer
+from policies import GreedyPolicy
+
+
+@pytest.fixture
+def goblin():
+    return Enemy("Goblin", "beast", 100, 10)
+
+
+def test_ticks_and_expirations(goblin):
+    """Test des tours où les effets agissent et finissent, y compris au-delà d'un tour de roue"""
+    wheel = EffectWheel()
+    wheel.apply(goblin, Poison(5, 3))  # Tours 1, 2, 3
+    wheel.apply(goblin, Buff(7, 2))
+    wheel.apply(goblin, Stun(1))
+    assert goblin.damage == 17 and goblin.stunned == 1
+    history = []
+    for turn in range(1, 5):
+        wheel.advance(turn)
+        history.append((goblin._pv, goblin.damage, goblin.stunned))
+    assert history == [(95, 17, 1), (90, 17, 0), (85, 10, 0), (85, 10, 0)]
+    assert len(wheel) == 0
+
+    wheel.apply(goblin, Regeneration(4, WHEEL_SIZE * 3, period=WHEEL_SIZE + 10))
+    goblin.take_damage(50)
+    for turn in range(5, 5 + WHEEL_SIZE * 3 + 2):
+        wheel.advance(turn)
+    assert goblin._pv == 35 + 4 * 2  # Ticks aux tours 78 et 152 seulement
+    stun = Stun(1)
+    wheel.apply(goblin, stun)
+    with pytest.raises(ValueError):
+        wheel.apply(goblin, stun)  # Un effet ne sert qu'une fois
+
+
+def test_dead_targets_and_cancel(goblin):
+    """Test qu'un mort perd ses effets et qu'un effet annulé ne revient pas"""
+    wheel = EffectWheel()
+    poison, buff = Poison(60, 5), Buff(-5, 10)
+    wheel.apply(goblin, poison)
+    wheel.apply(goblin, buff)
+    wheel.cancel(buff)
+    assert goblin.damage == 10
+    for turn in range(1, 4):
+        wheel.advance(turn)
+    assert goblin._pv == 0 and len(wheel) == 0 and not poison.active
+    with pytest.raises(ValueError):
+        Buff(20, 3, stat="max_pv")  # Le setter de max_pv ne sait pas le rendre
+
+
+class StunOnFirstTurn(Observer):
+    """Étourdit l'ennemi et renforce le héros au premier tour, compte les tours perdus"""
+    events = ("turn_start", "stunned")
+
+    def __init__(self, hero, enemy):
+        self.hero, self.enemy = hero, enemy
+        self.stunned = []
+
+    def notify(self, subject, event_type, data):
+        if event_type == "stunned":
+            self.stunned.append(subject)
+        elif data == 1:
+            assert self.enemy.team.effects is None  # Pas de roue avant le premier effet
+            assert self.enemy.apply_effect(Stun(2)) and self.hero.apply_effect(Buff(100, 1))
+
+
+def test_effects_in_battle():
+    """Test d'un combat : l'ennemi étourdi passe ses tours, tout est levé à la fin du combat"""
+    hero = Hero("Jane", "human", 100, 10, GreedyPolicy())
+    enemy = Enemy("Troll", "giant", 1000, 1)
+    observer = StunOnFirstTurn(hero, enemy)
+    bus = EventBus()
+    bus.attach(observer)
+    hero.bus = enemy.bus = bus
+    hero_team, enemy_team = Team("Heroes"), Team("Enemies")
+    hero_team.add_member(hero)
+    enemy_team.add_member(enemy)
+    resolve_battle(hero_team, enemy_team, max_turns=5)
+    assert observer.stunned == [enemy, enemy]
+    assert hero.damage == 10 and enemy.stunned == 0
+    assert hero_team.effects is None and not hero.apply_effect(Stun(1))  # Hors combat : ignoré
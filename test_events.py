@@ -0,0 +1,77 @@
+from base import Enemy
+from events import EventBus
+from factories import HeroFactory, EnemyFactory
+from observer import Observer, GameObserver, GAME_BUS
+from policies import GreedyPolicy
+
+
+class RecordingObserver(Observer):
+    """Observateur de test qui n'écoute que les dégâts"""
+    events = ("damage_taken",)
+
+    def __init__(self):
+        self.received = []
+
+    def notify(self, subject, event_type, data):
+        self.received.append((subject.name, event_type, data))
+
+
+def test_bus_dispatches_only_subscribed_events():
+    """Test que seuls les événements écoutés sont transmis"""
+    bus = EventBus()
+    observer = RecordingObserver()
+    bus.attach(observer)
+    enemy = Enemy("Goblin", "beast", 50, 10)
+    enemy.bus = bus
+    enemy.take_damage(10)
+    enemy.heal(5)
+    assert observer.received == [("Goblin", "damage_taken", 10)]
+
+
+def test_bus_wants_only_subscribed_events():
+    """Test que l'émetteur sait quand un événement n'a aucun abonné"""
+    bus = EventBus()
+    bus.attach(RecordingObserver())
+    assert bus.wants("damage_taken")
+    assert not bus.wants("attack")
+
+
+def test_characters_share_bus():
+    """Test qu'un observateur attaché au bus partagé reçoit les événements de tous les personnages"""
+    bus = EventBus()
+    observer = RecordingObserver()
+    bus.attach(observer)
+    goblin, wolf = Enemy("Goblin", "beast", 50, 10), Enemy("Wolf", "beast", 50, 10)
+    goblin.bus = wolf.bus = bus
+    goblin.take_damage(3)
+    wolf.take_damage(4)
+    bus.detach(observer)
+    wolf.take_damage(5)
+    assert observer.received == [("Goblin", "damage_taken", 3), ("Wolf", "damage_taken", 4)]
+    assert goblin.observers == ()
+
+
+def test_add_observer_leaves_game_bus_untouched():
+    """Test qu'un observateur ajouté à un héros du bus global ne concerne que ce héros"""
+    hero = HeroFactory().create_character("Jane", GreedyPolicy())
+    observer = RecordingObserver()
+    hero.add_observer(observer)
+    assert hero.bus is not GAME_BUS and observer not in GAME_BUS.observers
+    other = EnemyFactory().create_enemy(hero)
+    other.take_damage(2)
+    hero.take_damage(1)
+    assert observer.received == [("Jane", "damage_taken", 1)]
+    assert set(GAME_BUS.observers) <= set(hero.observers)  # L'affichage du jeu reste branché
+
+
+def test_detach_one_game_observer_keeps_the_other(capsys):
+    """Test que détacher un GameObserver laisse un autre GameObserver du même bus afficher"""
+    bus = EventBus()
+    first, second = GameObserver(), GameObserver()
+    bus.attach(first)
+    bus.attach(second)
+    bus.detach(first)
+    enemy = Enemy("Goblin", "beast", 50, 10)
+    enemy.bus = bus
+    enemy.take_damage(10)
+    assert capsys.readouterr().out.count("Goblin takes 10 damage!") == 1
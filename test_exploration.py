@@ -0,0 +1,35 @@
+import random
+import tracemalloc
+from itertools import islice
+
+from exploration import ExplorationZone, generate_stages
+from factories import HeroFactory
+from policies import GreedyPolicy
+
+
+def describe(paths):
+    return [(path.name, path.event.event_type, str(path.event.value)) for path in paths]
+
+
+def test_seeded_zone_matches_preview():
+    """Test qu'une zone seedée joue exactement les stages prévisualisés avec la même graine"""
+    preview = [describe(paths) for paths in generate_stages(random.Random(11), count=5)]
+    hero = HeroFactory(bus=None).create_character("Jane", GreedyPolicy())
+    zone = ExplorationZone("Test Zone", hero, num_stages=5, seed=11)
+    played = [describe(zone.generate_paths()) for _ in range(5)]
+    assert played == preview
+    assert all(2 <= len(stage) <= 4 for stage in preview)
+
+
+def test_streaming_memory_is_bounded():
+    """Test que parcourir 10 fois plus de stages ne demande pas plus de mémoire"""
+    def peak(count):
+        tracemalloc.start()
+        for _ in generate_stages(random.Random(3), count):
+            pass
+        result = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result
+
+    assert peak(5_000) < 2 * peak(500)
+    assert len(list(islice(generate_stages(random.Random(3)), 50))) == 50  # Flux sans fin par défaut
@@ -0,0 +1,19 @@
+from factories import HeroFactory
+from game import run_classic
+from main import main
+from policies import GreedyPolicy
+from rng import streams
+
+
+def test_headless_play_runs_without_prompt():
+    """Test qu'une partie sans interface se joue jusqu'au bout sans question"""
+    assert main(["play", "--headless", "--quiet", "--no-save", "--seed", "1", "--stages", "2"]) == 0
+    assert main(["--headless", "--quiet", "--no-save", "--seed", "1", "--mode", "classic", "--battles", "2"]) == 0
+
+
+def test_run_classic_stops_after_max_battles():
+    """Test que le Mode Classique s'arrête à la défaite ou après max_battles victoires"""
+    streams.seed(4)
+    hero = HeroFactory(bus=None).create_character("John", GreedyPolicy())
+    won, battles_won = run_classic(hero, max_battles=3)
+    assert battles_won == 3 if won else battles_won < 3
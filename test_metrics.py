@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from base import Team
+from events import EventBus
+from factories import HeroFactory, EnemyFactory
+from game import play_game, TIMING_SAMPLE
+from metrics import MetricsObserver
+from policies import GreedyPolicy
+from rng import streams
+
+
+@pytest.fixture
+def metrics():
+    """Métriques d'une série de combats seedés sur un bus partagé"""
+    streams.seed(3)
+    observer = MetricsObserver()
+    bus = EventBus()
+    bus.attach(observer)
+    for _ in range(TIMING_SAMPLE):  # Au moins un combat chronométré
+        hero = HeroFactory(bus).create_character("Test Hero", GreedyPolicy())
+        hero_team, enemy_team = Team("Hero Team"), Team("Enemy Team")
+        hero_team.add_member(hero)
+        enemy_team.add_member(EnemyFactory(bus).create_enemy(hero))
+        play_game(hero_team, enemy_team, max_turns=200)
+    return observer
+
+
+def test_counters(metrics):
+    """Test que les attaques, dégâts et morts sont comptés"""
+    assert metrics.attacks > 0
+    assert metrics.deaths >= 20
+    assert sum(metrics.damage_by_weapon.values()) > 0
+    assert metrics.durations["play_game"].count >= 1  # Un combat sur TIMING_SAMPLE est chronométré
+
+
+def test_export(metrics, tmp_path):
+    """Test des exports JSON et Prometheus"""
+    metrics.export(tmp_path / "metrics.json")
+    snapshot = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert snapshot["counters"]["attacks"] == metrics.attacks
+
+    metrics.export(tmp_path / "metrics.prom", format="prometheus")
+    text = (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert f"rpg_attacks_total {metrics.attacks}" in text
+    assert f'rpg_play_game_seconds_bucket{{le="+Inf"}} {metrics.durations["play_game"].count}' in text
+
+
+def test_add_observer_counts_one_hero():
+    """Test qu'avec hero.add_observer, seules les actions de ce héros sont comptées"""
+    hero = HeroFactory(bus=None).create_character("Test Hero", GreedyPolicy())
+    enemy = EnemyFactory(bus=None).create_enemy(hero)
+    assert not hero.wants("attack")  # Sans observateur : aucune donnée d'attaque construite
+    metrics = MetricsObserver()
+    hero.add_observer(metrics)
+    hero.attack(enemy, hero.inventory.best_weapon)
+    hero.heal(5)
+    enemy.attack(hero)
+    assert (metrics.attacks, metrics.heals, metrics.healed) == (1, 1, 5)
+    assert list(metrics.damage_by_weapon) == [hero.inventory.best_weapon.name]
@@ -0,0 +1,71 @@
+import gc
+
+from base import Boss, Team, Weapon
+from factories import HeroFactory, EnemyFactory, BossFactory
+from game import resolve_battle
+from policies import GreedyPolicy
+from pool import EnemyPool
+from rng import streams
+
+
+def test_released_enemy_is_reused_as_new():
+    """Test qu'un ennemi rendu au pool revient remis à neuf, avec les mêmes tirages qu'un nouvel ennemi"""
+    pool = EnemyPool()
+    hero = HeroFactory(bus=None).create_character("Test Hero", GreedyPolicy())
+    streams.seed(4)
+    fresh = EnemyFactory(bus=None, pool=None).create_enemies(hero, 3)
+
+    streams.seed(4)
+    factory = EnemyFactory(bus=None, pool=pool)
+    first = factory.create_enemy(hero)
+    first.take_damage(30)
+    first.upgrades["pv"] = 10
+    factory.release(first, first)  # Une seconde remise est ignorée
+    reused = factory.create_enemies(hero, 2)
+    assert reused[0] is first and reused[1] is not first
+    assert (pool.created, pool.reused) == (2, 1)
+    for enemy, expected in zip([first] + reused[1:], fresh[1:]):
+        assert (enemy.name, enemy.type, enemy._pv, enemy.max_pv, enemy.damage, enemy.speed, enemy.team) == \
+            (expected.name, expected.type, expected._pv, expected.max_pv, expected.damage, expected.speed, None)
+        assert [w.name for w in enemy.inventory.weapons] == [w.name for w in expected.inventory.weapons]
+
+
+def test_boss_and_weapons_are_shared():
+    """Test du boss recyclé et des armes partagées"""
+    pool = EnemyPool()
+    hero = HeroFactory(bus=None).create_character("Test Hero", GreedyPolicy())
+    factory = BossFactory(bus=None, pool=pool)
+    boss = factory.create_boss(hero)
+    pool.release(boss)
+    hero.exp = 500
+    again = factory.create_boss(hero)
+    assert again is boss and isinstance(again, Boss)
+    assert again.exp == 550 and len(again.inventory.weapons) == 1
+    assert Weapon.shared("Rusty Sword", 17) is Weapon.shared("Rusty Sword", 17)
+
+
+def collections(count, pool):
+    """Passages du ramasse-miettes pendant `count` combats du Mode Classique, ennemis pris dans `pool`"""
+    streams.seed(0)
+    hero = HeroFactory(bus=None).create_character("Test Hero", GreedyPolicy())
+    hero_team = Team("Hero Team")
+    hero_team.add_member(hero)
+    factory = EnemyFactory(bus=None, pool=pool)
+    gc.collect()
+    before = sum(generation["collections"] for generation in gc.get_stats())
+    for _ in range(count):
+        hero._pv = hero.max_pv
+        hero_team.refresh()
+        enemy = factory.create_enemy(hero)
+        enemy_team = Team("Enemy Team")
+        enemy_team.add_member(enemy)
+        resolve_battle(hero_team, enemy_team, max_turns=200)
+        factory.release(enemy)
+    return sum(generation["collections"] for generation in gc.get_stats()) - before
+
+
+def test_pool_avoids_garbage_collections():
+    """Test qu'une série de combats avec pool ne déclenche pas plus le ramasse-miettes"""
+    without = collections(1000, None)
+    pooled = collections(1000, EnemyPool())
+    assert pooled < without
@@ -0,0 +1,38 @@
+import pytest
+from base import Hero
+from policies import GreedyPolicy
+from progression import XpCurve, DEFAULT_CURVE
+
+
+@pytest.fixture
+def hero():
+    """Fixture pour créer un héros scripté (sans question)"""
+    return Hero("John", "warrior", 100, 20, GreedyPolicy(upgrade="Increase Damage"))
+
+
+def test_level_matches_thresholds(hero):
+    """Test que le niveau en cache suit les seuils, y compris quand l'EXP est modifiée directement"""
+    assert hero.get_xp_level() == 1
+    hero.exp = 20
+    assert hero.get_xp_level() == 2
+    hero.exp = 10000
+    assert hero.get_xp_level() == DEFAULT_CURVE.max_level == 10
+    hero.exp = 49
+    assert hero.get_xp_level() == 2
+    assert DEFAULT_CURVE.levels_for([0, 19, 20, 99, 100, 50000]) == [1, 1, 2, 3, 4, 10]
+
+
+def test_multi_level_jump_calls_level_up_per_level(hero):
+    """Test qu'un gros gain d'EXP applique une amélioration par niveau franchi"""
+    assert hero.gain_exp(120) == 3  # 20, 50 et 100
+    assert hero.get_xp_level() == 4
+    assert hero.damage == 20 + 3 * 5
+
+
+def test_curve_from_config():
+    """Test qu'une courbe de configuration peut dépasser le niveau 10"""
+    curve = XpCurve.from_config({"first": 20, "growth": 2.0, "max_level": 30})
+    assert curve.max_level == 30
+    assert curve.level_for(20) == 2 and curve.level_for(10 ** 12) == 30
+    with pytest.raises(ValueError):
+        XpCurve.from_config({"thresholds": [50, 20]})
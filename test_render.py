@@ -0,0 +1,52 @@
+import contextlib
+import io
+
+from base import health_bar
+from events import EventBus
+from factories import HeroFactory
+from game import run_classic
+from observer import GameObserver
+from policies import GreedyPolicy
+from render import FrameRenderer
+from rng import streams
+
+
+def play(observer, seed=6):
+    """Quelques combats du Mode Classique affichés par `observer`"""
+    bus = EventBus()
+    bus.attach(observer)
+    streams.seed(seed)
+    run_classic(HeroFactory(bus).create_character("Jane", GreedyPolicy()), max_battles=4)
+    if isinstance(observer, FrameRenderer):
+        observer.close()
+
+
+def test_plain_output_matches_game_observer():
+    """Test que, hors terminal, le journal est celui de GameObserver, écrit par images"""
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        play(GameObserver())
+    stream = io.StringIO()
+    renderer = FrameRenderer(stream, fps=0)
+    play(renderer)
+    assert stream.getvalue() == printed.getvalue()
+    assert 1 < renderer.writes < printed.getvalue().count("\n")
+
+
+def test_frame_rate_is_capped():
+    """Test que les images trop rapprochées sont fusionnées avec les suivantes"""
+    renderer = FrameRenderer(io.StringIO(), fps=30, clock=lambda: 0.0)
+    play(renderer)
+    assert renderer.writes == 2  # La première image, puis le reste à la fermeture
+
+
+def test_terminal_panel_redraws_changed_lines():
+    """Test du panneau de PV : une ligne n'est redessinée que si elle a changé"""
+    stream = io.StringIO()
+    renderer = FrameRenderer(stream, fps=0, tty=True)
+    play(renderer)
+    output = stream.getvalue()
+    assert "\x1b[6;" in output and output.endswith("\x1b[r")  # Zone de défilement posée puis rendue
+    hero_redraws = output.count("\x1b[1;1H🦸 Jane")
+    assert 0 < hero_redraws < renderer.writes
+    assert health_bar(0.5, 20) is health_bar(0.54, 20)  # Même tranche : chaîne en cache
@@ -0,0 +1,37 @@
+import zlib
+import pytest
+from policies import GreedyPolicy, RandomPolicy
+from replay import record_exploration, replay_exploration, ReplayError, LogReader, _HEADER
+
+
+def test_replay_reproduces_recorded_session():
+    """Test qu'une session rejouée depuis son journal finit exactement comme l'originale"""
+    result, hero, log = record_exploration(RandomPolicy(7), seed=7, num_stages=10)
+    replayed, replayed_hero = replay_exploration(log)
+    assert replayed == result
+    assert (replayed_hero.exp, replayed_hero._pv, replayed_hero.damage) == (hero.exp, hero._pv, hero.damage)
+
+
+def test_same_seed_same_log():
+    """Test que la même graine et la même politique produisent le même journal"""
+    assert record_exploration(GreedyPolicy(), seed=3)[2] == record_exploration(GreedyPolicy(), seed=3)[2]
+
+
+def test_truncated_log_is_rejected():
+    """Test qu'un journal incomplet est signalé au lieu de rejouer une autre partie"""
+    log = record_exploration(GreedyPolicy(), seed=5, num_stages=3)[2]
+    offset = _HEADER.size + _HEADER.unpack_from(log)[-1]  # En-tête puis nom du héros
+    records = zlib.decompress(log[offset:])
+    truncated = log[:offset] + zlib.compress(records[:len(records) // 2])
+    with pytest.raises(ReplayError):
+        replay_exploration(truncated)
+
+
+def test_header_keeps_any_seed_and_long_names():
+    """Test que la graine -1 n'est pas confondue avec « sans graine » et qu'un long nom tient dans l'en-tête"""
+    name = "Héroïne " * 40  # Plus de 255 octets en UTF-8
+    result, hero, log = record_exploration(GreedyPolicy(), seed=-1, num_stages=2, hero_name=name)
+    reader = LogReader(log)
+    assert (reader.seed, reader.hero_name) == (-1, name)
+    assert LogReader(record_exploration(GreedyPolicy(), num_stages=1)[2]).seed is None
+    assert replay_exploration(log)[0] == result
@@ -0,0 +1,30 @@
+import random
+from collections import Counter
+import pytest
+from sampling import AliasTable
+from exploration import EVENT_WEIGHTS, event_table, generate_events
+
+
+def test_alias_table_matches_weights():
+    """Test que les fréquences tirées suivent les poids de la table"""
+    weights = EVENT_WEIGHTS["hard"]
+    counts = Counter(event_table("hard").sample_many(random.Random(1), 100_000))
+    total = sum(weights.values())
+    for event_type, weight in weights.items():
+        assert counts[event_type] / 100_000 == pytest.approx(weight / total, abs=0.01)
+
+
+def test_batch_sampling_is_reproducible():
+    """Test que sample_many donne la même suite que des sample successifs"""
+    table = AliasTable(["a", "b", "c"], [1, 0, 3])
+    batch = table.sample_many(random.Random(4), 50)
+    rng = random.Random(4)
+    assert batch == [table.sample(rng) for _ in range(50)]
+    assert "b" not in batch
+
+
+def test_generate_events_unknown_difficulty():
+    """Test qu'une difficulté inconnue utilise les probabilités "normal" """
+    events = generate_events("legendary", 20)
+    assert len(events) == 20
+    assert {event.event_type for event in events} <= set(EVENT_WEIGHTS["normal"])
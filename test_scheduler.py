@@ -0,0 +1,56 @@
+import pytest
+from base import Enemy, Team
+from scheduler import InitiativeScheduler
+
+
+@pytest.fixture
+def fighters():
+    """Fixture : trois ennemis de vitesses 20, 10 et 5"""
+    characters = [Enemy(f"Goblin {speed}", "beast", 50, 10) for speed in (5, 20, 10)]
+    for character, speed in zip(characters, (5, 20, 10)):
+        character.speed = speed
+    return characters
+
+
+def test_classic_round_by_speed(fighters):
+    """Test que chacun joue une fois par tour, du plus rapide au plus lent"""
+    scheduler = InitiativeScheduler(fighters)
+    assert [c.speed for c in scheduler.round(1)] == [20, 10, 5]
+    newcomer = Enemy("Goblin 15", "beast", 50, 10)
+    newcomer.speed = 15
+    scheduler.add(newcomer)
+    fighters[2]._pv = 0  # Les morts gardent leur place, l'appelant les saute
+    assert [c.speed for c in scheduler.round(2)] == [20, 15, 10, 5]
+
+
+def test_revived_character_plays_again(fighters):
+    """Test qu'un mort ranimé par un soin rejoue, dans les deux modes"""
+    for weighted in (False, True):
+        team = Team("Goblins")
+        for character in fighters:
+            character._pv = 50
+            team.add_member(character)
+        scheduler = InitiativeScheduler(fighters, weighted=weighted)
+        slow = fighters[0]
+        slow.take_damage(100)
+        assert all(c._pv <= 0 for turn in range(1, 5) for c in scheduler.round(turn) if c is slow)
+        slow.heal(10)
+        assert slow in team.get_alive_members()
+        assert any(c is slow for turn in range(5, 9) for c in scheduler.round(turn))
+        assert len(scheduler) == 3
+
+
+def test_weighted_initiative(fighters):
+    """Test qu'en mode pondéré les plus rapides jouent plus souvent"""
+    scheduler = InitiativeScheduler(fighters, weighted=True)
+    actions = [c.speed for turn in range(1, 11) for c in scheduler.round(turn)]
+    assert actions.count(20) == 20 and actions.count(10) == 10 and actions.count(5) == 5
+
+
+def test_remove(fighters):
+    """Test qu'un personnage retiré ne joue plus"""
+    for weighted in (False, True):
+        scheduler = InitiativeScheduler(fighters, weighted=weighted)
+        scheduler.remove(fighters[1])
+        assert fighters[1] not in scheduler
+        assert all(c is not fighters[1] for turn in range(1, 4) for c in scheduler.round(turn))
@@ -0,0 +1,52 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import scores
+from leaderboard import Leaderboard
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    """Fixture pour un classement SQLite vide"""
+    with Leaderboard(str(tmp_path / "scores.db")) as board:
+        yield board
+
+
+def _insert_scores(args):
+    path, worker = args
+    with Leaderboard(path) as board:
+        for i in range(50):
+            board.add(f"P{worker}", worker * 100 + i, i)
+
+
+def test_top_and_rank(leaderboard):
+    """Test du classement par EXP puis par combats gagnés"""
+    leaderboard.add("A", 50, 3)
+    leaderboard.add("B", 120, 1)
+    leaderboard.add("C", 50, 7)
+    assert [s["name"] for s in leaderboard.top(3)] == ["B", "A", "C"]  # À égalité, le plus ancien d'abord
+    assert [s["name"] for s in leaderboard.top(1, by="battles_won")] == ["C"]
+    assert leaderboard.rank(100) == 2
+    assert leaderboard.rank(10) == 4
+
+
+def test_concurrent_inserts_are_not_lost(tmp_path):
+    """Test que des processus qui écrivent en même temps ne perdent aucun score"""
+    path = str(tmp_path / "scores.db")
+    Leaderboard(path).close()
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_insert_scores, [(path, worker) for worker in range(4)]))
+    with Leaderboard(path) as board:
+        assert len(board) == 200
+
+
+def test_save_score_imports_json_and_displays(tmp_path, monkeypatch, capsys):
+    """Test de la reprise de l'ancien fichier JSON puis de l'affichage du top 3"""
+    legacy = tmp_path / "highscores.json"
+    legacy.write_text(json.dumps([{"name": "Old", "exp": 90, "battles_won": 4}]))
+    monkeypatch.setattr(scores, "SCORES_FILE", str(legacy))
+    monkeypatch.setattr(scores, "SCORES_DB", str(tmp_path / "highscores.db"))
+    scores.save_score("New", 200, 9)
+    assert [s["name"] for s in scores.load_scores()] == ["New", "Old"]
+    scores.display_top_scores()
+    assert "New: 200 EXP (9 battles won)" in capsys.readouterr().out
@@ -0,0 +1,43 @@
+import itertools
+
+import search
+from base import Hero, Enemy, HealPotion
+from policies import GreedyPolicy
+from search import ExpectimaxPolicy, hit
+from simulation import run_simulation
+
+
+def test_hit_probabilities():
+    """Test des deux issues d'un jet de dégâts uniforme"""
+    assert hit(9, 11, 5) == (1.0, 0.0)
+    assert hit(9, 11, 20) == (0.0, 10.0)
+    assert hit(9, 11, 10) == (2 / 3, 9.0)
+
+
+def test_obvious_decisions(monkeypatch):
+    """Test que le héros achève un ennemi mourant et se soigne avant un coup fatal, dans son budget"""
+    policy = ExpectimaxPolicy()
+    hero = Hero("John", "warrior", 100, 15, policy)
+    enemy = Enemy("Wolf", "beast", 100, 18)
+    enemy._pv = 5
+    assert policy.choose_action(hero, [enemy]) == "attack"
+    assert policy.choose_target(hero, [enemy]) is enemy
+
+    enemy._pv = 100
+    hero._pv = 15
+    hero.inventory.append(HealPotion("Health Potion", 50))
+    assert policy.choose_action(hero, [enemy]) in ("heal", "use item")
+    assert 1 <= policy.depth <= policy.max_depth
+
+    clock = itertools.count(step=0.001)  # Horloge simulée : 1 ms par lecture
+    monkeypatch.setattr(search, "perf_counter", lambda: next(clock))
+    policy = hero.policy = ExpectimaxPolicy()  # Table de transposition vide
+    assert policy.choose_action(hero, [enemy]) in ("heal", "use item")
+    assert policy.depth < policy.max_depth  # Budget épuisé avant la profondeur maximale
+
+
+def test_beats_greedy_policy():
+    """Test que la recherche gagne plus de combats que la politique scriptée"""
+    greedy = run_simulation(200, GreedyPolicy(), seed=3, workers=1)
+    searched = run_simulation(200, ExpectimaxPolicy(), seed=3, workers=1)
+    assert searched.wins > greedy.wins
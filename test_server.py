@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+from base import InputProvider, InteractivePolicy, Hero
+from client import play_session, play_sessions
+from server import GameServer, Session
+
+
+class ScriptedInput(InputProvider):
+    """Répond toujours le même indice et garde la trace des questions"""
+    def __init__(self, index):
+        self.index = index
+        self.asked = []
+
+    def select(self, kind, message, choices):
+        self.asked.append(kind)
+        return self.index
+
+
+def test_interactive_policy_uses_provider():
+    """Test que les décisions interactives passent par l'InputProvider"""
+    provider = ScriptedInput(1)
+    policy = InteractivePolicy(provider)
+    hero = Hero("John", "warrior", policy=policy)
+    assert policy.choose_action(hero, []) == Hero.ACTIONS[1]
+    assert policy.choose_upgrade(hero) == Hero.UPGRADES[1]
+    assert provider.asked == ["action", "upgrade"]
+
+
+def test_server_hosts_concurrent_sessions():
+    """Test que des sessions simultanées se jouent jusqu'au bout et qu'un message invalide est refusé"""
+    async def scenario():
+        game_server = GameServer(max_sessions=64)
+        server = await game_server.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            results = await play_sessions(30, port=port, stages=3)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"type": "answer", "choice": 0}\n')
+            refused = json.loads(await reader.readline())
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+            game_server.shutdown()
+        return results, refused
+
+    results, refused = asyncio.run(scenario())
+    assert all(end and end["type"] == "end" for end, prompts in results)
+    assert all(prompts > 0 for end, prompts in results)
+    assert refused["type"] == "error"
+
+
+def test_seeded_session_ignores_other_sessions():
+    """Test qu'une session seedée se joue à l'identique, seule ou parmi d'autres sessions"""
+    async def scenario():
+        game_server = GameServer(max_sessions=32)
+        server = await game_server.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            alone = await play_session("Solo", port=port, stages=4, seed=7)
+            crowd = await asyncio.gather(play_session("Solo", port=port, stages=4, seed=7),
+                                         play_sessions(20, port=port, stages=4))
+            return alone, crowd[0]
+        finally:
+            server.close()
+            await server.wait_closed()
+            game_server.shutdown()
+
+    alone, crowded = asyncio.run(scenario())
+    assert alone[0]["type"] == "end" and alone == crowded
+
+
+def test_empty_inventory_loop_frees_the_session():
+    """Test qu'un client qui demande sans fin un objet absent ne fait pas planter sa session ni ne garde sa place"""
+    async def scenario():
+        game_server = GameServer(max_sessions=4)
+        server = await game_server.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"type": "start", "name": "Greedy", "stages": 3, "seed": 1}\n')
+            asked = 0
+            while asked < 1500:  # Au-delà de la limite de récursion
+                message = json.loads(await reader.readline())
+                if message["type"] == "prompt":
+                    choice = Hero.ACTIONS.index("use item") if message["kind"] == "action" else 0
+                    asked += message["kind"] == "action"
+                    writer.write(json.dumps({"type": "answer", "choice": choice}).encode() + b"\n")
+            writer.close()
+            for _ in range(200):
+                if not game_server.sessions:
+                    break
+                await asyncio.sleep(0.01)
+            return game_server.sessions
+        finally:
+            server.close()
+            await server.wait_closed()
+            game_server.shutdown()
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_flush_waits_for_the_client():
+    """Test que le thread de jeu attend que le client ait lu avant de continuer (tampon d'envoi borné)"""
+    class SlowWriter:
+        def __init__(self):
+            self.written = []
+            self.read = asyncio.Event()
+
+        def write(self, data):
+            self.written.append(data)
+
+        async def drain(self):
+            await self.read.wait()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        writer = SlowWriter()
+        session = Session(loop, writer)
+        session.send({"type": "event"})
+        flushed = loop.run_in_executor(None, session.flush)
+        await asyncio.sleep(0.05)
+        blocked = not flushed.done()
+        writer.read.set()
+        await flushed
+        return blocked, writer.written
+
+    blocked, written = asyncio.run(scenario())
+    assert blocked and written == [b'{"type":"event"}\n']
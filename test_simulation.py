@@ -0,0 +1,33 @@
+from base import Hero, Enemy, Weapon
+from policies import GreedyPolicy
+from simulation import simulate_battle, run_simulation
+
+
+def test_scripted_hero_attacks_without_prompt():
+    """Test qu'un héros piloté par une politique joue son tour sans questionary"""
+    hero = Hero("John", "warrior", 100, 20, GreedyPolicy())
+    hero.inventory.append(Weapon("Sword", 10))
+    enemy = Enemy("Goblin", "beast", 100, 10)
+    hero.perform_turn([enemy])
+    assert 100 - int(30 * 1.1) <= enemy._pv <= 100 - int(30 * 0.9)
+
+
+def test_simulate_battle_is_deterministic():
+    """Test qu'une même graine rejoue exactement le même combat"""
+    assert simulate_battle(42, GreedyPolicy()) == simulate_battle(42, GreedyPolicy())
+
+
+def test_run_simulation_aggregates_all_battles():
+    """Test que le rapport agrégé compte chaque combat une seule fois"""
+    report = run_simulation(50, seed=1, workers=1, chunk_size=7)
+    assert report.battles == 50
+    assert report.wins + report.losses + report.draws == 50
+    assert sum(report.turns.values()) == 50
+    assert sum(report.hp_remaining.values()) == report.wins
+
+
+def test_run_simulation_pool_matches_inline():
+    """Test que la répartition sur plusieurs processus ne change pas les résultats"""
+    inline = run_simulation(40, seed=3, workers=1, chunk_size=10)
+    pooled = run_simulation(40, seed=3, workers=2, chunk_size=10)
+    assert inline.summary() == pooled.summary()
@@ -0,0 +1,32 @@
+from events import EventBus
+from observer import Observer
+from soak import soak
+
+
+class LeakyObserver(Observer):
+    """Observateur qui garde une trace de chaque combat : la mémoire grandit sans limite"""
+    events = ("battle_end",)
+
+    def __init__(self):
+        self.kept = []
+
+    def notify(self, subject, event_type, data):
+        self.kept.append({"hero": subject.name, "pv": subject._pv})
+
+
+def test_classic_mode_stays_within_budget():
+    """Test que la mémoire du Mode Classique ne grandit pas avec le nombre de combats"""
+    report = soak(3000, interval=500, seed=1)
+    assert report.battles >= 3000 and report.heroes >= 1
+    assert len(report.samples) >= 5
+    assert report.ok, report.summary()
+
+
+def test_leak_is_reported():
+    """Test qu'une fuite fait échouer le budget et que sa ligne est en tête du rapport"""
+    bus = EventBus()
+    bus.attach(LeakyObserver())
+    report = soak(3000, interval=500, seed=1, bus=bus)
+    assert not report.ok
+    assert report.growth > 10 * report.budget
+    assert any(site.startswith(__file__) for site, _, _ in report.sites[:3])
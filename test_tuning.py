@@ -0,0 +1,32 @@
+import pytest
+
+import exploration
+import tuning
+from base import Boss
+from factories import EnemyFactory
+
+
+def test_apply_restores_defaults():
+    """Test que les paramètres appliqués sont remis à leur valeur d'origine"""
+    tuning.apply({"enemy_base_pv": 10, "boss_pv_multiplier": 0.5, "weight.hard.combat": 5.0})
+    assert (EnemyFactory.BASE_PV, Boss.PV_MULTIPLIER) == (10, 0.5)
+    assert exploration.EVENT_WEIGHTS["hard"]["combat"] == 5.0
+    tuning.apply({})
+    assert (EnemyFactory.BASE_PV, Boss.PV_MULTIPLIER) == (80, 1.2)
+    assert exploration.EVENT_WEIGHTS["hard"] == tuning.DEFAULT_WEIGHTS["hard"]
+    with pytest.raises(ValueError):
+        tuning.apply({"dragon_size": 3})
+
+
+def test_sweep_is_cached(tmp_path, monkeypatch):
+    """Test qu'une recherche relancée relit ses résultats au lieu de rejouer les parties"""
+    candidates = tuning.grid({"boss_pv_multiplier": [0.4, 1.2]})
+    settings = {"runs": 20, "stages": 2}
+    results = tuning.sweep(candidates, settings, workers=1, cache_dir=tmp_path)
+    weak_boss, strong_boss = (rates["boss"] for params, rates in results)
+    assert weak_boss > strong_boss
+
+    monkeypatch.setattr(tuning, "_evaluate", lambda task: pytest.fail("result should come from the cache"))
+    assert tuning.sweep(candidates, settings, workers=1, cache_dir=tmp_path) == results
+    hits = tuning.matches(results, {"boss": weak_boss}, tolerance=0.01)
+    assert [params for params, rates in hits] == [{"boss_pv_multiplier": 0.4}]
@@ -0,0 +1,29 @@
+import numpy as np
+from simulation import run_simulation
+from vectorized import BattleArrays, VectorizedEngine, run_vectorized
+
+
+def test_vectorized_matches_object_engine():
+    """Test que le moteur vectorisé reproduit les statistiques du moteur objet"""
+    vectorized = run_vectorized(20000, seed=1, hero_exp=400)
+    objects = run_simulation(2000, seed=1, workers=1, hero_exp=400)
+    assert abs(vectorized.win_rate - objects.win_rate) < 0.03
+    assert abs(vectorized.mean_turns - objects.mean_turns) < 0.3
+
+
+def test_vectorized_damage_roll_and_clamp():
+    """Test du jet de dégâts entre 90 % et 110 % et des PV bornés à 0"""
+    arrays = BattleArrays(1000, 2)
+    arrays.pv[:] = arrays.max_pv[:] = 50
+    engine = VectorizedEngine(arrays, np.random.default_rng(0))
+    rolls = engine.roll(np.full(1000, 30, dtype=np.int32))
+    assert rolls.min() == 27 and rolls.max() == 33
+    engine.hit(np.arange(1000) * 2 + 1, np.full(1000, 80))
+    assert (arrays.pv[:, 1] == 0).all()
+
+
+def test_vectorized_boss_battles_finish():
+    """Test que chaque combat de boss se termine avec une issue"""
+    report = run_vectorized(5000, seed=2, boss=True, hero_exp=300)
+    assert report.wins + report.losses + report.draws == 5000
+    assert sum(report.turns.values()) == 5000
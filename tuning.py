@@ -0,0 +1,270 @@
+"""Équilibrage : recherche de paramètres de difficulté qui atteignent des taux de victoire cibles.
+
+Les paramètres (PARAMETERS) sont les constantes de classe et de module du
+jeu : PV et dégâts des ennemis, PV du boss, soins, bornes des événements
+et poids des événements par difficulté ("weight.<difficulté>.<événement>").
+Chaque jeu de paramètres est évalué par des parties seedées :
+
+- une difficulté ("easy", "normal", "hard") : part des explorations de
+  --stages stages, chemins de cette difficulté, où le héros atteint le boss ;
+- "boss" : part des combats de boss gagnés (scénario de simulation.py,
+  héros à --boss-exp EXP).
+
+Les évaluations sont réparties sur un pool de processus et mises en cache
+sur disque (un fichier JSON par empreinte des paramètres et réglages) : une
+recherche relancée ne rejoue que les jeux de paramètres nouveaux.
+
+    python -m tuning --param boss_pv_multiplier=0.6:1.2:0.2 --param boss_pv_bonus=0,0.3 \\
+        --target boss=0.5 --target hard=0.8
+    python -m tuning --random 40 --param enemy_base_pv=60:110 --param enemy_damage_max=14:22 --target normal=0.9
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import exploration
+from base import Hero, Enemy, Boss
+from factories import HeroFactory, EnemyFactory
+from game import run_exploration
+from policies import DifficultyPolicy, GreedyPolicy
+from rng import streams
+from simulation import SimulationReport, simulate_battle, battle_seed
+
+CACHE_VERSION = 1  # À incrémenter quand les règles du jeu changent : le cache est alors ignoré
+DIFFICULTIES = ("easy", "normal", "hard")
+TARGETS = DIFFICULTIES + ("boss",)
+
+# Nom du paramètre -> (objet, attribut)
+PARAMETERS = {
+    "enemy_base_pv": (EnemyFactory, "BASE_PV"),
+    "enemy_pv_per_exp": (EnemyFactory, "PV_PER_EXP"),
+    "enemy_damage_min": (EnemyFactory, "DAMAGE_MIN"),
+    "enemy_damage_max": (EnemyFactory, "DAMAGE_MAX"),
+    "boss_pv_multiplier": (Boss, "PV_MULTIPLIER"),
+    "boss_pv_bonus": (Boss, "PV_BONUS"),
+    "hero_heal": (Hero, "HEAL"),
+    "enemy_heal": (Enemy, "HEAL"),
+    "boss_heal": (Boss, "HEAL"),
+    "path_heal_min": (exploration, "HEAL_MIN"),
+    "path_heal_max": (exploration, "HEAL_MAX"),
+    "potion_min": (exploration, "POTION_MIN"),
+    "potion_max": (exploration, "POTION_MAX"),
+}
+DEFAULTS = {name: getattr(owner, attribute) for name, (owner, attribute) in PARAMETERS.items()}
+DEFAULT_WEIGHTS = {difficulty: dict(weights) for difficulty, weights in exploration.EVENT_WEIGHTS.items()}
+
+
+def _weight_name(name):
+    """("hard", "combat") pour "weight.hard.combat", None pour un autre paramètre"""
+    parts = name.split(".")
+    if len(parts) == 3 and parts[0] == "weight" and parts[2] in DEFAULT_WEIGHTS.get(parts[1], ()):
+        return parts[1], parts[2]
+    return None
+
+
+def check_names(names):
+    unknown = [name for name in names if name not in PARAMETERS and _weight_name(name) is None]
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+
+
+def apply(params):
+    """Remet toutes les constantes à leur valeur d'origine puis applique `params`"""
+    check_names(params)
+    for name, (owner, attribute) in PARAMETERS.items():
+        setattr(owner, attribute, params.get(name, DEFAULTS[name]))
+    weights = {difficulty: dict(values) for difficulty, values in DEFAULT_WEIGHTS.items()}
+    for name, value in params.items():
+        weight = _weight_name(name)
+        if weight:
+            difficulty, event = weight
+            weights[difficulty][event] = value
+    for difficulty, values in weights.items():
+        if values != exploration.EVENT_WEIGHTS[difficulty]:
+            exploration.set_event_weights(difficulty, values)
+
+
+def evaluate(params, runs=200, seed=0, stages=5, boss_exp=100):
+    """Taux de victoire de chaque cible (voir TARGETS) avec les paramètres `params`"""
+    apply(params)
+    try:
+        rates = {}
+        for difficulty in DIFFICULTIES:
+            policy = DifficultyPolicy(difficulty)
+            reached = 0
+            for index in range(runs):
+                streams.seed(battle_seed(seed, index))
+                hero = HeroFactory(bus=None).create_character("Tuning Hero", policy)
+                reached += run_exploration(hero, stages, zone_name="Tuning Zone")[2] > stages
+            rates[difficulty] = reached / runs
+        boss = SimulationReport()
+        policy = GreedyPolicy()
+        for index in range(runs):
+            boss.record(*simulate_battle(battle_seed(seed, index), policy, hero_exp=boss_exp, boss=True))
+        rates["boss"] = boss.win_rate
+        return rates
+    finally:
+        apply({})
+
+
+def _evaluate(task):
+    params, settings = task
+    return evaluate(params, **settings)
+
+
+def cache_key(params, settings):
+    text = json.dumps({"version": CACHE_VERSION, "params": params, "settings": settings}, sort_keys=True)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:20]
+
+
+def grid(ranges):
+    """Toutes les combinaisons de `ranges` (nom -> liste de valeurs)"""
+    names = sorted(ranges)
+    return [dict(zip(names, values)) for values in itertools.product(*(ranges[name] for name in names))]
+
+
+def random_search(bounds, count, seed=0):
+    """`count` jeux tirés uniformément dans `bounds` (nom -> (min, max), entiers si les bornes le sont)"""
+    rng = random.Random(seed)
+    candidates = []
+    for _ in range(count):
+        params = {}
+        for name in sorted(bounds):
+            low, high = bounds[name]
+            if isinstance(low, int) and isinstance(high, int):
+                params[name] = rng.randint(low, high)
+            else:
+                params[name] = round(rng.uniform(low, high), 3)
+        candidates.append(params)
+    return candidates
+
+
+def sweep(candidates, settings=None, workers=None, cache_dir=".tuning_cache"):
+    """Évalue chaque jeu de paramètres (cache disque d'abord), retourne [(params, taux)] dans l'ordre"""
+    settings = {"runs": 200, "seed": 0, "stages": 5, "boss_exp": 100, **(settings or {})}
+    for params in candidates:
+        check_names(params)
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = [os.path.join(cache_dir, cache_key(params, settings) + ".json") for params in candidates]
+
+    results = [None] * len(candidates)
+    missing = []
+    for index, path in enumerate(paths):
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                results[index] = json.load(f)["rates"]
+        else:
+            missing.append(index)
+
+    tasks = [(candidates[index], settings) for index in missing]
+    pool = None
+    if workers == 1 or not tasks:
+        computed = map(_evaluate, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        computed = pool.map(_evaluate, tasks)
+    try:
+        for index, rates in zip(missing, computed):
+            results[index] = rates
+            temporary = paths[index] + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump({"params": candidates[index], "settings": settings, "rates": rates}, f)
+            os.replace(temporary, paths[index])
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return list(zip(candidates, results))
+
+
+def error(rates, targets):
+    """Plus grand écart entre les taux obtenus et les cibles"""
+    return max(abs(rates[name] - target) for name, target in targets.items())
+
+
+def matches(results, targets, tolerance=0.05):
+    """Jeux de paramètres dont tous les taux sont à `tolerance` près des cibles, du plus proche au moins proche"""
+    hits = [(params, rates) for params, rates in results if error(rates, targets) <= tolerance]
+    return sorted(hits, key=lambda result: error(result[1], targets))
+
+
+def _number(text):
+    return float(text) if any(c in text for c in ".eE") else int(text)
+
+
+def parse_param(text):
+    """"nom=a:b:pas" (grille, bornes incluses), "nom=a:b" (bornes) ou "nom=v1,v2,..." (valeurs)"""
+    name, _, spec = text.partition("=")
+    if ":" in spec:
+        parts = [_number(part) for part in spec.split(":")]
+        if len(parts) == 2:
+            return name, tuple(parts)
+        low, high, step = parts
+        count = int(round((high - low) / step)) + 1
+        values = [low + i * step for i in range(count)]
+        return name, [round(value, 6) if isinstance(value, float) else value for value in values]
+    return name, [_number(part) for part in spec.split(",")]
+
+
+def _grid_values(spec):
+    if isinstance(spec, tuple):  # Bornes seules : les deux extrémités et le milieu
+        low, high = spec
+        middle = (low + high) // 2 if isinstance(low, int) and isinstance(high, int) else (low + high) / 2
+        return sorted({low, middle, high})
+    return spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recherche de paramètres d'équilibrage")
+    parser.add_argument("--param", action="append", default=[], metavar="NOM=SPEC",
+                        help=f"a:b:pas, a:b ou v1,v2... ; noms : {', '.join(PARAMETERS)}, weight.<difficulté>.<événement>")
+    parser.add_argument("--target", action="append", default=[], metavar="CIBLE=TAUX",
+                        help=f"taux de victoire visé, cibles : {', '.join(TARGETS)}")
+    parser.add_argument("--tolerance", type=float, default=0.05)
+    parser.add_argument("--random", type=int, default=0, help="recherche aléatoire de N jeux au lieu de la grille")
+    parser.add_argument("--runs", type=int, default=200, help="parties par cible et par jeu de paramètres")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", type=int, default=5)
+    parser.add_argument("--boss-exp", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=".tuning_cache")
+    args = parser.parse_args(argv)
+
+    specs = dict(parse_param(text) for text in args.param)
+    targets = {name: float(rate) for name, _, rate in (text.partition("=") for text in args.target)}
+    try:
+        check_names(specs)
+    except ValueError as e:
+        parser.error(str(e))
+    if set(targets) - set(TARGETS):
+        parser.error(f"unknown targets: {', '.join(sorted(set(targets) - set(TARGETS)))}")
+
+    if args.random:
+        bounds = {name: (min(spec), max(spec)) for name, spec in specs.items()}
+        candidates = random_search(bounds, args.random, args.seed)
+    else:
+        candidates = grid({name: _grid_values(spec) for name, spec in specs.items()})
+    settings = {"runs": args.runs, "seed": args.seed, "stages": args.stages, "boss_exp": args.boss_exp}
+    results = sweep(candidates, settings, args.workers, args.cache)
+
+    if not targets:
+        print(json.dumps([{"params": params, "rates": rates} for params, rates in results], indent=2))
+        return 0
+    hits = matches(results, targets, args.tolerance)
+    shown = hits or sorted(results, key=lambda result: error(result[1], targets))[:5]
+    print(json.dumps({
+        "targets": targets,
+        "evaluated": len(results),
+        "matches": len(hits),
+        "best" if hits else "closest": [{"params": params, "rates": rates, "error": round(error(rates, targets), 4)}
+                                        for params, rates in shown],
+    }, indent=2))
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
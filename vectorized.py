@@ -0,0 +1,266 @@
+"""Moteur de combat vectorisé : B combats joués en parallèle avec NumPy.
+
+L'état est rangé en struct-of-arrays (une ligne par combat, une colonne par
+personnage, colonne 0 = héros) et chaque tour est résolu pour tous les combats
+à la fois avec des opérations sur tableaux. Les règles reprennent celles des
+objets de base.py : jet de dégâts entre 90 % et 110 %, PV bornés à 0,
+Enemy 50/50 attaque/soin (Enemy.HEAL), Boss 80/20 attaque/soin (Boss.HEAL) avec 30 % de
+double attaque. Le héros suit la même logique que policies.GreedyPolicy
+(sans consommables) : soin sous le seuil, sinon attaque de l'ennemi le plus
+faible avec sa meilleure arme, et amélioration des dégâts à chaque niveau.
+"""
+import numpy as np
+
+from base import Hero, Enemy, Boss
+from factories import EnemyFactory
+from progression import DEFAULT_CURVE
+from simulation import SimulationReport, MAX_TURNS, HP_BUCKET
+
+HERO = 0
+XP_THRESHOLDS = np.array(DEFAULT_CURVE.thresholds)
+XP_PER_KILL = 20
+MAX_WEAPONS = 2  # Rusty Sword + Random Weapon en Mode Classique
+
+
+class BattleArrays:
+    """État de B combats : colonne 0 = héros, colonnes suivantes = ennemis"""
+    def __init__(self, batch, size, max_weapons=MAX_WEAPONS):
+        self.pv = np.zeros((batch, size), dtype=np.int32)
+        self.max_pv = np.zeros((batch, size), dtype=np.int32)
+        self.damage = np.zeros((batch, size), dtype=np.int32)
+        self.speed = np.zeros((batch, size), dtype=np.int32)
+        self.weapon_damage = np.zeros((batch, size, max_weapons), dtype=np.int32)
+        self.num_weapons = np.zeros((batch, size), dtype=np.int32)
+        self.is_boss = np.zeros(size, dtype=bool)
+        self.exp = np.zeros(batch, dtype=np.int32)  # EXP du héros
+
+    @property
+    def batch(self):
+        return self.pv.shape[0]
+
+    def add_weapon(self, mask, column, damage):
+        """Ajoute une arme à `column` pour les combats sélectionnés par le masque `mask`"""
+        rows = np.nonzero(mask)[0]
+        slot = self.num_weapons[rows, column]
+        self.weapon_damage[rows, column, slot] = damage
+        self.num_weapons[rows, column] += 1
+
+    def set_hero(self, rng, hero_exp=0):
+        """Mêmes statistiques que HeroFactory.create_character"""
+        self.pv[:, HERO] = self.max_pv[:, HERO] = 80
+        self.damage[:, HERO] = 15
+        self.speed[:, HERO] = rng.integers(1, 21, self.batch)
+        self.add_weapon(np.ones(self.batch, dtype=bool), HERO, 18)  # Iron Sword
+        self.exp[:] = hero_exp
+
+    def set_enemy(self, rng, column, hero_exp=0):
+        """Mêmes tirages que EnemyFactory.create_enemy"""
+        batch = self.batch
+        enemy_exp = (hero_exp * rng.uniform(0.7, 1.0, batch)).astype(np.int32)
+        self.pv[:, column] = self.max_pv[:, column] = EnemyFactory.BASE_PV + enemy_exp // EnemyFactory.PV_PER_EXP
+        self.damage[:, column] = rng.integers(EnemyFactory.DAMAGE_MIN, EnemyFactory.DAMAGE_MAX + 1, batch)
+        self.speed[:, column] = rng.integers(1, 21, batch)
+        rusty = rng.random(batch) > 0.6
+        self.add_weapon(rusty, column, rng.integers(15, 21, batch)[rusty])
+
+    def set_boss(self, rng, column):
+        """Mêmes statistiques que Boss(name, hero) face au héros de la colonne 0"""
+        pv = (self.max_pv[:, HERO] * Boss.PV_MULTIPLIER).astype(np.int32)
+        self.pv[:, column] = pv
+        self.max_pv[:, column] = pv + (pv * Boss.PV_BONUS).astype(np.int32)
+        self.damage[:, column] = self.damage[:, HERO]
+        self.speed[:, column] = rng.integers(1, 21, self.batch)
+        self.add_weapon(np.ones(self.batch, dtype=bool), column, self.damage[:, column] + 15)  # Legendary Axe
+        self.is_boss[column] = True
+
+
+def classic_battles(batch, rng, hero_exp=0):
+    """B combats du Mode Classique : un héros contre un ennemi"""
+    arrays = BattleArrays(batch, 2)
+    arrays.set_hero(rng, hero_exp)
+    arrays.set_enemy(rng, 1, hero_exp)
+    random_weapon = rng.random(batch) > 0.5
+    arrays.add_weapon(random_weapon, 1, rng.integers(20, 31, batch)[random_weapon])
+    return arrays
+
+
+def boss_battles(batch, rng, hero_exp=0):
+    """B combats de fin d'exploration : le boss et deux ennemis faibles"""
+    arrays = BattleArrays(batch, 4, max_weapons=1)
+    arrays.set_hero(rng, hero_exp)
+    arrays.set_boss(rng, 1)
+    arrays.set_enemy(rng, 2, hero_exp)
+    arrays.set_enemy(rng, 3, hero_exp)
+    return arrays
+
+
+class VectorizedEngine:
+    """Résout tour par tour tous les combats d'un BattleArrays.
+
+    Les combats terminés sont retirés des tableaux à chaque tour : le coût d'un
+    tour ne dépend que du nombre de combats encore en cours.
+    """
+    def __init__(self, arrays, rng, heal_threshold=0.35):
+        self.arrays = arrays
+        self.rng = rng
+        self.heal_threshold = heal_threshold
+        # Ordre de jeu par vitesse décroissante, le tri stable garde le héros devant en cas d'égalité
+        self.order = np.argsort(-arrays.speed, axis=1, kind="stable")
+        # L'inventaire du héros ne change pas pendant un combat, sa meilleure arme est calculée une fois
+        self.hero_weapon = arrays.weapon_damage[:, HERO].max(axis=1)
+        batch = arrays.batch
+        self.ids = np.arange(batch)  # indice d'origine de chaque combat encore en cours
+        self.turns = np.zeros(batch, dtype=np.int32)
+        self.outcome = np.zeros(batch, dtype=np.int32)  # 1 victoire, -1 défaite, 0 match nul
+        self.hero_ratio = np.zeros(batch)
+
+    def enemies_alive(self):
+        # Colonne par colonne : bien plus rapide que (pv[:, 1:] > 0).any(axis=1) sur peu de colonnes
+        pv = self.arrays.pv
+        alive = pv[:, 1] > 0
+        for column in range(2, pv.shape[1]):
+            alive |= pv[:, column] > 0
+        return alive
+
+    def ongoing(self):
+        return (self.arrays.pv[:, HERO] > 0) & self.enemies_alive()
+
+    def roll(self, base):
+        """Équivalent vectorisé de Character.randomize"""
+        low = (base * 0.9).astype(np.int32)
+        high = (base * 1.1).astype(np.int32)
+        # Tirage uniforme entier dans [low, high] (rng.integers avec bornes tableau est bien plus lent)
+        return low + (self.rng.random(len(base)) * (high - low + 1)).astype(np.int32)
+
+    # Les tableaux 2D sont manipulés à plat (cellule = combat * taille + colonne) :
+    # take() sur un index plat est bien plus rapide que l'indexation [rows, columns].
+    def hit(self, cells, damage):
+        """Équivalent vectorisé de Character.take_damage (PV bornés à 0)"""
+        pv = self.arrays.pv.ravel()
+        pv[cells] = np.maximum(pv.take(cells) - damage, 0)
+
+    def heal(self, cells, amount):
+        pv = self.arrays.pv.ravel()
+        pv[cells] = np.minimum(pv.take(cells) + amount, self.arrays.max_pv.ravel().take(cells))
+
+    def weakest_enemy(self, rows):
+        """Colonne de l'ennemi vivant avec le moins de PV (le premier en cas d'égalité, comme min())"""
+        pv = self.arrays.pv
+        targets = np.ones(len(rows), dtype=np.int64)
+        if pv.shape[1] == 2:
+            return targets
+        weakest = pv[:, 1].take(rows)
+        weakest[weakest <= 0] = np.iinfo(np.int32).max
+        for column in range(2, pv.shape[1]):
+            candidate = pv[:, column].take(rows)
+            better = (candidate > 0) & (candidate < weakest)
+            targets[better] = column
+            weakest[better] = candidate[better]
+        return targets
+
+    def hero_turn(self, rows):
+        a = self.arrays
+        size = a.pv.shape[1]
+        pv = a.pv.ravel()
+        cells = rows * size + HERO
+        low = pv.take(cells) <= a.max_pv.ravel().take(cells) * self.heal_threshold
+        self.heal(cells[low], Hero.HEAL)
+
+        rows, cells = rows[~low], cells[~low]
+        target_cells = rows * size + self.weakest_enemy(rows)
+        self.hit(target_cells, self.roll(a.damage.ravel().take(cells) + self.hero_weapon.take(rows)))
+
+        killed = rows[pv.take(target_cells) <= 0]
+        before = np.searchsorted(XP_THRESHOLDS, a.exp.take(killed), side="right")
+        a.exp[killed] += XP_PER_KILL
+        levels = np.searchsorted(XP_THRESHOLDS, a.exp.take(killed), side="right") - before
+        leveled = levels > 0
+        a.damage.ravel()[killed[leveled] * size + HERO] += 5 * levels[leveled]
+
+    def enemy_turn(self, rows, columns):
+        a = self.arrays
+        size = a.pv.shape[1]
+        cells = rows * size + columns
+        boss = a.is_boss.take(columns)
+        attack = self.rng.random(len(rows)) < np.where(boss, 0.8, 0.5)
+        self.heal(cells[~attack], np.where(boss[~attack], Boss.HEAL, Enemy.HEAL))
+
+        rows, cells, boss = rows[attack], cells[attack], boss[attack]
+        # Arme tirée uniformément parmi l'inventaire + mains nues
+        num_weapons = a.num_weapons.ravel().take(cells)
+        slot = (self.rng.random(len(rows)) * (num_weapons + 1)).astype(np.int32)
+        max_weapons = a.weapon_damage.shape[2]
+        weapon = a.weapon_damage.ravel().take(cells * max_weapons + np.minimum(slot, max_weapons - 1))
+        base = a.damage.ravel().take(cells) + np.where(slot < num_weapons, weapon, 0)
+        hero_cells = rows * size + HERO
+        self.hit(hero_cells, self.roll(base))
+
+        double = boss & (self.rng.random(len(rows)) > 0.7)
+        self.hit(hero_cells[double], self.roll(base[double]))
+
+    def step(self, ongoing):
+        """Joue un tour complet pour les combats encore en cours"""
+        a = self.arrays
+        self.turns[self.ids[ongoing]] += 1
+        size = a.pv.shape[1]
+        row_cells = np.arange(a.batch) * size
+        for position in range(size):
+            actors = self.order[:, position]
+            acting = (a.pv.ravel().take(row_cells + actors) > 0) & self.ongoing()
+            hero = acting & (actors == HERO)
+            enemy = acting & (actors != HERO)
+            self.hero_turn(np.nonzero(hero)[0])
+            self.enemy_turn(np.nonzero(enemy)[0], actors[enemy])
+
+    def settle(self, finished):
+        """Enregistre l'issue des combats `finished` puis les retire des tableaux"""
+        a = self.arrays
+        done = np.nonzero(finished)[0]
+        ids = self.ids.take(done)
+        won = ~self.enemies_alive().take(done)
+        hero_pv = a.pv[:, HERO].take(done)
+        self.outcome[ids] = np.where(won, 1, np.where(hero_pv <= 0, -1, 0))
+        self.hero_ratio[ids] = hero_pv / a.max_pv[:, HERO].take(done)
+
+        keep = np.nonzero(~finished)[0]
+        for name in ("pv", "max_pv", "damage", "speed", "weapon_damage", "num_weapons", "exp"):
+            setattr(a, name, getattr(a, name).take(keep, axis=0))
+        self.order = self.order.take(keep, axis=0)
+        self.hero_weapon = self.hero_weapon.take(keep)
+        self.ids = self.ids.take(keep)
+
+    def run(self, max_turns=MAX_TURNS):
+        for _ in range(max_turns):
+            ongoing = self.ongoing()
+            finished = ~ongoing
+            # Les combats terminés restent inertes, on ne compacte que lorsqu'ils pèsent assez
+            if finished.sum() * 4 >= len(finished):
+                self.settle(finished)
+                ongoing = ongoing[ongoing]
+            if not ongoing.any():
+                break
+            self.step(ongoing)
+        if len(self.ids):
+            self.settle(np.ones(len(self.ids), dtype=bool))  # Combats terminés ou arrêtés à max_turns
+        return self
+
+    def report(self):
+        """Agrège les résultats dans le même format que simulation.run_simulation"""
+        report = SimulationReport()
+        report.battles = len(self.outcome)
+        report.wins = int((self.outcome == 1).sum())
+        report.losses = int((self.outcome == -1).sum())
+        report.draws = int((self.outcome == 0).sum())
+        turns, counts = np.unique(self.turns, return_counts=True)
+        report.turns.update(dict(zip(turns.tolist(), counts.tolist())))
+        ratio = self.hero_ratio[self.outcome == 1]
+        buckets, counts = np.unique((ratio * 100).astype(np.int32) // HP_BUCKET * HP_BUCKET, return_counts=True)
+        report.hp_remaining.update(dict(zip(buckets.tolist(), counts.tolist())))
+        return report
+
+
+def run_vectorized(batch, seed=0, hero_exp=0, boss=False, max_turns=MAX_TURNS, heal_threshold=0.35):
+    """Joue `batch` combats vectorisés et renvoie un SimulationReport"""
+    rng = np.random.default_rng(seed)
+    arrays = (boss_battles if boss else classic_battles)(batch, rng, hero_exp)
+    return VectorizedEngine(arrays, rng, heal_threshold).run(max_turns).report()